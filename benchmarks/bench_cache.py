@@ -0,0 +1,60 @@
+"""
+Measure the repeated finds of the same expressions in the same data,
+with and without the result cache.
+
+Usage: python -m benchmarks.bench_cache
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import Document, ResultCache, parse
+
+CATALOG = {
+    "products": [
+        {
+            "sku": f"sku-{i}",
+            "price": i % 100,
+            "tags": ["a", "b"] if i % 2 else ["c"],
+            "stock": {"warehouse": f"w{i % 5}", "count": i % 7},
+        }
+        for i in range(2000)
+    ],
+    "meta": {"version": 3, "currency": "USD"},
+}
+
+EXPRESSIONS = [
+    "$.meta.currency",
+    "$.products[@.price > 95].sku",
+    "$..warehouse",
+]
+
+NUMBER = 1000
+
+
+def main() -> None:
+    document = Document(CATALOG)
+    cache = ResultCache()
+    print(f"{'expression':<32} {'find':>11} {'cached':>11}")
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        assert cache.find(expr, document) == tuple(expr.find(CATALOG))
+        timings = [
+            min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+            for func in (
+                lambda: expr.find(CATALOG),
+                lambda: cache.find(expr, document),
+            )
+        ]
+        print(
+            f"{expression:<32}"
+            + "".join(f" {timing * 1e6:>9.2f}us" for timing in timings)
+        )
+
+    info = cache.info()
+    print(f"hits {info.hits}, misses {info.misses}, hit rate {info.hit_rate:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Measure the cost per found element of the iterable and the collecting finding
+as the chained expression grows longer,
+it stays flat since the elements are yielded or collected directly
+instead of passing through every part.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_chain [CHECKOUT ...]
+"""
+
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from pathlib import Path
+
+LENGTHS = [1, 5, 10, 20, 40, 80]
+ITEMS = 100000
+METHODS = ["find_iter", "find"]
+
+
+def make_data(length: int) -> dict:
+    data: dict = {"a": list(range(ITEMS))}
+    for _ in range(length - 1):
+        data = {"a": data}
+
+    return data
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import parse
+
+    timings = {"__file__": parse.__code__.co_filename}
+    for length in LENGTHS:
+        data = make_data(length)
+        expr = parse("$" + ".a" * length + "[*]", cached=False)
+        funcs = {
+            "find_iter": lambda: list(expr.find_iter(data)),
+            "find": lambda: expr.find(data),
+        }
+        for method in METHODS:
+            func = funcs[method]
+            assert len(func()) == ITEMS
+            timing = min(timeit.repeat(func, number=1, repeat=5))
+            timings[f"{method} {length}"] = timing / ITEMS
+
+    json.dump(timings, sys.stdout)
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    print("per found element")
+    print(
+        f"{'method':<10} {'length':<8}"
+        + "".join(f" {idx:>9}" for idx in range(len(results)))
+    )
+    for method in METHODS:
+        for length in LENGTHS:
+            key = f"{method} {length}"
+            print(
+                f"{method:<10} {length:<8}"
+                + "".join(f" {rv[key] * 1e9:>7.1f}ns" for rv in results)
+            )
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compare the throughput of the compiled expressions with the interpreter.
+
+Usage: python -m benchmarks.bench_compile
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import parse
+
+DATA = {
+    "threshold": 500,
+    "goods": [
+        {
+            "price": i % 1000,
+            "category": "book" if i % 3 else "magazine",
+            "tags": ["x", "y"] if i % 2 else [],
+        }
+        for i in range(10000)
+    ],
+}
+
+EXPRESSIONS = [
+    "$.goods[0].price",
+    "$.goods[*].price",
+    "$.goods[@.price > 500]",
+    "$.goods[@.price > $.threshold]",
+    '$.goods[@.price >= 10 and @.price < 20 and @.category = "book"]',
+    '$.goods[contains(@.category, "book")].price',
+    "$..price",
+]
+
+
+def main() -> None:
+    print(f"{'expression':<68} {'interpreter':>12} {'compiled':>12} {'speedup':>8}")
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        compiled = expr.compile()
+        assert compiled.find(DATA) == expr.find(DATA)
+
+        number = 5
+        interpreted = min(timeit.repeat(lambda: expr.find(DATA), number=number))
+        compiled_ = min(timeit.repeat(lambda: compiled.find(DATA), number=number))
+        print(
+            f"{expression:<68} {interpreted / number * 1e3:>10.3f}ms"
+            f" {compiled_ / number * 1e3:>10.3f}ms"
+            f" {interpreted / compiled_:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
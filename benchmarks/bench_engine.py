@@ -0,0 +1,83 @@
+"""
+Measure the filter-heavy expressions,
+which spend most of the time on evaluating the predicates.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_engine [CHECKOUT ...]
+"""
+
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from pathlib import Path
+
+DATA = {
+    "threshold": 500,
+    "items": [
+        {"price": i % 1000, "name": f"item {i}", "tags": ["a", "b", str(i % 7)]}
+        for i in range(20000)
+    ],
+    "tree": {f"k{i}": {"a": [{"v": j} for j in range(10)]} for i in range(500)},
+}
+
+EXPRESSIONS = [
+    "$.items[@.price > 500].name",
+    "$.items[@.price > $.threshold and @.price < 900]",
+    '$.items[contains(@.tags, "3")].price',
+    "$.items[not(@.price)]",
+    "$.items[*].tags[1:]",
+    "$..[@.v > 5].v",
+]
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import parse
+
+    timings = {"__file__": parse.__code__.co_filename}
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        timings[expression] = min(
+            timeit.repeat(lambda: expr.find(DATA), number=1, repeat=5)
+        )
+
+    json.dump(timings, sys.stdout)
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    print(f"{'expression':<52}" + "".join(f" {idx:>9}" for idx in range(len(results))))
+    for expression in EXPRESSIONS:
+        print(
+            f"{expression:<52}"
+            + "".join(f" {rv[expression] * 1e3:>7.1f}ms" for rv in results)
+        )
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measure the descendant searches of the field names in a large data,
+with and without the index of the data, and the time to build the index.
+
+Usage: python -m benchmarks.bench_index
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import DocumentIndex, parse
+
+DATA = {
+    "orders": [
+        {
+            "id": i,
+            "customer": {"name": f"customer {i}", "address": {"city": f"city {i}"}},
+            "lines": [
+                {"sku": f"sku-{i}-{j}", "qty": j, "meta": {"tags": ["a", "b"]}}
+                for j in range(5)
+            ],
+        }
+        for i in range(5000)
+    ],
+    "summary": {"sku": "total"},
+}
+
+EXPRESSIONS = [
+    "$..sku",
+    "$..city",
+    "$.summary..sku",
+    "$.orders[10]..sku",
+    '$.orders[@..city = "city 10"].id',
+]
+
+
+def main() -> None:
+    build = min(timeit.repeat(lambda: DocumentIndex(DATA), number=1, repeat=3))
+    print(f"{'build the index':<36} {build * 1e3:>7.1f}ms")
+    index = DocumentIndex(DATA)
+    print(f"{'expression':<36} {'walk':>9} {'index':>9}")
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        assert expr.find(DATA, index=index) == expr.find(DATA)
+        walk, indexed = (
+            min(timeit.repeat(lambda: expr.find(DATA, index=idx), number=1, repeat=5))
+            for idx in (None, index)
+        )
+        print(f"{expression:<36} {walk * 1e3:>7.1f}ms {indexed * 1e3:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare the memory held by the similar parsed expressions
+with and without interning them.
+
+Usage: python -m benchmarks.bench_intern
+"""
+
+# Standard Library
+import gc
+import tracemalloc
+
+from typing import Callable, List
+
+# First Party Library
+from jsonpath import Expr, ExprInterner, parse
+
+COUNT = 10000
+
+EXPRESSIONS = [
+    "$.items[@.price > $.limits.price and @.tags[*] = $.tag].name{n}",
+    '$.users[@.role = "admin" and @.age > {n}].name',
+    '$..book[contains(@.title, "{n}")][0:10]',
+]
+
+
+def measure(load: Callable[[str], Expr], expression: str) -> float:
+    sources = [expression.format(n=n) for n in range(COUNT)]
+    gc.collect()
+    tracemalloc.start()
+    exprs: List[Expr] = [load(source) for source in sources]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(exprs) == COUNT
+    return size / COUNT
+
+
+def main() -> None:
+    print(f"{'expression':<68} {'parsed':>8} {'interned':>8}")
+    for expression in EXPRESSIONS:
+        interner = ExprInterner()
+        sizes = [
+            measure(lambda source: parse(source, cached=False), expression),
+            measure(
+                lambda source: interner.intern(parse(source, cached=False)),
+                expression,
+            ),
+        ]
+        print(f"{expression:<68}" + "".join(f" {size:>7.0f}B" for size in sizes))
+
+
+if __name__ == "__main__":
+    main()
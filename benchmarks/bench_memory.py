@@ -0,0 +1,107 @@
+"""
+Measure the memory held by the parsed expressions,
+and the time of the garbage collection traversing them.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_memory [CHECKOUT ...]
+"""
+
+# Standard Library
+import gc
+import json
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+from pathlib import Path
+
+COUNT = 10000
+
+EXPRESSIONS = [
+    "$.a.b.c",
+    "$.items[@.price > {n} and @.tags[*] = $.tag].name",
+    '$..book[contains(@.title, "{n}")][0:10]',
+    "$.data[$.start:$.stop:{n}]",
+]
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import Expr, parse
+
+    rv = {"__file__": parse.__code__.co_filename}
+    for expression in EXPRESSIONS:
+        sources = [expression.format(n=n) for n in range(COUNT)]
+        gc.collect()
+        tracemalloc.start()
+        exprs = [parse(source, cached=False) for source in sources]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        nodes = 0
+        stack: list = list(exprs)
+        while stack:
+            node = stack.pop()
+            nodes += 1
+            stack.extend(arg for arg in vars_of(node) if isinstance(arg, Expr))
+            if node.left is not None:
+                stack.append(node.left)
+
+        rv[expression] = {
+            "node": size / nodes,
+            "expr": size / COUNT,
+            "gc": min(timeit.repeat(gc.collect, number=1, repeat=5)),
+        }
+        del exprs
+
+    json.dump(rv, sys.stdout)
+
+
+def vars_of(node: object) -> list:
+    # the args of the nodes, no matter they have the __dict__ or the __slots__
+    return list(node._init_args())  # type: ignore
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    columns = "".join(
+        f" {f'node#{idx}':>8} {f'expr#{idx}':>8} {f'gc#{idx}':>8}"
+        for idx in range(len(results))
+    )
+    print(f"{'expression':<48}{columns}")
+    for expression in EXPRESSIONS:
+        print(
+            f"{expression:<48}"
+            + "".join(
+                f" {rv[expression]['node']:>7.0f}B {rv[expression]['expr']:>7.0f}B"
+                f" {rv[expression]['gc'] * 1e3:>6.1f}ms"
+                for rv in results
+            )
+        )
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
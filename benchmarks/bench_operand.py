@@ -0,0 +1,47 @@
+"""
+Compare the cost of the root-based operands in the predicate
+with the constant ones, the former is found once per finding.
+
+Usage: python -m benchmarks.bench_operand
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import parse
+
+DATA = {
+    "threshold": 500,
+    "limits": {"price": {"min": 500}},
+    "start": 10,
+    "stop": 20,
+    "items": [{"price": i % 1000, "tags": list(range(30))} for i in range(100000)],
+}
+
+EXPRESSIONS = [
+    ("$.items[@.price > 500]", "$.items[@.price > $.threshold]"),
+    ("$.items[@.price > 500]", "$.items[@.price > $.limits.price.min]"),
+    ("$.items[*].tags[10:20]", "$.items[*].tags[$.start:$.stop]"),
+]
+
+
+def main() -> None:
+    print(f"{'expression':<48} {'constant':>10} {'root-based':>10}")
+    for constant, root_based in EXPRESSIONS:
+        expr = parse(constant)
+        root_expr = parse(root_based)
+        assert expr.find(DATA) == root_expr.find(DATA)
+
+        timings = [
+            min(timeit.repeat(lambda: e.find(DATA), number=1, repeat=3))
+            for e in (expr, root_expr)
+        ]
+        print(
+            f"{root_based:<48}"
+            + "".join(f" {timing * 1e3:>8.1f}ms" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
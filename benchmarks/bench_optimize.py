@@ -0,0 +1,53 @@
+"""
+Compare the throughput of the optimized expressions with the parsed ones.
+
+Usage: python -m benchmarks.bench_optimize
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import parse
+
+DATA = {
+    "store": {
+        "goods": [
+            {
+                "price": i % 1000,
+                "info": {"category": "book" if i % 3 else "magazine"},
+                "enabled": bool(i % 2),
+            }
+            for i in range(10000)
+        ]
+    },
+}
+
+EXPRESSIONS = [
+    "$.store.goods[*].info.category",
+    "$.store.goods[@.info.category = 'book']",
+    "($.store.goods[@.price < 800])[@.price >= 200]",
+    "$.store.goods[not(not(enabled))]",
+    "$.store.goods[@.price > 500 and 1 < 2]",
+]
+
+
+def main() -> None:
+    print(f"{'expression':<50} {'parsed':>10} {'optimized':>10} {'speedup':>8}")
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        optimized = parse(expression, optimize=True)
+        assert optimized.find(DATA) == expr.find(DATA)
+
+        number = 5
+        parsed_ = min(timeit.repeat(lambda: expr.find(DATA), number=number))
+        optimized_ = min(timeit.repeat(lambda: optimized.find(DATA), number=number))
+        print(
+            f"{expression:<50} {parsed_ / number * 1e3:>8.2f}ms"
+            f" {optimized_ / number * 1e3:>8.2f}ms"
+            f" {parsed_ / optimized_:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
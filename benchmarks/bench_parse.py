@@ -0,0 +1,48 @@
+"""
+Compare the parsing throughput of the native parser with the Lark parser.
+
+Usage: python -m benchmarks.bench_parse
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath.parser import parse
+
+EXPRESSIONS = [
+    "$.a.b[0]",
+    "$.goods[*].price",
+    "$..price",
+    "$.goods[@.price > 500]",
+    '$.goods[@.price >= 10 and @.price < 20 and @.category = "book"]',
+    '$[contains(key(), "book") or not(@.disabled)].name',
+    "$.data[$.start:$.stop:$.step]",
+]
+
+
+def main() -> None:
+    print(f"{'expression':<68} {'lark':>10} {'native':>10} {'speedup':>8}")
+    for expression in EXPRESSIONS:
+        number = 200
+        lark = min(
+            timeit.repeat(
+                lambda: parse(expression, cached=False, backend="lark"),
+                number=number,
+            )
+        )
+        native = min(
+            timeit.repeat(
+                lambda: parse(expression, cached=False, backend="native"),
+                number=number,
+            )
+        )
+        print(
+            f"{expression:<68} {lark / number * 1e6:>8.1f}us"
+            f" {native / number * 1e6:>8.1f}us"
+            f" {lark / native:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure finding with and without the paths of the target data,
+the plain finding should not be slower than before the paths were tracked.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_paths [CHECKOUT ...]
+"""
+
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from pathlib import Path
+
+DATA = {
+    "store": {
+        "books": [
+            {
+                "title": f"book {i}",
+                "price": i % 50,
+                "tags": ["a", "b", "c"],
+                "meta": {"isbn": str(i), "pages": i * 3},
+            }
+            for i in range(10000)
+        ],
+    },
+}
+
+EXPRESSIONS = [
+    "$.store.books[*].title",
+    "$.store.books[@.price > 25].meta.isbn",
+    "$.store.books[10:9000:3].tags[*]",
+    "$..isbn",
+]
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import parse
+
+    timings = {"__file__": parse.__code__.co_filename}
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        timings[expression] = min(
+            timeit.repeat(lambda: expr.find(DATA), number=1, repeat=5)
+        )
+        if hasattr(expr, "find_with_paths"):
+            timings[f"{expression} paths"] = min(
+                timeit.repeat(lambda: expr.find_with_paths(DATA), number=1, repeat=5)
+            )
+
+    json.dump(timings, sys.stdout)
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def _format(timing: float) -> str:
+    if timing is None:
+        return f" {'-':>9}"
+
+    return f" {timing * 1e3:>7.1f}ms"
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    print(
+        f"{'expression':<40}"
+        + "".join(
+            f" {f'{idx} find':>9} {f'{idx} paths':>9}" for idx in range(len(results))
+        )
+    )
+    for expression in EXPRESSIONS:
+        print(
+            f"{expression:<40}"
+            + "".join(
+                _format(rv[expression]) + _format(rv.get(f"{expression} paths"))
+                for rv in results
+            )
+        )
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
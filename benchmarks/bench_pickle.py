@@ -0,0 +1,52 @@
+"""
+Compare the cost of loading the pickled expressions with parsing them.
+
+Usage: python -m benchmarks.bench_pickle
+"""
+
+# Standard Library
+import copy
+import pickle
+import timeit
+
+# First Party Library
+from jsonpath.parser import parse
+
+EXPRESSIONS = [
+    "$.a.b[0]",
+    "$..price",
+    "$.goods[@.price > 500]",
+    '$.goods[@.price >= 10 and @.price < 20 and @.category = "book"]',
+    '$[contains(key(), "book") or not(@.disabled)].name',
+    "$.data[$.start:$.stop:$.step]",
+]
+
+
+def main() -> None:
+    print(
+        f"{'expression':<66} {'size':>5} {'lark':>9} {'native':>9}"
+        f" {'loads':>9} {'deepcopy':>9}"
+    )
+    for expression in EXPRESSIONS:
+        expr = parse(expression, cached=False)
+        data = pickle.dumps(expr, protocol=pickle.HIGHEST_PROTOCOL)
+        assert pickle.loads(data).get_expression() == expr.get_expression()
+
+        number = 500
+        timings = [
+            min(timeit.repeat(func, number=number)) / number * 1e6
+            for func in (
+                lambda: parse(expression, cached=False, backend="lark"),
+                lambda: parse(expression, cached=False, backend="native"),
+                lambda: pickle.loads(data),
+                lambda: copy.deepcopy(expr),
+            )
+        ]
+        print(
+            f"{expression:<66} {len(data):>5}"
+            + "".join(f" {timing:>7.1f}us" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measure the descendant search on a large document,
+finding the first target stops walking the rest of the document.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_search [CHECKOUT ...]
+"""
+
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from pathlib import Path
+
+DATA = {
+    "id": 0,
+    "orders": [
+        {
+            "id": idx,
+            "customer": {"id": idx % 100, "name": f"customer {idx % 100}"},
+            "lines": [{"sku": f"sku-{n}", "qty": n} for n in range(10)],
+        }
+        for idx in range(20000)
+    ],
+}
+
+SCENARIOS = [
+    ("$..id", "find"),
+    ("$..id", "find_first"),
+    ("$..[@.qty > 8].sku", "find"),
+    ("$..[@.qty > 8].sku", "find_first"),
+]
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import parse
+
+    timings = {"__file__": parse.__code__.co_filename}
+    for expression, method in SCENARIOS:
+        func = getattr(parse(expression), method)
+        timings[f"{expression} {method}"] = min(
+            timeit.repeat(lambda: func(DATA), number=1, repeat=5)
+        )
+
+    json.dump(timings, sys.stdout)
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    print(f"{'scenario':<32}" + "".join(f" {idx:>9}" for idx in range(len(results))))
+    for expression, method in SCENARIOS:
+        key = f"{expression} {method}"
+        print(f"{key:<32}" + "".join(f" {rv[key] * 1e3:>7.1f}ms" for rv in results))
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measure the expressions on the sparse document,
+where most of the lookups find nothing.
+
+Pass the paths of other checkouts to compare with their implementations,
+e.g., a worktree of the previous release.
+
+Usage: python -m benchmarks.bench_sparse [CHECKOUT ...]
+"""
+
+# Standard Library
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+from pathlib import Path
+
+DATA = {
+    "items": [
+        # only one in ten items has the optional fields
+        {"id": i, "meta": {"tag": f"t{i}", "ref": [i]}} if i % 10 == 0 else {"id": i}
+        for i in range(50000)
+    ],
+}
+
+EXPRESSIONS = [
+    "$.items[*].meta.tag",
+    "$.items[*].meta.ref[0]",
+    "$.items[*].id.meta",
+    '$.items[@.meta.tag = "t10"].id',
+    "$.items[@.meta and @.id > 100].id",
+    "$..tag",
+]
+
+
+def measure() -> None:
+    # First Party Library
+    from jsonpath import parse
+
+    timings = {"__file__": parse.__code__.co_filename}
+    for expression in EXPRESSIONS:
+        expr = parse(expression)
+        timings[expression] = min(
+            timeit.repeat(lambda: expr.find(DATA), number=1, repeat=5)
+        )
+
+    json.dump(timings, sys.stdout)
+
+
+def run(checkout: Path) -> dict:
+    proc = subprocess.run(
+        # runs as a script, so the jsonpath package is imported from the checkout
+        [sys.executable, __file__, "--measure"],
+        env={**os.environ, "PYTHONPATH": str(checkout)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def main() -> None:
+    if sys.argv[1:] == ["--measure"]:
+        measure()
+        return
+
+    checkouts = [Path.cwd(), *map(Path, sys.argv[1:])]
+    results = [run(checkout.resolve()) for checkout in checkouts]
+    print(f"{'expression':<52}" + "".join(f" {idx:>9}" for idx in range(len(results))))
+    for expression in EXPRESSIONS:
+        print(
+            f"{expression:<52}"
+            + "".join(f" {rv[expression] * 1e3:>7.1f}ms" for rv in results)
+        )
+    for idx, rv in enumerate(results):
+        print(f"{idx}: {rv['__file__']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Measure the time to the first parsed expression in a fresh interpreter,
+with the Lark parser built from the grammar or from the precomputed tables.
+
+Usage: python -m benchmarks.bench_startup
+"""
+
+# Standard Library
+import os
+import subprocess
+import sys
+import time
+
+CODE = "import jsonpath; jsonpath.parse('$.goods[@.price > 500].name')"
+# pretends the tables file is missing
+NO_TABLES = "import jsonpath.tables as t; t.load_lark_tables = lambda *_: None;"
+SCENARIOS = {
+    "import only": ("import jsonpath", "lark"),
+    "lark, grammar": (NO_TABLES + CODE, "lark"),
+    "lark, tables": (CODE, "lark"),
+    "native": (CODE, "native"),
+}
+
+
+def run(code: str, backend: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code],
+        env={**os.environ, "JSONPATH_PARSER": backend},
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    # warm up the bytecode caches
+    for args in SCENARIOS.values():
+        run(*args)
+
+    print(f"{'scenario':<16} {'time':>9}")
+    for name, args in SCENARIOS.items():
+        timing = min(run(*args) for _ in range(10)) * 1e3
+        print(f"{name:<16} {timing:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure the redaction of a large payload,
+by the paths of the matches and by changing the matches in place.
+
+Usage: python -m benchmarks.bench_update
+"""
+
+# Standard Library
+import copy
+import timeit
+
+from typing import Any, Callable, Dict
+
+# First Party Library
+from jsonpath import parse
+
+DATA = {
+    "users": [
+        {
+            "name": f"user {i}",
+            "password": str(i),
+            "sessions": [{"token": f"{i}-{j}", "ip": "127.0.0.1"} for j in range(5)],
+        }
+        for i in range(5000)
+    ],
+}
+
+
+def redact_by_paths(data: Any) -> None:
+    for path, _ in parse("$..token").find_with_paths(data):
+        container = data
+        for key in path[:-1]:
+            container = container[key]
+        container[path[-1]] = "***"
+
+
+def redact(data: Any) -> None:
+    parse("$..token").update(data, "***")
+
+
+def delete_by_paths(data: Any) -> None:
+    paths = [path for path, _ in parse("$.users[*].sessions[1:]").find_with_paths(data)]
+    for path in reversed(paths):
+        container = data
+        for key in path[:-1]:
+            container = container[key]
+        del container[path[-1]]
+
+
+def delete(data: Any) -> None:
+    parse("$.users[*].sessions[1:]").delete(data)
+
+
+def measure(func: Callable[[Any], None]) -> float:
+    timings = []
+    for _ in range(5):
+        data = copy.deepcopy(DATA)
+        timings.append(timeit.timeit(lambda: func(data), number=1))
+
+    return min(timings)
+
+
+def main() -> None:
+    funcs: Dict[str, Callable[[Any], None]] = {
+        "redact by paths": redact_by_paths,
+        "redact in place": redact,
+        "delete by paths": delete_by_paths,
+        "delete in place": delete,
+    }
+    for name, func in funcs.items():
+        print(f"{name:<20} {measure(func) * 1e3:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare the updated copies of a large payload,
+by deep copying then updating it and by the copy-on-write update.
+
+Usage: python -m benchmarks.bench_updated
+"""
+
+# Standard Library
+import copy
+import gc
+import time
+import tracemalloc
+
+from typing import Any, Callable, Tuple
+
+# First Party Library
+from jsonpath import parse
+
+DATA = {
+    "meta": {"version": 1},
+    "users": [
+        {
+            "id": i,
+            "name": f"user {i}",
+            "password": str(i),
+            "sessions": [{"token": f"{i}-{j}", "ip": "127.0.0.1"} for j in range(5)],
+        }
+        for i in range(10000)
+    ],
+}
+
+EXPRESSIONS = [
+    "$.meta.version",
+    "$.users[@.id = 5000].name",
+    "$.users[*].password",
+    "$..token",
+]
+
+
+def deepcopy_update(expression: str) -> Any:
+    return parse(expression).update(copy.deepcopy(DATA), "***")
+
+
+def updated(expression: str) -> Any:
+    return parse(expression).updated(DATA, "***")
+
+
+def measure(func: Callable[[str], Any], expression: str) -> Tuple[float, float]:
+    timings = []
+    for _ in range(3):
+        gc.collect()
+        start = time.perf_counter()
+        func(expression)
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    rv = func(expression)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rv
+    return min(timings), size
+
+
+def main() -> None:
+    print(
+        f"{'expression':<28} {'deepcopy':>9} {'updated':>9}"
+        f" {'deepcopy':>10} {'updated':>10}"
+    )
+    for expression in EXPRESSIONS:
+        (copy_time, copy_size), (cow_time, cow_size) = (
+            measure(deepcopy_update, expression),
+            measure(updated, expression),
+        )
+        print(
+            f"{expression:<28} {copy_time * 1e3:>7.1f}ms {cow_time * 1e3:>7.1f}ms"
+            f" {copy_size / 1e6:>8.2f}MB {cow_size / 1e6:>8.2f}MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
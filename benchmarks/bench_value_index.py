@@ -0,0 +1,62 @@
+"""
+Measure the lookups of the records by the equality predicates,
+by filtering all records and by the value index of the field.
+
+Usage: python -m benchmarks.bench_value_index
+"""
+
+# Standard Library
+import timeit
+
+# First Party Library
+from jsonpath import DocumentIndex, parse
+
+COUNT = 500000
+
+DATA = {
+    "users": [
+        {"id": i, "name": f"user {i}", "profile": {"team": f"team {i % 100}"}}
+        for i in range(COUNT)
+    ],
+}
+
+LOOKUPS = [
+    ("$.users[@.id = 123].name", {}),
+    ("$.users[@.id = $id].name", {"id": COUNT - 1}),
+    ('$.users[@.profile.team = "team 7"].id', {}),
+]
+
+
+def main() -> None:
+    index = DocumentIndex(DATA)
+    build = timeit.timeit(
+        lambda: (
+            index.index_values("$.users", "@.id"),
+            index.index_values("$.users", "@.profile.team"),
+        ),
+        number=1,
+    )
+    print(f"{'build the value indexes':<40} {build * 1e3:>9.1f}ms")
+    print(f"{'expression':<40} {'filter':>11} {'index':>11}")
+    for expression, params in LOOKUPS:
+        expr = parse(expression).bind(**params)
+        assert expr.find(DATA, index=index) == expr.find(DATA)
+        timings = []
+        for planner in (False, True):
+            index.planner = planner
+            timings.append(
+                min(
+                    timeit.repeat(
+                        lambda: expr.find(DATA, index=index), number=1, repeat=3
+                    )
+                )
+            )
+
+        print(
+            f"{expression:<40}"
+            + "".join(f" {timing * 1e3:>9.3f}ms" for timing in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
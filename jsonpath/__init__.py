@@ -5,7 +5,11 @@
 A selector expression for extracting data from JSON.
 """
 
+# Standard Library
+from typing import TYPE_CHECKING, Any
+
 # Local Folder
+from .cache import Document, ResultCache
 from .core import (
     Array,
     Brace,
@@ -13,6 +17,7 @@ from .core import (
     Contains,
     Equal,
     Expr,
+    ExprInterner,
     ExprMeta,
     GreaterEqual,
     GreaterThan,
@@ -23,24 +28,50 @@ from .core import (
     LessEqual,
     LessThan,
     Name,
+    NamePath,
     Not,
     NotEqual,
+    Parameter,
     Root,
     Search,
     Self,
     Slice,
     Value,
+    legacy_find,
 )
-from .parser import parse
+from .index import DocumentIndex
+
+if TYPE_CHECKING:
+    # Local Folder
+    from .parser import parse
+
+
+def __getattr__(name: str) -> Any:
+    # import the parser on first use, it takes quite a while
+    if name == "parse":
+        # Local Folder
+        from .parser import parse
+
+        return parse
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = (
     "Array",
     "Contains",
     "Expr",
+    "ExprInterner",
+    "DocumentIndex",
+    "Document",
+    "ResultCache",
     "Slice",
     "ExprMeta",
+    "legacy_find",
     "Root",
     "Name",
+    "NamePath",
+    "Parameter",
     "parse",
     "Search",
     "Self",
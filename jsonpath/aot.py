@@ -0,0 +1,229 @@
+"""
+==================================================================
+:mod:`aot` -- Compile expressions into Python module ahead of time
+==================================================================
+
+Generate a plain Python module for a catalogue of JSONPath expressions,
+one specialized function per expression.
+The generated module never loads the parser at runtime,
+it imports the helpers from :mod:`jsonpath.runtime` only.
+
+.. code-block:: shell
+
+    python -m jsonpath.aot queries.toml -o compiled_queries.py
+
+The catalogue is a TOML (or JSON) file maps names to expressions,
+the expressions can be placed in the "queries" table too.
+
+.. code-block:: toml
+
+    [queries]
+    book_titles = '$.books[@.category = "book"].title'
+    first_price = "$.books[0].price"
+
+The generated module contains the query objects named by the catalogue,
+and the mapping of them named "QUERIES".
+
+.. code-block:: python
+
+    from compiled_queries import QUERIES, book_titles
+
+    book_titles.find(data)
+    book_titles.get_expression()
+"""
+
+# Standard Library
+import argparse
+import json
+import keyword
+import sys
+
+from pathlib import Path
+from typing import Any, Dict, Mapping
+
+# Local Folder
+from .compiler import PREAMBLE, CodeGenerator
+from .core import JSONPathError
+from .parser import parse
+
+HEADER = '''\
+"""
+Generated by jsonpath.aot, DO NOT EDIT.
+"""
+
+# First Party Library
+from jsonpath.runtime import BoundExpr, JSONPathFindError
+from jsonpath.runtime import get_parameter as _get_parameter
+from jsonpath.runtime import limit_results as _limit
+
+'''
+
+QUERY_CLASS = """\
+class _Query:
+    __slots__ = ("_expression", "_find", "_find_iter")
+
+    def __init__(self, expression, find, find_iter):
+        self._expression = expression
+        self._find = find
+        self._find_iter = find_iter
+
+    def __repr__(self):
+        return f"CompiledJSONPath({self._expression!r})"
+
+    def __call__(self, element):
+        return self._find(element, _MISSING, _MISSING, element)
+
+    def get_expression(self):
+        return self._expression
+
+    def bind(self, **params):
+        return BoundExpr(self, params)
+
+    def find(self, element, *, limit=None, offset=0):
+        if limit is None and not offset:
+            return self._find(element, _MISSING, _MISSING, element)
+
+        rv = self._find_iter(element, _MISSING, _MISSING, element)
+        return list(_limit(rv, limit, offset))
+
+    def find_iter(self, element, *, limit=None, offset=0):
+        rv = self._find_iter(element, _MISSING, _MISSING, element)
+        if limit is None and not offset:
+            return rv
+
+        return _limit(rv, limit, offset)
+
+    def find_first(self, element):
+        for rv in self._find_iter(element, _MISSING, _MISSING, element):
+            return rv
+
+        raise JSONPathFindError("Found nothing")
+
+    def exists(self, element):
+        for _ in self._find_iter(element, _MISSING, _MISSING, element):
+            return True
+
+        return False
+
+    def count(self, element):
+        return sum(1 for _ in self._find_iter(element, _MISSING, _MISSING, element))
+"""
+
+
+def _check_name(name: str) -> None:
+    if (
+        not name.isidentifier()
+        or keyword.iskeyword(name)
+        or name.startswith("_")
+        or name == "QUERIES"
+    ):
+        raise ValueError(f"{name!r} is not a valid query name")
+
+
+def generate_module(queries: Mapping[str, str]) -> str:
+    """
+    Generate the Python module source for the JSONPath expressions.
+
+    :param queries: The mapping of names to JSONPath expressions
+    :type queries: Mapping[str, str]
+
+    :returns: The source code of the module.
+    :rtype: str
+    :raises ~jsonpath.core.JSONPathError: \
+        Transform JSONPath expression error.
+    :raises TypeError: The expression can not be compiled ahead of time.
+    :raises ValueError: The query name is invalid.
+    """
+    generator = CodeGenerator(allow_objects=False)
+    objects = []
+    for name, expression in queries.items():
+        _check_name(name)
+        expr = parse(expression)
+        find, find_iter = generator.query(expr)
+        objects.append(
+            f"{name} = _Query({expr.get_expression()!r}, {find}, {find_iter})"
+        )
+
+    mapping = "".join(f"    {name!r}: {name},\n" for name in queries)
+    return (
+        f"{HEADER}{PREAMBLE}\n\n{QUERY_CLASS}\n\n{generator.source()}\n\n"
+        + "\n".join(objects)
+        + f"\n\nQUERIES = {{\n{mapping}}}\n"
+    )
+
+
+def load_queries(path: Path) -> Dict[str, str]:
+    """
+    Load the catalogue of JSONPath expressions from the TOML or JSON file.
+
+    :param path: The path of the catalogue file
+    :type path: :class:`pathlib.Path`
+
+    :returns: The mapping of names to JSONPath expressions.
+    :rtype: Dict[str, str]
+    """
+    data: Any
+    if path.suffix == ".json":
+        with path.open() as f:
+            data = json.load(f)
+    else:
+        try:
+            # Standard Library
+            import tomllib
+        except ImportError:  # pragma: no cover
+            try:
+                # Third Party Library
+                import tomli as tomllib  # type: ignore
+            except ImportError:
+                raise ValueError(
+                    "The TOML catalogue requires Python 3.11+ or tomli, "
+                    "use the JSON one instead"
+                ) from None
+
+        with path.open("rb") as f:
+            data = tomllib.load(f)
+
+    if isinstance(data.get("queries"), dict):
+        data = data["queries"]
+
+    for name, expression in data.items():
+        if not isinstance(expression, str):
+            raise ValueError(f"The expression of {name!r} must be a string")
+
+    return data
+
+
+def cli(args: argparse.Namespace) -> None:
+    try:
+        queries = load_queries(Path(args.catalogue))
+        source = generate_module(queries)
+    except (OSError, ValueError, TypeError, JSONPathError) as exc:
+        raise SystemExit(f"Error compiling {args.catalogue}: {exc}") from exc
+
+    if args.output:
+        Path(args.output).write_text(source)
+    else:
+        sys.stdout.write(source)
+
+
+def create_args_parser() -> argparse.ArgumentParser:
+    args_parser = argparse.ArgumentParser(prog="python -m jsonpath.aot")
+    args_parser.add_argument(
+        "catalogue", help="TOML or JSON file maps names to JSONPath expressions"
+    )
+    args_parser.add_argument(
+        "-o",
+        "--output",
+        help="Python file the generated module is written to, defaults to stdout",
+    )
+    return args_parser
+
+
+def main() -> None:
+    args_parser = create_args_parser()
+    args = args_parser.parse_args()
+    cli(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+==============================================
+:mod:`cache` -- Cache the results of the finds
+==============================================
+
+Cache the results of the same expressions
+repeatedly found in the same data, e.g., the configuration.
+
+The data is wrapped in a :class:`Document` handle,
+the results are cached by the identities of the expression and the handle,
+and the version of the handle.
+Invalidate the handle after changing its data in place,
+the cached results of it become stale.
+
+>>> from jsonpath.parser import parse
+>>> document = Document({"a": [1, 2]})
+>>> cache = ResultCache()
+>>> expr = parse("$.a[*]")
+>>> cache.find(expr, document)
+(1, 2)
+>>> cache.find(expr, document)
+(1, 2)
+>>> document.data["a"].append(3)
+>>> document.invalidate()
+>>> cache.find(expr, document)
+(1, 2, 3)
+>>> cache.info()
+ResultCacheInfo(hits=1, misses=2, evictions=0, maxsize=1024, currsize=1)
+"""
+
+# Standard Library
+import threading
+import weakref
+
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+# Local Folder
+from .core import BoundExpr, Expr
+
+if TYPE_CHECKING:
+    # Local Folder
+    from .compiler import CompiledExpr
+
+T_FINDER = Union[Expr, BoundExpr, "CompiledExpr"]
+T_ENTRY = TypeVar("T_ENTRY")
+
+
+class _LRUCache(Generic[T_ENTRY]):
+    """
+    Thread-safe and size-bounded LRU cache with the statistics,
+    the base of :class:`ResultCache` and :class:`jsonpath.parser.ExprCache`.
+
+    :param maxsize: The maximum number of cached entries,
+        the cache is disabled if it is zero.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 0:
+            raise ValueError('"maxsize" parameter must not be negative')
+
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, T_ENTRY]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self, key: Hashable, check: Optional[Callable[[T_ENTRY], bool]] = None
+    ) -> Optional[T_ENTRY]:
+        """
+        Get the cached entry, and mark it as recently used.
+        The entry failed the check is missed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (check is not None and not check(entry)):
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def put(self, key: Hashable, entry: T_ENTRY) -> None:
+        """
+        Cache the entry,
+        evict the least recently used ones if the cache is full.
+        """
+        with self._lock:
+            if self._maxsize == 0:
+                return
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum size of the cache,
+        evict the least recently used ones if it shrinks.
+        """
+        if maxsize < 0:
+            raise ValueError('"maxsize" parameter must not be negative')
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Clear the cache and its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _stats(self) -> Tuple[int, int, int, int, int]:
+        with self._lock:
+            return (
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Document:
+    """
+    The handle of the data for :class:`ResultCache`.
+
+    The version of it is increased by :meth:`invalidate`
+    or setting the data.
+    The cache holds the handle weakly.
+
+    >>> document = Document({"a": 1})
+    >>> document.version
+    0
+    >>> document.invalidate()
+    >>> document.data = {"a": 2}
+    >>> document.version
+    2
+
+    :param data: The data to find in
+    :type data: Any
+    """
+
+    __slots__ = ("_data", "version", "__weakref__")
+
+    def __init__(self, data: Any) -> None:
+        self._data = data
+        self.version = 0
+
+    @property
+    def data(self) -> Any:
+        """
+        The data to find in.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, data: Any) -> None:
+        self._data = data
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Mark the cached results of the data stale,
+        call it after changing the data in place.
+        """
+        self.version += 1
+
+
+class ResultCacheInfo(NamedTuple):
+    """
+    Statistics of :class:`ResultCache`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The ratio of the hits to all lookups, 0 if nothing was looked up.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# the expression, the weak reference of the document, the version and the results
+_T_ENTRY = Tuple[T_FINDER, "weakref.ReferenceType[Document]", int, Tuple[Any, ...]]
+
+
+class ResultCache(_LRUCache[_T_ENTRY]):
+    """
+    Thread-safe and size-bounded LRU cache of the results
+    of the expressions found in the documents.
+
+    The results are cached by the identities of the expression
+    and the document, keep the expression (e.g., the one returned by
+    :meth:`~jsonpath.core.Expr.bind`) to reuse its results.
+    :func:`~jsonpath.parser.parse` returns the same cached expr
+    for the same expression, so parsing it again hits too.
+    The exprs created again (e.g., by chaining or parsing without the cache)
+    miss, and their entries are kept until they are evicted.
+    The cached results are dropped if the document was invalidated.
+
+    The cache holds the expressions and the results,
+    the results of the dropped documents are kept
+    until they are evicted or the cache is cleared.
+    The results are cached as a tuple and shared by the hits,
+    so they are not copied and can't be changed.
+
+    :param maxsize: The maximum number of cached results,
+        the cache is disabled if it is zero.
+    :type maxsize: int
+    """
+
+    def find(
+        self,
+        expr: T_FINDER,
+        document: Document,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Tuple[Any, ...]:
+        """
+        Find the data of the document by the expression,
+        get the cached results if it is found before and
+        the document is not invalidated since.
+
+        :param expr: The expression, or the bound or compiled one.
+        :type expr: :class:`~jsonpath.core.Expr`
+        :param document: The document to find in
+        :type document: :class:`Document`
+        :param limit: The maximum number of the results
+        :type limit: Optional[int]
+        :param offset: The number of the results to skip
+        :type offset: int
+
+        :returns: The tuple of the results, shared with the later hits.
+        :rtype: Tuple[Any, ...]
+        """
+        key = (id(expr), id(document), limit, offset)
+        version = document.version
+
+        def check(entry: _T_ENTRY) -> bool:
+            # the ids of the dropped ones may be reused,
+            # and the results found before invalidating are stale
+            return entry[0] is expr and entry[1]() is document and entry[2] == version
+
+        entry = self.get(key, check)
+        if entry is not None:
+            return entry[3]
+
+        results = tuple(expr.find(document.data, limit=limit, offset=offset))
+        self.put(key, (expr, weakref.ref(document), version, results))
+        return results
+
+    def info(self) -> ResultCacheInfo:
+        """
+        Get the statistics of the cache.
+
+        :rtype: :class:`ResultCacheInfo`
+        """
+        return ResultCacheInfo(*self._stats())
+
+
+__all__ = ("Document", "ResultCache", "ResultCacheInfo")
@@ -0,0 +1,861 @@
+"""
+======================================================
+:mod:`compiler` -- Compile expression into Python code
+======================================================
+
+Generate specialized Python functions for the JSONPath expression,
+which find the same target data as the :meth:`jsonpath.core.Expr.find`,
+but without walking through the chained expr and the context variables.
+"""
+
+# Standard Library
+import itertools
+import math
+import operator
+
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Type
+
+# Local Folder
+from .core import (
+    T_PATH,
+    And,
+    Array,
+    BoundExpr,
+    Brace,
+    Compare,
+    Contains,
+    Expr,
+    JSONPathFindError,
+    Key,
+    Name,
+    NamePath,
+    Not,
+    Or,
+    Parameter,
+    Predicate,
+    Root,
+    Search,
+    Self,
+    Slice,
+    Value,
+    _get_parameter,
+    _limit,
+    ctx_finding,
+    ctx_parent,
+    ctx_root,
+    ctx_self,
+    temporary_set,
+)
+from .index import DocumentIndex
+
+# The helpers used by the generated code.
+# The generated functions accept arguments as below,
+#   the element to find in,
+#   the parent of the element (ctx_parent),
+#   the current item of the predicate, a tuple of key and value (ctx_self),
+#   the root element (ctx_root).
+PREAMBLE = """\
+_MISSING = object()
+
+
+def _key(item):
+    if item is _MISSING:
+        raise LookupError("key() used outside of the predicate")
+    return item[0]
+
+
+def _self_value(item):
+    if item is _MISSING:
+        raise LookupError("comparison used outside of the predicate")
+    return item[1]
+
+
+def _parent(parent):
+    if parent is _MISSING:
+        raise LookupError("slice used without the parent element")
+    return parent
+"""
+
+_runtime: Dict[str, Any] = {}
+exec(PREAMBLE, _runtime)
+MISSING = _runtime["_MISSING"]
+
+OPERATORS: Dict[Callable[[Any, Any], bool], str] = {
+    operator.lt: "<",
+    operator.le: "<=",
+    operator.eq: "==",
+    operator.ge: ">=",
+    operator.gt: ">",
+    operator.ne: "!=",
+}
+
+
+def _legacy(expr: Expr, element: Any, parent: Any, item: Any, root: Any) -> Any:
+    """
+    Execute the expr can not be compiled by its find method,
+    e.g., the user-defined expr class.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(temporary_set(ctx_root, root))
+        stack.enter_context(temporary_set(ctx_finding, True))
+        if parent is not MISSING:
+            stack.enter_context(temporary_set(ctx_parent, parent))
+        if item is not MISSING:
+            stack.enter_context(temporary_set(ctx_self, item))
+
+        try:
+            return expr.find(element)
+        except JSONPathFindError:
+            return []
+
+
+_runtime["_legacy"] = _legacy
+_runtime["_get_parameter"] = _get_parameter
+
+
+def _get_implementation(cls: Type[Expr]) -> type:
+    """
+    Get the class which implements the find method of the expr class.
+    """
+    return next(c for c in cls.__mro__ if "find" in c.__dict__)
+
+
+def _get_chain(expr: Expr) -> List[Expr]:
+    """
+    Get all parts of the chained expr from the beginning,
+    as the find method does.
+    """
+    nodes = []
+    node: Optional[Expr] = expr.get_begin()
+    while node is not None:
+        nodes.append(node)
+        node = node.get_next()
+
+    return nodes
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.level = 0
+
+    def __call__(self, line: str) -> None:
+        self.lines.append("    " * self.level + line)
+
+    def indent(self) -> None:
+        self.level += 1
+
+    def source(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class CodeGenerator:
+    """
+    Generate the Python code of the functions for JSONPath expressions.
+
+    :param prefix: The prefix of the generated function names.
+    :type prefix: str
+    :param allow_objects: Allow to refer to the objects in the namespace
+        which can not be expressed in the source code,
+        e.g., the user-defined expr class.
+    :type allow_objects: bool
+    """
+
+    def __init__(self, prefix: str = "", allow_objects: bool = True) -> None:
+        self.prefix = prefix
+        self.allow_objects = allow_objects
+        self.functions: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+        self._counter = itertools.count()
+        # the generated function names and the first nodes,
+        # keep the nodes alive so that their ids are not reused.
+        self._generated: Dict[Tuple[int, int, str], Tuple[str, Expr]] = {}
+
+    def source(self) -> str:
+        """
+        Get the source code of all generated functions.
+        """
+        return "\n\n".join(self.functions)
+
+    def _new_name(self, kind: str) -> str:
+        return f"_{self.prefix}{kind}{next(self._counter)}"
+
+    def _reference(self, obj: Any) -> str:
+        if not self.allow_objects:
+            raise TypeError(f"Can not generate the code for {obj!r}")
+
+        name = self._new_name("obj")
+        self.namespace[name] = obj
+        return name
+
+    def _literal(self, value: Any) -> str:
+        # the parsed names are the subclass of str, e.g., lark.Token
+        if value is None or isinstance(value, bool):
+            return repr(value)
+        elif isinstance(value, int):
+            return repr(int(value))
+        elif isinstance(value, str):
+            return repr(str(value))
+        elif isinstance(value, float):
+            if math.isfinite(value):
+                return repr(float(value))
+
+            return f"float({str(value)!r})"
+
+        return self._reference(value)
+
+    def query(self, expr: Expr) -> Tuple[str, str]:
+        """
+        Generate the functions for the expression,
+        find target data in list or iterably.
+
+        :returns: The names of the list function and the iterable function.
+        :rtype: Tuple[str, str]
+        """
+        nodes = _get_chain(expr)
+        return self._chain(nodes, "list"), self._chain(nodes, "iter")
+
+    def chain(self, expr: Expr, mode: str) -> str:
+        """
+        Generate the function for the whole chained expr,
+        it starts from the beginning of the chained expr.
+
+        The "first" mode function returns the first target data only
+        or the MISSING object if it finds nothing.
+        """
+        return self._chain(_get_chain(expr), mode)
+
+    def step(self, expr: Expr, mode: str = "list") -> str:
+        """
+        Generate the function for one part of the chained expr only.
+        """
+        return self._chain([expr], mode)
+
+    def _chain(self, nodes: List[Expr], mode: str) -> str:
+        key = (id(nodes[0]), len(nodes), mode)
+        if key in self._generated:
+            return self._generated[key][0]
+
+        name = self._new_name(f"{mode}_")
+        write = _Writer()
+        write(f"def {name}(e0, parent, item, root):")
+        write.indent()
+        if mode == "list":
+            write("rv = []")
+
+        level = write.level
+        src, parent = "e0", "parent"
+        for idx, node in enumerate(nodes, start=1):
+            dst = f"e{idx}"
+            self._step(write, node, src, parent, dst, idx)
+            src, parent = dst, src
+
+        if mode == "list":
+            write(f"rv.append({src})")
+            write.level = level
+            write("return rv")
+        elif mode == "iter":
+            write(f"yield {src}")
+        elif mode == "first":
+            write(f"return {src}")
+            write.level = level
+            write("return _MISSING")
+        else:
+            raise ValueError(f"Unknown mode {mode!r}")
+
+        self.functions.append(write.source())
+        self._generated[key] = (name, nodes[0])
+        return name
+
+    def _step(
+        self, write: _Writer, node: Expr, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        """
+        Write the code of one part of the chained expr,
+        it binds the found elements to the "dst" variable one by one,
+        the following code is written in the indented block.
+        """
+        impl = _get_implementation(type(node))
+        method = getattr(self, f"_step_{impl.__name__}", None)
+        if impl not in _COMPILABLE or method is None:
+            func = self._reference(node)
+            write(f"for {dst} in _legacy({func}, {src}, {parent}, item, root):")
+            write.indent()
+            return
+
+        method(write, node, src, parent, dst, idx)
+
+    def _step_Value(
+        self, write: _Writer, node: Value, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        write(f"{dst} = {self._literal(node.value)}")
+
+    def _step_Parameter(
+        self, write: _Writer, node: Parameter, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        write(f"{dst} = _get_parameter({self._literal(node.name)})")
+
+    def _step_Root(
+        self, write: _Writer, node: Root, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        write(f"{dst} = root")
+
+    def _step_Self(
+        self, write: _Writer, node: Self, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        write(f"{dst} = {src} if item is _MISSING else item[1]")
+
+    def _step_Key(
+        self, write: _Writer, node: Key, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        write(f"{dst} = _key(item)")
+
+    def _step_Name(
+        self, write: _Writer, node: Name, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        if node.name is None:
+            write(f"if isinstance({src}, dict):")
+            write.indent()
+            write(f"for {dst} in {src}.values():")
+        else:
+            name = self._literal(node.name)
+            write(f"if isinstance({src}, dict) and {name} in {src}:")
+            write.indent()
+            write(f"{dst} = {src}[{name}]")
+            return
+
+        write.indent()
+
+    def _step_NamePath(
+        self, write: _Writer, node: NamePath, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        for pos, name in enumerate(map(self._literal, node.names), start=1):
+            var = dst if pos == len(node.names) else f"{dst}_{pos}"
+            write(f"if isinstance({src}, dict) and {name} in {src}:")
+            write.indent()
+            write(f"{var} = {src}[{name}]")
+            src = var
+
+    def _step_Array(
+        self, write: _Writer, node: Array, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        if node.idx is None:
+            write(f"if isinstance({src}, list):")
+            write.indent()
+            write(f"for {dst} in {src}:")
+            write.indent()
+        elif isinstance(node.idx, Slice):
+            # Array finds the partial items by the Slice itself only
+            func = self.step(node.idx)
+            write(f"for {dst} in {func}({src}, {parent}, item, root):")
+            write.indent()
+        else:
+            if node.idx >= 0:
+                condition = f"len({src}) > {node.idx}"
+            else:
+                condition = f"len({src}) >= {-node.idx}"
+
+            write(f"if isinstance({src}, list) and {condition}:")
+            write.indent()
+            write(f"{dst} = {src}[{node.idx}]")
+
+    def _step_Slice(
+        self, write: _Writer, node: Slice, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        fields = (node.start, node.stop, node.step)
+        if not any(isinstance(field, Expr) for field in fields):
+            start = self._literal(node.start)
+            step = self._literal(node.step)
+            # the stop is the length of the list even if the step is negative
+            stop = f"len({src})" if node.stop is None else self._literal(node.stop)
+            write(f"if isinstance({src}, list):")
+            write.indent()
+            write(f"for {dst} in {src}[{start} or 0:{stop}:{step} or 1]:")
+            write.indent()
+            return
+
+        inner = _Writer()
+        name = self._new_name("slice")
+        inner(f"def {name}(e0, parent, item, root):")
+        inner.indent()
+        inner("if not isinstance(e0, list):")
+        inner("    return ()")
+        for var, field, default in zip(
+            ("start", "stop", "step"), fields, (" or 0", "", " or 1")
+        ):
+            if isinstance(field, Expr):
+                func = self.chain(field, "first")
+                inner(f"{var} = {func}(_parent(parent), parent, item, root)")
+                inner(f"if {var} is _MISSING or not isinstance({var}, int):")
+                inner("    return ()")
+                inner(f"{var} = {var}{default}")
+            else:
+                inner(f"{var} = {self._literal(field)}{default}")
+
+        inner("if stop is None:")
+        inner("    stop = len(e0)")
+        inner("return e0[start:stop:step]")
+        self.functions.append(inner.source())
+        write(f"for {dst} in {name}({src}, {parent}, item, root):")
+        write.indent()
+
+    def _step_Predicate(
+        self,
+        write: _Writer,
+        node: Predicate,
+        src: str,
+        parent: str,
+        dst: str,
+        idx: int,
+    ) -> None:
+        func = self.chain(node.expr, "first")
+        items, item, rv = f"items{idx}", f"item{idx}", f"rv{idx}"
+        write(f"if isinstance({src}, list):")
+        write(f"    {items} = enumerate({src})")
+        write(f"elif isinstance({src}, dict):")
+        write(f"    {items} = {src}.items()")
+        write("else:")
+        write(f"    {items} = ()")
+        write(f"for {item} in {items}:")
+        write.indent()
+        write(f"{rv} = {func}({item}[1], {parent}, {item}, root)")
+        write(f"if {rv} is not _MISSING and {rv}:")
+        write.indent()
+        write(f"{dst} = {item}[1]")
+
+    def _step_Brace(
+        self, write: _Writer, node: Brace, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        func = self.chain(node._expr, "list")
+        write(f"{dst} = {func}({src}, {parent}, item, root)")
+
+    def _step_Search(
+        self, write: _Writer, node: Search, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        func = self.step(node._expr, "iter")
+        name = self._new_name("search")
+        start, max_depth = "e0", node.max_depth
+        if isinstance(node._expr, Predicate):
+            # filtering find needs to begin on the current element,
+            # which is one level deeper than the wrapping list.
+            start = "[e0]"
+            if max_depth is not None:
+                max_depth += 1
+
+        descend = ""
+        if max_depth is not None:
+            descend = f"depth < {max_depth} and "
+
+        # walk in pre-order with the explicit stack like the Search.find does
+        self.functions.append(
+            f"def {name}(e0, parent, item, root):\n"
+            f"    stack = [(iter(({start},)), parent, 0)]\n"
+            "    while stack:\n"
+            "        iterator, parent, depth = stack[-1]\n"
+            "        for element in iterator:\n"
+            f"            yield from {func}(element, parent, item, root)\n"
+            f"            if {descend}isinstance(element, list):\n"
+            "                stack.append((iter(element), element, depth + 1))\n"
+            "                break\n"
+            f"            elif {descend}isinstance(element, dict):\n"
+            "                children = iter(element.values())\n"
+            "                stack.append((children, element, depth + 1))\n"
+            "                break\n"
+            "        else:\n"
+            "            stack.pop()\n"
+        )
+        write(f"for {dst} in {name}({src}, {parent}, item, root):")
+        write.indent()
+
+    def _step_Compare(
+        self,
+        write: _Writer,
+        node: Compare,
+        src: str,
+        parent: str,
+        dst: str,
+        idx: int,
+    ) -> None:
+        symbol = OPERATORS.get(node._operator)
+        if isinstance(node.target, Expr):
+            func = self.chain(node.target, "first")
+            target = f"target{idx}"
+            write(f"{target} = {func}(_self_value(item), {parent}, item, root)")
+            write(f"if {target} is not _MISSING:")
+            write.indent()
+        else:
+            target = self._literal(node.target)
+
+        if symbol is None:
+            write(f"{dst} = {self._reference(node._operator)}({src}, {target})")
+        else:
+            write(f"{dst} = {src} {symbol} {target}")
+
+    def _step_And(
+        self, write: _Writer, node: And, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        self._step_boolean(write, node, src, parent, dst, "not ")
+
+    def _step_Or(
+        self, write: _Writer, node: Or, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        self._step_boolean(write, node, src, parent, dst, "")
+
+    def _step_boolean(
+        self,
+        write: _Writer,
+        node: Compare,
+        src: str,
+        parent: str,
+        dst: str,
+        short_circuit: str,
+    ) -> None:
+        if not isinstance(node.target, Expr):
+            write(f"{dst} = {src} {node._symbol} {self._literal(node.target)}")
+            return
+
+        func = self.chain(node.target, "first")
+        name = self._new_name(node._symbol)
+        self.functions.append(
+            f"def {name}(e0, parent, item, root):\n"
+            f"    if {short_circuit}e0:\n"
+            "        return (e0,)\n"
+            f"    target = {func}(_self_value(item), parent, item, root)\n"
+            "    if target is _MISSING:\n"
+            "        return ()\n"
+            "    return (target,)\n"
+        )
+        write(f"for {dst} in {name}({src}, {parent}, item, root):")
+        write.indent()
+
+    def _step_Contains(
+        self,
+        write: _Writer,
+        node: Contains,
+        src: str,
+        parent: str,
+        dst: str,
+        idx: int,
+    ) -> None:
+        # only the last part of the chained expr finds the first argument
+        func = self.step(node._expr, "first")
+        name = self._new_name("contains")
+        inner = _Writer()
+        inner(f"def {name}(e0, parent, item, root):")
+        inner.indent()
+        inner(f"value = {func}(e0, parent, item, root)")
+        inner("if value is _MISSING:")
+        inner("    return ()")
+        if isinstance(node._target, Expr):
+            target_func = self.chain(node._target, "first")
+            inner(f"target = {target_func}(e0, parent, item, root)")
+            inner("if target is _MISSING:")
+            inner("    return ()")
+        else:
+            inner(f"target = {self._literal(node._target)}")
+
+        inner("return (target in value,)")
+        self.functions.append(inner.source())
+        write(f"for {dst} in {name}({src}, {parent}, item, root):")
+        write.indent()
+
+    def _step_Not(
+        self, write: _Writer, node: Not, src: str, parent: str, dst: str, idx: int
+    ) -> None:
+        func = self.chain(node._expr, "list")
+        value = f"value{idx}"
+        write(f"for {value} in {func}({src}, {parent}, item, root):")
+        write.indent()
+        write(f"{dst} = not {value}")
+
+
+_COMPILABLE = frozenset(
+    [
+        And,
+        Array,
+        Brace,
+        Compare,
+        Contains,
+        Key,
+        Name,
+        NamePath,
+        Not,
+        Or,
+        Parameter,
+        Predicate,
+        Root,
+        Search,
+        Self,
+        Slice,
+        Value,
+    ]
+)
+
+
+class CompiledExpr:
+    """
+    The compiled JSONPath expression,
+    finds the same target data as the expression it compiled from.
+
+    The operands in the predicates (e.g., :class:`jsonpath.core.Compare`)
+    stop finding once they get their first result,
+    so the errors raised by finding the rest ones will not be raised.
+
+    >>> p = Root().Name("goods").Predicate(Name("price") > 10).compile()
+    >>> p
+    CompiledJSONPath('$.goods[price > 10]')
+    >>> p.find({"goods": [{"price": 1}, {"price": 20}]})
+    [{'price': 20}]
+
+    .. automethod:: find
+    .. automethod:: find_first
+    .. automethod:: find_iter
+    .. automethod:: find_with_paths
+    .. automethod:: find_iter_with_paths
+    .. automethod:: exists
+    .. automethod:: count
+    .. automethod:: update
+    .. automethod:: updated
+    .. automethod:: transform
+    .. automethod:: delete
+    .. automethod:: bind
+    .. automethod:: get_expression
+
+    It is pickled as the expression it compiled from,
+    and compiled again on loading.
+    """
+
+    def __init__(
+        self,
+        expr: Expr,
+        source: str,
+        find: Callable[[Any, Any, Any, Any], List[Any]],
+        find_iter: Callable[[Any, Any, Any, Any], Generator[Any, None, None]],
+    ) -> None:
+        self.expr = expr
+        self.source = source
+        self._expression = expr.get_expression()
+        self._find = find
+        self._find_iter = find_iter
+
+    def __repr__(self) -> str:
+        return f"CompiledJSONPath({self._expression!r})"
+
+    def __reduce__(self) -> Tuple[Callable[[Expr], "CompiledExpr"], Tuple[Expr]]:
+        # the generated functions can not be pickled, compile it again on loading
+        return compile_expr, (self.expr,)
+
+    def get_expression(self) -> str:
+        """
+        Get full JSONPath expression.
+        """
+        return self._expression
+
+    def bind(self, **params: Any) -> BoundExpr:
+        """
+        Bind the values of the parameters in the compiled JSONPath expression.
+
+        >>> from jsonpath.core import Parameter
+        >>> p = Root().Predicate(Self() > Parameter("min")).compile()
+        >>> p.bind(min=1).find([0, 1, 2])
+        [2]
+
+        :param params: The values of the parameters by their names
+        :type params: Any
+
+        :returns: The compiled expression with its parameters bound.
+        :rtype: :class:`jsonpath.core.BoundExpr`
+        """
+        return BoundExpr(self, params)
+
+    def find(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional[DocumentIndex] = None,
+    ) -> List[Any]:
+        """
+        Find target data by the compiled JSONPath expression.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+            The finding stops once the limit is reached.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :mod:`jsonpath.index`.
+            The compiled functions do not use it,
+            the expression it compiled from finds with it instead.
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
+
+        :returns: A list of target data
+        :rtype: List[Any]
+        :raises ValueError: The limit or the offset is negative
+        """
+        if index is not None:
+            return self.expr.find(element, limit=limit, offset=offset, index=index)
+
+        if limit is None and not offset:
+            return self._find(element, MISSING, MISSING, element)
+
+        rv = self._find_iter(element, MISSING, MISSING, element)
+        return list(_limit(rv, limit, offset))
+
+    def find_first(self, element: Any) -> Any:
+        """
+        Find first target data by the compiled JSONPath expression.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: the first target data
+        :rtype: Any
+        :raises ~jsonpath.core.JSONPathFindError: Found nothing
+        """
+        for rv in self._find_iter(element, MISSING, MISSING, element):
+            return rv
+
+        raise JSONPathFindError("Found nothing")
+
+    def find_iter(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional[DocumentIndex] = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Iterable find target data by the compiled JSONPath expression.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :meth:`find`
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
+
+        :returns: the generator of target data list
+        :rtype: Generator[Any, None, None]
+        :raises ValueError: The limit or the offset is negative
+        """
+        if index is not None:
+            return self.expr.find_iter(element, limit=limit, offset=offset, index=index)
+
+        rv = self._find_iter(element, MISSING, MISSING, element)
+        if limit is None and not offset:
+            return rv
+
+        return _limit(rv, limit, offset)
+
+    def find_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Tuple[T_PATH, Any]]:
+        """
+        Find target data with their paths
+        by the expression it compiled from,
+        the compiled functions do not track the paths.
+
+        See :meth:`jsonpath.core.Expr.find_with_paths`.
+        """
+        return self.expr.find_with_paths(element, limit=limit, offset=offset)
+
+    def find_iter_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> Generator[Tuple[T_PATH, Any], None, None]:
+        """
+        Iterable find target data with their paths
+        by the expression it compiled from.
+
+        See :meth:`jsonpath.core.Expr.find_iter_with_paths`.
+        """
+        return self.expr.find_iter_with_paths(element, limit=limit, offset=offset)
+
+    def exists(self, element: Any) -> bool:
+        """
+        Check whether the compiled JSONPath expression finds any target data,
+        the finding stops at the first target data.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: Whether any target data is found
+        :rtype: bool
+        """
+        for _ in self._find_iter(element, MISSING, MISSING, element):
+            return True
+
+        return False
+
+    def count(self, element: Any) -> int:
+        """
+        Count target data found by the compiled JSONPath expression,
+        without collecting them into a list.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: The number of target data
+        :rtype: int
+        """
+        return sum(1 for _ in self._find_iter(element, MISSING, MISSING, element))
+
+    def update(self, element: Any, value: Any) -> Any:
+        """
+        Replace target data by the expression it compiled from.
+
+        See :meth:`jsonpath.core.Expr.update`.
+        """
+        return self.expr.update(element, value)
+
+    def updated(self, element: Any, value: Any) -> Any:
+        """
+        Get the updated copy of the root data by the expression it compiled from.
+
+        See :meth:`jsonpath.core.Expr.updated`.
+        """
+        return self.expr.updated(element, value)
+
+    def transform(self, element: Any, func: Callable[[Any], Any]) -> Any:
+        """
+        Replace target data by the expression it compiled from.
+
+        See :meth:`jsonpath.core.Expr.transform`.
+        """
+        return self.expr.transform(element, func)
+
+    def delete(self, element: Any) -> Any:
+        """
+        Delete target data by the expression it compiled from.
+
+        See :meth:`jsonpath.core.Expr.delete`.
+        """
+        return self.expr.delete(element)
+
+
+def compile_expr(expr: Expr) -> CompiledExpr:
+    """
+    Compile the JSONPath expression into Python functions.
+
+    :param expr: JSONPath expression
+    :type expr: :class:`jsonpath.core.Expr`
+
+    :returns: The compiled expression.
+    :rtype: :class:`CompiledExpr`
+    """
+    generator = CodeGenerator()
+    find, find_iter = generator.query(expr)
+    source = generator.source()
+    filename = f"<jsonpath {expr.get_expression()!r} at {id(generator):#x}>"
+    namespace = dict(_runtime, **generator.namespace)
+    exec(compile(source, filename, "exec"), namespace)
+    return CompiledExpr(expr, source, namespace[find], namespace[find_iter])
+
+
+__all__ = ("CodeGenerator", "CompiledExpr", "compile_expr")
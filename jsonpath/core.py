@@ -5,38 +5,61 @@
 """
 
 # Standard Library
+import copy
 import functools
 import json
 import operator
+import re
+import sys
 import weakref
 
 from abc import abstractmethod
-from contextlib import contextmanager, suppress
+from contextlib import ExitStack, contextmanager, suppress
 from contextvars import ContextVar
+from itertools import chain, islice
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
     Generator,
+    Iterable,
     Iterator,
     List,
+    Literal,
+    Mapping,
     Optional,
+    Protocol,
+    Set,
+    Sized,
     Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
 )
 from weakref import ReferenceType
 
-# Third Party Library
-from typing_extensions import Literal
+if TYPE_CHECKING:
+    # Local Folder
+    from .compiler import CompiledExpr
+    from .index import DocumentIndex
 
 ctx_root: ContextVar[Any] = ContextVar("root")
 ctx_parent: ContextVar[Union[List[Any], Dict[str, Any]]] = ContextVar("parent")
 T_SELF_VALUE = Union[Tuple[int, Any], Tuple[str, Any]]
 ctx_self: ContextVar[T_SELF_VALUE] = ContextVar("self")
 ctx_finding: ContextVar[bool] = ContextVar("finding", default=False)
+# the first found elements of the root-invariant operands in the finding process
+ctx_invariants: ContextVar[Dict[int, Any]] = ContextVar("invariants")
+# the parameters bound by BoundExpr, see Expr.bind
+ctx_params: ContextVar[Mapping[str, Any]] = ContextVar("params", default={})
 T_VALUE = Union[int, float, str, Literal[None], Literal[True], Literal[False]]
+# the location of the found element, the keys and indices from the root data
+T_PATH = Tuple[Union[str, int], ...]
+# the location of the found element while finding, linked to the one of its container,
+# None for the root data. (the location of the container, the container, the key)
+T_LOCATION = Optional[Tuple[Any, Any, Union[str, int]]]
 
 T = TypeVar("T", bound="Expr")
 
@@ -78,6 +101,12 @@ class JSONPathFindError(JSONPathError):
     """
 
 
+class JSONPathUnboundParameterError(JSONPathError):
+    """
+    The parameter in JSONPath expression is not bound on finding.
+    """
+
+
 @contextmanager
 def temporary_set(
     context_var: ContextVar[Any], value: Any
@@ -100,33 +129,508 @@ def temporary_set(
         context_var.reset(token)
 
 
-def _dfs_find(expr: "Expr", elements: List[Any]) -> Generator[Any, None, None]:
+_MISSING: Any = object()
+
+
+class _Context:
+    """
+    The state of one finding process, passed down to the parts of expr
+    instead of the context variables.
+
+    The attributes are changed while finding in the nested elements,
+    and restored afterward, so it is owned by one finding process only.
+    """
+
+    __slots__ = ("root", "parent", "item", "invariants", "params", "index")
+
+    def __init__(
+        self,
+        root: Any,
+        parent: Any = _MISSING,
+        item: Any = _MISSING,
+        invariants: Optional[Dict[int, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        index: Optional["DocumentIndex"] = None,
+    ) -> None:
+        self.root = root
+        self.parent = parent
+        self.item = item
+        self.invariants = invariants
+        self.params = ctx_params.get() if params is None else params
+        self.index = index
+
+    @classmethod
+    def from_vars(cls) -> "_Context":
+        """
+        Create the context from the context variables,
+        raises LookupError if the finding process is not begun.
+        """
+        return cls(
+            ctx_root.get(),
+            ctx_parent.get(_MISSING),
+            ctx_self.get(_MISSING),
+            ctx_invariants.get(None),
+        )
+
+    def get_parent(self) -> Any:
+        if self.parent is _MISSING:
+            raise LookupError("the parent element is not set")
+
+        return self.parent
+
+    def get_item(self) -> T_SELF_VALUE:
+        if self.item is _MISSING:
+            raise LookupError("the item of the predicate is not set")
+
+        return self.item
+
+    def apply(self, stack: ExitStack) -> None:
+        """
+        Set the context variables for the user-defined expr.
+        """
+        stack.enter_context(temporary_set(ctx_root, self.root))
+        stack.enter_context(temporary_set(ctx_finding, True))
+        stack.enter_context(temporary_set(ctx_params, self.params))
+        if self.parent is not _MISSING:
+            stack.enter_context(temporary_set(ctx_parent, self.parent))
+        if self.item is not _MISSING:
+            stack.enter_context(temporary_set(ctx_self, self.item))
+        if self.invariants is not None:
+            stack.enter_context(temporary_set(ctx_invariants, self.invariants))
+
+
+def _get_context(element: Any, index: Optional["DocumentIndex"] = None) -> _Context:
+    """
+    Get the context of the nested finding process,
+    or begin a new one on the element as the root, with the index of it.
+    """
+    try:
+        return _Context.from_vars()
+    except LookupError:
+        pass
+
+    if index is not None and index.data is not element:
+        raise ValueError("The index is not built for the root data")
+
+    return _Context(element, invariants={}, index=index)
+
+
+def _find_chain(expr: "Expr", element: Any, ctx: _Context) -> List[Any]:
+    """
+    Find by the whole chained expr, from its beginning.
+    """
+    rv: List[Any] = []
+    _dfs_collect(expr.get_begin(), [element], ctx, rv)
+    return rv
+
+
+def _find_first(expr: "Expr", element: Any, ctx: _Context) -> Any:
+    """
+    Find the first target element by the whole chained expr, from its beginning,
+    or the :data:`_MISSING` if it finds nothing.
+    The rest elements are not found, e.g., the operands in the predicate.
+    """
+    return _dfs_first(expr.get_begin(), [element], ctx)
+
+
+def _dfs_first(expr: "Expr", elements: Iterable[Any], ctx: _Context) -> Any:
+    """
+    Same as :func:`_dfs_collect` but stops at the first target element,
+    the lazy results of the parts of expr are not found further.
+    """
+    stack: List[Tuple["Expr", Optional["Expr"], Iterator[Any], Any]] = [
+        (expr, expr.get_next(), iter(elements), ctx.parent)
+    ]
+    saved_parent = ctx.parent
+    try:
+        while stack:
+            expr, next_expr, iterator, parent = stack[-1]
+            ctx.parent = parent
+            for element in iterator:
+                found_elements = expr._find(element, ctx)
+                if next_expr is None:
+                    for found in found_elements:
+                        return found
+
+                    continue
+
+                stack.append(
+                    (next_expr, next_expr.get_next(), iter(found_elements), element)
+                )
+                break
+            else:
+                stack.pop()
+    finally:
+        ctx.parent = saved_parent
+
+    return _MISSING
+
+
+def _dfs_collect(
+    expr: "Expr", elements: Iterable[Any], ctx: _Context, rv: List[Any]
+) -> None:
+    """
+    Same as :func:`_dfs_find` but collects the target elements into the list,
+    which is cheaper than the generators.
+    """
+    stack: List[Tuple["Expr", Optional["Expr"], Iterator[Any], Any]] = [
+        (expr, expr.get_next(), iter(elements), ctx.parent)
+    ]
+    saved_parent = ctx.parent
+    try:
+        while stack:
+            expr, next_expr, iterator, parent = stack[-1]
+            ctx.parent = parent
+            for element in iterator:
+                found_elements = expr._find(element, ctx)
+                if not found_elements:
+                    continue
+
+                if next_expr is None:
+                    rv.extend(found_elements)
+                    continue
+
+                stack.append(
+                    (next_expr, next_expr.get_next(), iter(found_elements), element)
+                )
+                break
+            else:
+                stack.pop()
+    finally:
+        ctx.parent = saved_parent
+
+
+def _dfs_find(
+    expr: "Expr", elements: Iterable[Any], ctx: _Context
+) -> Generator[Any, None, None]:
     """
     use DFS to find all target elements.
     the next expr finds in the result found by the current expr.
+
+    The pending elements of each part of the chained expr are kept
+    in an explicit stack, instead of the recursive generators,
+    so the target elements are yielded directly
+    no matter how long the chained expr is.
     """
-    next_expr = expr.get_next()
-    for element in elements:
-        try:
-            found_elements = expr.find(element)
-        except JSONPathFindError:
-            continue
+    # the part of expr, the next part of it,
+    # the elements to find in and their parent
+    stack: List[Tuple["Expr", Optional["Expr"], Iterator[Any], Any]] = [
+        (expr, expr.get_next(), iter(elements), ctx.parent)
+    ]
+    saved_parent = ctx.parent
+    try:
+        while stack:
+            expr, next_expr, iterator, parent = stack[-1]
+            ctx.parent = parent
+            for element in iterator:
+                found_elements = expr._find(element, ctx)
+                if not found_elements:
+                    continue
+
+                if next_expr is None:
+                    # collect all found elements if there is no next expr.
+                    yield from found_elements
+                    continue
+
+                # finds in the found elements first, then the rest elements
+                stack.append(
+                    (next_expr, next_expr.get_next(), iter(found_elements), element)
+                )
+                break
+            else:
+                stack.pop()
+    finally:
+        ctx.parent = saved_parent
 
-        if not found_elements:
-            continue
 
-        if next_expr is None:
-            # collect all found elements if there is no next expr.
-            yield from found_elements
+def _dfs_find_locations(
+    expr: "Expr", elements: Iterable[Tuple[T_LOCATION, Any]], ctx: _Context
+) -> Generator[Tuple[T_LOCATION, Any], None, None]:
+    """
+    Same as :func:`_dfs_find` but finds the target elements with their locations,
+    by the ``_find_locations`` method of the parts of expr.
+    It is separated from :func:`_dfs_find`,
+    so finding without the locations does not build them.
+    """
+    stack: List[
+        Tuple["Expr", Optional["Expr"], Iterator[Tuple[T_LOCATION, Any]], Any]
+    ] = [(expr, expr.get_next(), iter(elements), ctx.parent)]
+    saved_parent = ctx.parent
+    try:
+        while stack:
+            expr, next_expr, iterator, parent = stack[-1]
+            ctx.parent = parent
+            for location, element in iterator:
+                found_elements = expr._find_locations(element, location, ctx)
+                if not found_elements:
+                    continue
+
+                if next_expr is None:
+                    yield from found_elements
+                    continue
+
+                stack.append(
+                    (next_expr, next_expr.get_next(), iter(found_elements), element)
+                )
+                break
+            else:
+                stack.pop()
+    finally:
+        ctx.parent = saved_parent
+
+
+def _get_path(location: T_LOCATION) -> T_PATH:
+    """
+    Get the path of the location, from the root data.
+    """
+    keys = []
+    while location is not None:
+        location, _, key = location
+        keys.append(key)
+
+    keys.reverse()
+    return tuple(keys)
+
+
+def _transform(
+    found: Iterable[Tuple[T_LOCATION, Any]], root: Any, func: Callable[[Any], Any]
+) -> Any:
+    """
+    Replace the found elements in their containers by the results of the function,
+    and return the root data, which is replaced if it is found itself.
+
+    All elements are found before replacing any of them,
+    then they are replaced in the reverse order,
+    so the inner elements are replaced before the outer ones containing them.
+    """
+    for location, element in reversed(list(found)):
+        if location is None:
+            root = func(element)
+        else:
+            _, container, key = location
+            container[key] = func(element)
+
+    return root
+
+
+def _get_copy(container: Any, location: T_LOCATION, copies: Dict[int, Any]) -> Any:
+    """
+    Get the shallow copy of the container at the location,
+    and link it into the copies of the containers on its path,
+    which are copied once and shared by the copies of their descendants.
+    """
+    copied = copies.get(id(container))
+    if copied is None:
+        copied = copies[id(container)] = container.copy()
+
+    child = copied
+    while location is not None:
+        location, parent, key = location
+        parent_copy = copies.get(id(parent))
+        if parent_copy is None:
+            parent_copy = copies[id(parent)] = parent.copy()
+        elif parent_copy[key] is child:
+            # the rest of the path is linked already
+            break
+
+        parent_copy[key] = child
+        child = parent_copy
+
+    return copied
+
+
+def _updated(
+    found: Iterable[Tuple[T_LOCATION, Any]], root: Any, func: Callable[[Any], Any]
+) -> Any:
+    """
+    Same as :func:`_transform` but replaces the found elements in the copies
+    of their containers, and return the copy of the root data.
+    Only the containers on the paths of the found elements are copied,
+    the rest elements are shared with the root data.
+    """
+    # the copies of the containers by the ids of the original ones,
+    # which are alive while the root data is.
+    copies: Dict[int, Any] = {}
+    replaced = _MISSING
+    for location, element in reversed(list(found)):
+        # the element is copied if its inner elements are replaced
+        value = func(copies.get(id(element), element))
+        if location is None:
+            replaced = value
             continue
 
-        with temporary_set(ctx_parent, element):
-            yield from _dfs_find(next_expr, found_elements)
+        container_location, container, key = location
+        _get_copy(container, container_location, copies)[key] = value
+
+    if replaced is not _MISSING:
+        return replaced
+
+    return copies.get(id(root), root)
+
+
+def _delete(found: Iterable[Tuple[T_LOCATION, Any]]) -> None:
+    """
+    Delete the found elements from their containers.
+
+    All elements are found before deleting any of them,
+    and the items of each array are deleted from the last one,
+    so the indices of the rest ones are not shifted.
+    """
+    indices: Dict[int, Tuple[List[Any], Set[Any]]] = {}
+    keys: List[Tuple[Dict[str, Any], Any]] = []
+    for location, _ in found:
+        if location is None:
+            raise JSONPathError("The root data can not be deleted")
+
+        _, container, key = location
+        if isinstance(container, list):
+            indices.setdefault(id(container), (container, set()))[1].add(key)
+        else:
+            keys.append((container, key))
+
+    for container, key in keys:
+        # the same element may be found more than once
+        container.pop(key, None)
+
+    for array, idxs in indices.values():
+        for idx in sorted(idxs, reverse=True):
+            del array[idx]
+
+
+def _dfs_count(expr: "Expr", elements: Iterable[Any], ctx: _Context) -> int:
+    """
+    Same as :func:`_dfs_collect` but counts the target elements only,
+    the sized results of the last part of expr are not iterated.
+    """
+    count = 0
+    stack: List[Tuple["Expr", Optional["Expr"], Iterator[Any], Any]] = [
+        (expr, expr.get_next(), iter(elements), ctx.parent)
+    ]
+    saved_parent = ctx.parent
+    try:
+        while stack:
+            expr, next_expr, iterator, parent = stack[-1]
+            ctx.parent = parent
+            for element in iterator:
+                found_elements = expr._find(element, ctx)
+                if next_expr is None:
+                    if isinstance(found_elements, Sized):
+                        count += len(found_elements)
+                    else:
+                        count += sum(1 for _ in found_elements)
+                    continue
+
+                stack.append(
+                    (next_expr, next_expr.get_next(), iter(found_elements), element)
+                )
+                break
+            else:
+                stack.pop()
+    finally:
+        ctx.parent = saved_parent
+
+    return count
+
+
+def _limit(
+    results: Iterable[Any], limit: Optional[int], offset: int
+) -> Generator[Any, None, None]:
+    """
+    Skip the offset of the results and take the limit of the rest,
+    the lazy results stop finding once the limit is reached.
+    """
+    if limit is not None and limit < 0:
+        raise ValueError('"limit" parameter must not be negative')
+    if offset < 0:
+        raise ValueError('"offset" parameter must not be negative')
+
+    yield from islice(results, offset, None if limit is None else offset + limit)
+
+
+def _create_find(actual_find: Callable[..., List[Any]]) -> Callable[..., List[Any]]:
+    """
+    Create the find method of the built-in expr class from its _find method.
+    """
+
+    def find(self: "Expr", element: Any) -> List[Any]:
+        rv = actual_find(self, element, _Context.from_vars())
+        # the lazy finding, e.g., Search
+        return rv if isinstance(rv, list) else list(rv)
+
+    return find
+
+
+def _create_legacy_find(
+    actual_find: Callable[..., List[Any]],
+) -> Callable[..., List[Any]]:
+    """
+    Create the _find method of the user-defined expr class from its find method,
+    which gets the state of the finding process from the context variables,
+    and raises :exc:`JSONPathFindError` if it finds nothing.
+    """
+
+    def _find(self: "Expr", element: Any, ctx: _Context) -> List[Any]:
+        with ExitStack() as stack:
+            ctx.apply(stack)
+            try:
+                return actual_find(self, element)
+            except JSONPathFindError:
+                return []
+
+    return _find
+
+
+class _Find(Protocol):
+    def __call__(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = ...,
+        offset: int = ...,
+        index: Optional["DocumentIndex"] = ...,
+    ) -> List[Any]: ...
+
+
+class _FindMethod(Protocol):
+    def __get__(self, obj: Any, objtype: Any = ...) -> _Find: ...
+
+
+def legacy_find(func: Callable[[Any, Any], List[Any]]) -> _FindMethod:
+    """
+    Mark the ``find(self, element)`` method of the user-defined expr class,
+    so it type-checks as the override of :meth:`Expr.find`.
+    It changes nothing at runtime,
+    :class:`ExprMeta` adds the keyword arguments of :meth:`Expr.find` to it.
+
+    >>> class OddOnly(Expr):
+    ...     def _get_partial_expression(self):
+    ...         return "odd_only()"
+    ...
+    ...     @legacy_find
+    ...     def find(self, element):
+    ...         return [element] if element % 2 else []
+    ...
+    >>> Root().Array().OddOnly().find([1, 2, 3, 5], limit=2)
+    [1, 3]
+
+    :param func: The find method of the user-defined expr class
+    :type func: Callable[[Any, Any], List[Any]]
+
+    :returns: The same method
+    :rtype: _FindMethod
+    """
+    return cast(_FindMethod, func)
 
 
 class ExprMeta(type):
     """
     JSONPath Expr Meta Class.
+
+    The built-in expr classes implement the ``_find`` method,
+    which gets the state of the finding process from the context argument.
+    The user-defined expr classes implement the ``find`` method,
+    which gets it from the context variables, e.g., :data:`ctx_parent`,
+    and is marked by :func:`legacy_find` for the type checkers.
     """
 
     _classes: Dict[str, "ExprMeta"] = {}
@@ -135,23 +639,42 @@ class ExprMeta(type):
         metacls, name: str, bases: Tuple[type], attr_dict: Dict[str, Any]
     ) -> "ExprMeta":
         if "find" not in attr_dict:
-            return _create_expr_cls(metacls, name, bases, attr_dict)
+            if "_find" not in attr_dict:
+                return _create_expr_cls(metacls, name, bases, attr_dict)
+
+            attr_dict["find"] = _create_find(attr_dict["_find"])
+        elif "_find" not in attr_dict:
+            attr_dict["_find"] = _create_legacy_find(attr_dict["find"])
 
         actual_find = attr_dict["find"]
 
         @functools.wraps(actual_find)
-        def find(self: "Expr", element: Any) -> List[Any]:
+        def find(
+            self: "Expr",
+            element: Any,
+            *,
+            limit: Optional[int] = None,
+            offset: int = 0,
+            index: Optional["DocumentIndex"] = None,
+        ) -> List[Any]:
             if ctx_finding.get():
                 # the chained expr in the finding process
                 try:
-                    return actual_find(self, element)
+                    rv = actual_find(self, element)
                 except JSONPathFindError:
                     if self.ref_begin is None:
                         raise
 
-                    return []
+                    rv = []
+            elif limit is None and not offset:
+                return _find_chain(self, element, _get_context(element, index))
+            else:
+                rv = self.find_iter(element, index=index)
+
+            if limit is None and not offset:
+                return rv
 
-            return list(self.find_iter(element))
+            return list(_limit(rv, limit, offset))
 
         attr_dict["find"] = find
         return _create_expr_cls(metacls, name, bases, attr_dict)
@@ -178,17 +701,46 @@ class Expr(metaclass=ExprMeta):
     .. automethod:: find
     .. automethod:: find_first
     .. automethod:: find_iter
+    .. automethod:: find_with_paths
+    .. automethod:: find_iter_with_paths
+    .. automethod:: exists
+    .. automethod:: count
+    .. automethod:: update
+    .. automethod:: updated
+    .. automethod:: transform
+    .. automethod:: delete
+    .. automethod:: bind
+    .. automethod:: compile
+    .. automethod:: optimize
     .. automethod:: get_expression
     .. automethod:: get_begin
     .. automethod:: get_next
     .. automethod:: chain
+    .. automethod:: key
     .. automethod:: __getattr__
+
+    The expr can be pickled and deep copied with the parts chained before it.
+    They are created again by the constructors with the arguments
+    returned by the :meth:`_init_args` method,
+    without parsing the expression again.
+    The subclass should override it if the constructor takes other arguments.
+
+    >>> import pickle
+    >>> p = pickle.loads(pickle.dumps(Root().Name("a").Predicate(Self() > 1)))
+    >>> p
+    JSONPath('$.a[@ > 1]', '[@ > 1]')
+    >>> p.find({"a": [1, 2, 3]})
+    [2, 3]
     """
 
+    __slots__ = ("left", "ref_right", "ref_begin", "frozen", "__weakref__")
+
     def __init__(self) -> None:
         self.left: Optional[Expr] = None
         self.ref_right: Optional[ReferenceType[Expr]] = None
         self.ref_begin: Optional[ReferenceType[Expr]] = None
+        # the shared expr (e.g., the cached one) is copied before chaining
+        self.frozen = False
 
     def __repr__(self) -> str:
         args = [self.get_expression(), self._get_partial_expression()]
@@ -222,19 +774,62 @@ class Expr(metaclass=ExprMeta):
     def _get_partial_expression(self) -> str:
         raise NotImplementedError
 
-    @abstractmethod
-    def find(self, element: Any) -> List[Any]:
+    def find(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional["DocumentIndex"] = None,
+    ) -> List[Any]:
         """
         Find target data by the JSONPath expression.
 
+        >>> Root().Array().find([1, 2, 3, 4], limit=2, offset=1)
+        [2, 3]
+
         :param element: Root data where target data found from
         :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+            The finding stops once the limit is reached.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :mod:`jsonpath.index`
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
 
         :returns: A list of target data
         :rtype: List[Any]
+        :raises ValueError: The limit or the offset is negative,
+            or the index is not built for the root data.
+        """
+        raise NotImplementedError
+
+    def _find(self, element: Any, ctx: _Context) -> Iterable[Any]:
+        """
+        Find target data by the part of expr itself,
+        with the state of the finding process.
+        The built-in expr classes implement it instead of the :meth:`find`.
+
+        It returns an empty result if it finds nothing,
+        instead of raising :exc:`JSONPathFindError` like the :meth:`find` may do,
+        so the misses in the sparse data are cheap.
         """
         raise NotImplementedError
 
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> Iterable[Tuple[T_LOCATION, Any]]:
+        """
+        Same as the :meth:`_find` but finds target data with their locations,
+        the location of the element is given.
+        The parts of expr that select the data in the root data implement it,
+        the rest ones (e.g., :class:`Compare`) create the target data.
+        """
+        raise JSONPathError(
+            f"{self.get_expression()!r} finds the data not located in the root data"
+        )
+
     def find_first(self, element: Any) -> Any:
         """
         Find first target data by the JSONPath expression.
@@ -253,35 +848,286 @@ class Expr(metaclass=ExprMeta):
 
         return rv
 
-    def find_iter(self, element: Any) -> Generator[Any, None, None]:
+    def find_iter(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional["DocumentIndex"] = None,
+    ) -> Generator[Any, None, None]:
         """
         Iterable find target data by the JSONPath expression.
 
         :param element: Root data where target data found from
         :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :mod:`jsonpath.index`
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
 
         :returns: the generator of target data list
         :rtype: Generator[Any, None, None]
+        :raises ValueError: The limit or the offset is negative,
+            or the index is not built for the root data.
         """
         # the chained expr begins to find
-        begin = self.get_begin()
+        rv = _dfs_find(self.get_begin(), [element], _get_context(element, index))
+        if limit is None and not offset:
+            yield from rv
+        else:
+            yield from _limit(rv, limit, offset)
 
-        token_root = None
-        try:
-            ctx_root.get()
-        except LookupError:
-            # set the root element when the chained expr begins to find.
-            # the partial exprs of the nested expr
-            # can execute find method many times
-            # but only the first time finding can set the root element.
-            token_root = ctx_root.set(element)
+    def find_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Tuple[T_PATH, Any]]:
+        """
+        Find target data with their paths by the JSONPath expression.
+        The path is the tuple of the keys and the indices from the root data.
 
-        try:
-            with temporary_set(ctx_finding, True):
-                yield from _dfs_find(begin, [element])
-        finally:
-            if token_root:
-                ctx_root.reset(token_root)
+        >>> p = Root().Name("a").Array().Name("b")
+        >>> p.find_with_paths({"a": [{"b": 1}, {}, {"b": 2}]})
+        [(('a', 0, 'b'), 1), (('a', 2, 'b'), 2)]
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+
+        :returns: A list of the paths and the target data
+        :rtype: List[Tuple[Tuple[Union[str, int], ...], Any]]
+        :raises JSONPathError: The target data is not located in the root data,
+            e.g., the results of the comparisons.
+        :raises ValueError: The limit or the offset is negative
+        """
+        return list(self.find_iter_with_paths(element, limit=limit, offset=offset))
+
+    def find_iter_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> Generator[Tuple[T_PATH, Any], None, None]:
+        """
+        Iterable find target data with their paths by the JSONPath expression.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+
+        :returns: the generator of the paths and the target data
+        :rtype: Generator[Tuple[Tuple[Union[str, int], ...], Any], None, None]
+        :raises JSONPathError: The target data is not located in the root data
+        :raises ValueError: The limit or the offset is negative
+        """
+        rv: Iterable[Tuple[T_LOCATION, Any]] = _dfs_find_locations(
+            self.get_begin(), [(None, element)], _get_context(element)
+        )
+        if limit is not None or offset:
+            rv = _limit(rv, limit, offset)
+
+        for location, found in rv:
+            yield _get_path(location), found
+
+    def _find_locations_in_root(self, element: Any) -> List[Tuple[T_LOCATION, Any]]:
+        return list(
+            _dfs_find_locations(
+                self.get_begin(), [(None, element)], _get_context(element)
+            )
+        )
+
+    def update(self, element: Any, value: Any) -> Any:
+        """
+        Replace target data found by the JSONPath expression with the value,
+        or with the results of the value if it is callable.
+        The containers of target data are changed in place.
+
+        >>> data = {"a": [{"b": 1}, {"b": 2}]}
+        >>> Root().Name("a").Array().Name("b").update(data, 0)
+        {'a': [{'b': 0}, {'b': 0}]}
+        >>> Root().Name("a").Array().Name("b").update(data, lambda b: b + 1)
+        {'a': [{'b': 1}, {'b': 1}]}
+        >>> data
+        {'a': [{'b': 1}, {'b': 1}]}
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param value: The new value, or the function to get it from target data
+        :type value: Any
+
+        :returns: The root data, or the new value if target data is the root data.
+        :rtype: Any
+        :raises JSONPathError: Target data is not located in the root data,
+            e.g., the results of the comparisons.
+        """
+        func = value if callable(value) else lambda _: value
+        return _transform(self._find_locations_in_root(element), element, func)
+
+    def updated(self, element: Any, value: Any) -> Any:
+        """
+        Same as the :meth:`update` but the root data is not changed,
+        it returns the updated copy of the root data instead.
+        Only the containers on the paths of target data are copied,
+        the rest data are shared with the root data.
+
+        >>> data = {"a": [{"b": 1}, {"b": 2}], "c": {"d": 1}}
+        >>> rv = Root().Name("a").Array(0).Name("b").updated(data, 0)
+        >>> rv
+        {'a': [{'b': 0}, {'b': 2}], 'c': {'d': 1}}
+        >>> data
+        {'a': [{'b': 1}, {'b': 2}], 'c': {'d': 1}}
+        >>> rv["c"] is data["c"] and rv["a"][1] is data["a"][1]
+        True
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param value: The new value, or the function to get it from target data
+        :type value: Any
+
+        :returns: The updated copy of the root data, or the root data itself
+            if nothing is found.
+        :rtype: Any
+        :raises JSONPathError: Target data is not located in the root data
+        """
+        func = value if callable(value) else lambda _: value
+        return _updated(self._find_locations_in_root(element), element, func)
+
+    def transform(self, element: Any, func: Callable[[Any], Any]) -> Any:
+        """
+        Replace target data found by the JSONPath expression
+        with the results of the function.
+        The containers of target data are changed in place.
+
+        All target data are found before replacing them,
+        and the inner ones are replaced before the outer ones containing them.
+
+        >>> data = {"a": {"a": 1}}
+        >>> Root().Search(Name("a")).transform(data, lambda a: [a])
+        {'a': [{'a': [1]}]}
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param func: The function to get the new value from target data
+        :type func: Callable[[Any], Any]
+
+        :returns: The root data, or the new value if target data is the root data.
+        :rtype: Any
+        :raises JSONPathError: Target data is not located in the root data
+        """
+        return _transform(self._find_locations_in_root(element), element, func)
+
+    def delete(self, element: Any) -> Any:
+        """
+        Delete target data found by the JSONPath expression from their containers,
+        which are changed in place.
+
+        >>> data = {"a": [1, 2, 3, 4], "b": 1}
+        >>> Root().Name("a").Predicate(Self() > 1).delete(data)
+        {'a': [1], 'b': 1}
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: The root data
+        :rtype: Any
+        :raises JSONPathError: Target data is not located in the root data,
+            or it is the root data.
+        """
+        _delete(self._find_locations_in_root(element))
+        return element
+
+    def exists(self, element: Any) -> bool:
+        """
+        Check whether the JSONPath expression finds any target data,
+        the finding stops at the first target data.
+
+        >>> p = Root().Predicate(Name("price") > 10)
+        >>> p.exists([{"price": 1}, {"price": 20}])
+        True
+        >>> p.exists([{"price": 1}])
+        False
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: Whether any target data is found
+        :rtype: bool
+        """
+        for _ in self.find_iter(element):
+            return True
+
+        return False
+
+    def count(self, element: Any) -> int:
+        """
+        Count target data found by the JSONPath expression,
+        without collecting them into a list.
+
+        >>> Root().Search(Name("a")).count({"a": {"a": 1}, "b": [{"a": 2}]})
+        3
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: The number of target data
+        :rtype: int
+        """
+        return _dfs_count(self.get_begin(), [element], _get_context(element))
+
+    def bind(self, **params: Any) -> "BoundExpr":
+        """
+        Bind the values of the parameters in the JSONPath expression.
+
+        >>> p = Root().Predicate(Name("price") > Parameter("min_price"))
+        >>> p.bind(min_price=10).find([{"price": 1}, {"price": 20}])
+        [{'price': 20}]
+
+        :param params: The values of the parameters by their names
+        :type params: Any
+
+        :returns: The expression with its parameters bound.
+        :rtype: :class:`BoundExpr`
+        """
+        return BoundExpr(self, params)
+
+    def compile(self) -> "CompiledExpr":
+        """
+        Compile the JSONPath expression into specialized Python functions,
+        which find the same target data much faster.
+
+        >>> p = Root().Name("a").Predicate(Self() > 1).compile()
+        >>> p.find({"a": [1, 2, 3]})
+        [2, 3]
+
+        :returns: The compiled expression.
+        :rtype: :class:`jsonpath.compiler.CompiledExpr`
+        """
+        # Local Folder
+        from .compiler import compile_expr
+
+        return compile_expr(self)
+
+    def optimize(self) -> "Expr":
+        """
+        Rewrite the JSONPath expression into an equivalent but cheaper one.
+
+        >>> p = Root().Name("a").Predicate(Not(Not(Name("b")))).optimize()
+        >>> print(p.get_expression())
+        $.a[b]
+        >>> p.find({"a": [{"b": 1}, {"b": 0}]})
+        [{'b': 1}]
+
+        :returns: The optimized expression.
+        :rtype: :class:`jsonpath.core.Expr`
+        """
+        # Local Folder
+        from .optimizer import optimize_expr
+
+        return optimize_expr(self)
 
     def get_begin(self) -> "Expr":
         """
@@ -312,12 +1158,29 @@ class Expr(metaclass=ExprMeta):
         """
         Chain the next part of expr as a combined expr.
 
+        The combined expr is copied before chaining
+        if it is frozen or the parts are chained after it already,
+        so the exprs sharing it stay unchanged.
+
+        >>> expr = Root().Name("a")
+        >>> expr.frozen = True
+        >>> expr.Name("b").get_expression()
+        '$.a.b'
+        >>> expr.get_expression()
+        '$.a'
+
         :param next_expr: The next part of expr in the combined expr.
         :type next_expr: :class:`jsonpath.core.Expr`
 
         :returns: The next part of expr in the combined expr.
         :rtype: :class:`jsonpath.core.Expr`
         """
+        if self.frozen or self.get_next() is not None:
+            return self._copy_chain().chain(next_expr)
+
+        if next_expr.frozen:
+            next_expr = next_expr._copy_part()
+
         if self.ref_begin is None:
             # the unchained expr become the first expr in chain
             self.ref_begin = weakref.ref(self)
@@ -331,6 +1194,66 @@ class Expr(metaclass=ExprMeta):
         self.ref_right = weakref.ref(next_expr)
         return next_expr
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        """
+        Get the arguments of the constructor to create the part of expr again.
+        """
+        return ()
+
+    def _copy_part(self: T) -> T:
+        """
+        Copy the part of expr itself without its chain,
+        the arguments of the part are shared.
+        """
+        return type(self)(*self._init_args())
+
+    def _copy_chain(self) -> "Expr":
+        """
+        Copy the combined expr until the part itself.
+        """
+        _, (parts,) = self.__reduce__()
+        return _rebuild_chain(parts)
+
+    def __reduce__(self) -> Tuple[Callable[..., "Expr"], Tuple[Any, ...]]:
+        parts = []
+        expr: Optional[Expr] = self
+        while expr is not None:
+            parts.append((type(expr), expr._init_args()))
+            expr = expr.left
+
+        parts.reverse()
+        return _rebuild_chain, (tuple(parts),)
+
+    def key(self) -> Tuple[Any, ...]:
+        """
+        Get the structural key of the expr with the parts chained before it,
+        which is hashable and the same for the structurally equal exprs.
+        Use it instead of the expr itself as the key of the dict,
+        the comparison operators of the expr create the :class:`Compare`.
+
+        >>> Root().Name("a").key() == Root().Name("a").key()
+        True
+        >>> Root().Name("a").key() == Root().Name("b").key()
+        False
+
+        :returns: The classes and the arguments of the parts in order.
+        :rtype: Tuple[Any, ...]
+        """
+        parts = []
+        expr: Optional[Expr] = self
+        while expr is not None:
+            parts.append((type(expr), tuple(map(_get_key, expr._init_args()))))
+            expr = expr.left
+
+        parts.reverse()
+        return tuple(parts)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Expr":
+        _, (parts,) = self.__reduce__()
+        return _rebuild_chain(
+            tuple((cls, copy.deepcopy(args, memo)) for cls, args in parts)
+        )
+
     def __getattr__(self, name: str) -> Callable[..., "Expr"]:
         """
         Create combined expr in a serial of chain class creations
@@ -347,31 +1270,428 @@ class Expr(metaclass=ExprMeta):
         if name not in Expr._classes:
             return super().__getattribute__(name)  # for raising AttributeError
 
-        cls = Expr._classes[name]
+        cls = Expr._classes[name]
+
+        def cls_(*args: Any, **kwargs: Any) -> Expr:
+            expr = cls(*args, **kwargs)
+            return self.chain(next_expr=expr)
+
+        return cls_
+
+    def __lt__(self, value: Any) -> "Expr":
+        return self.LessThan(value)
+
+    def __le__(self, value: Any) -> "Expr":
+        return self.LessEqual(value)
+
+    def __eq__(self, value: Any) -> "Expr":  # type: ignore
+        return self.Equal(value)
+
+    def __ge__(self, value: Any) -> "Expr":
+        return self.GreaterEqual(value)
+
+    def __gt__(self, value: Any) -> "Expr":
+        return self.GreaterThan(value)
+
+    def __ne__(self, value: Any) -> "Expr":  # type: ignore
+        return self.NotEqual(value)
+
+
+def _rebuild_chain(parts: Tuple[Tuple[Type[Expr], Tuple[Any, ...]], ...]) -> Expr:
+    """
+    Create the parts of expr and chain them together,
+    returns the last part.
+    """
+    expr: Optional[Expr] = None
+    for cls, args in parts:
+        part = cls(*args)
+        expr = part if expr is None else expr.chain(part)
+
+    assert expr is not None
+    return expr
+
+
+def _get_key(value: Any) -> Any:
+    """
+    Get the structural key of the argument of the part of expr.
+    """
+    if isinstance(value, Expr):
+        return value.key()
+    elif isinstance(value, str):
+        # the Lark tokens are the subclass of str
+        return (str, str(value))
+    elif isinstance(value, float):
+        # "nan" is not equal to itself
+        return (float, repr(value))
+    elif isinstance(value, (tuple, list)):
+        return (type(value), tuple(map(_get_key, value)))
+
+    return (type(value), value)
+
+
+class ExprInterner:
+    """
+    The table of the interned exprs,
+    the structurally equal exprs and sub-exprs are stored once.
+
+    The interned expr is created again with the interned sub-exprs
+    (e.g., the operands in the predicate) and the interned strings,
+    so the exprs loaded in bulk share their common parts.
+    The table holds the interned exprs weakly,
+    they are dropped once no expr uses them.
+
+    >>> interner = ExprInterner()
+    >>> a = interner.intern(Root().Predicate(Name("a") > Root().Name("limit")))
+    >>> b = interner.intern(Root().Predicate(Name("b") > Root().Name("limit")))
+    >>> a.expr.target is b.expr.target
+    True
+    >>> interner.intern(Root().Predicate(Name("a") > Root().Name("limit"))) is a
+    True
+
+    The parts of the chained expr refer to each other,
+    so the chains are shared only as a whole.
+    The interned exprs are frozen,
+    chaining new parts onto them copies them first
+    and leaves the shared ones unchanged.
+
+    >>> a.Name("b").get_expression()
+    '$[a > $.limit].b'
+    >>> a.get_expression()
+    '$[a > $.limit]'
+    """
+
+    def __init__(self) -> None:
+        self._entries: "weakref.WeakValueDictionary[Tuple[Any, ...], Expr]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    def intern(self, expr: T) -> T:
+        """
+        Get the interned expr structurally equal to the expr
+        with the parts chained before it.
+
+        :param expr: The expr to intern
+        :type expr: :class:`Expr`
+
+        :returns: The interned expr, the expr itself or the one interned before.
+        :rtype: :class:`Expr`
+        """
+        parts = []
+        node: Optional[Expr] = expr
+        while node is not None:
+            parts.append(node)
+            node = node.left
+
+        parts.reverse()
+        rebuilt = []
+        keys: List[Any] = []
+        unchanged = expr.ref_right is None
+        for part in parts:
+            init_args = part._init_args()
+            args = tuple(map(self._intern_arg, init_args))
+            unchanged = unchanged and all(map(operator.is_, args, init_args))
+            rebuilt.append((type(part), args))
+            # the flat key is smaller than the nested one
+            keys.append(type(part))
+            keys.append(len(args))
+            keys.extend(map(self._get_key, args))
+
+        key = tuple(keys)
+        interned = self._entries.get(key)
+        if interned is None:
+            interned = expr if unchanged else _rebuild_chain(tuple(rebuilt))
+            interned = self._entries.setdefault(key, interned)
+            node = interned
+            while node is not None:
+                node.frozen = True
+                node = node.left
+
+        return cast(T, interned)
+
+    def _intern_arg(self, value: Any) -> Any:
+        if isinstance(value, Expr):
+            return self.intern(value)
+        elif isinstance(value, str):
+            return sys.intern(str(value))
+        elif isinstance(value, (tuple, list)):
+            return type(value)(map(self._intern_arg, value))
+
+        return value
+
+    def _get_key(self, value: Any) -> Any:
+        if isinstance(value, Expr):
+            # the interned sub-expr is unique in the table,
+            # and kept alive by the exprs using it.
+            return (Expr, id(value))
+        elif isinstance(value, str):
+            # the string is never equal to the other arguments
+            return value
+        elif isinstance(value, (tuple, list)):
+            return (type(value), tuple(map(self._get_key, value)))
+
+        return _get_key(value)
+
+    def clear(self) -> None:
+        """
+        Clear the table, the interned exprs are not changed.
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class BoundExpr:
+    """
+    The JSONPath expression with the values of its parameters bound,
+    created by :meth:`Expr.bind`.
+
+    >>> p = Root().Predicate(Self() > Parameter("min")).bind(min=1)
+    >>> p
+    BoundJSONPath('$[@ > $min]', {'min': 1})
+    >>> p.find([0, 1, 2])
+    [2]
+    >>> p.bind(min=0).find([0, 1, 2])
+    [1, 2]
+
+    .. automethod:: find
+    .. automethod:: find_first
+    .. automethod:: find_iter
+    .. automethod:: find_with_paths
+    .. automethod:: find_iter_with_paths
+    .. automethod:: exists
+    .. automethod:: count
+    .. automethod:: update
+    .. automethod:: updated
+    .. automethod:: transform
+    .. automethod:: delete
+    .. automethod:: bind
+    .. automethod:: get_expression
+
+    :param expr: The expression or the compiled expression
+    :type expr: Union[:class:`Expr`, :class:`jsonpath.compiler.CompiledExpr`]
+    :param params: The values of the parameters by their names
+    :type params: Mapping[str, Any]
+    """
+
+    def __init__(
+        self, expr: Union[Expr, "CompiledExpr"], params: Mapping[str, Any]
+    ) -> None:
+        self.expr = expr
+        self.params = dict(params)
+
+    def __repr__(self) -> str:
+        return f"BoundJSONPath({self.get_expression()!r}, {self.params!r})"
+
+    def get_expression(self) -> str:
+        """
+        Get full JSONPath expression.
+        """
+        return self.expr.get_expression()
+
+    def bind(self, **params: Any) -> "BoundExpr":
+        """
+        Bind the values of more parameters, or rebind the bound ones.
+
+        :returns: The expression with its parameters bound.
+        :rtype: :class:`BoundExpr`
+        """
+        return BoundExpr(self.expr, {**self.params, **params})
+
+    def find(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional["DocumentIndex"] = None,
+    ) -> List[Any]:
+        """
+        Find target data by the JSONPath expression with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :mod:`jsonpath.index`
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
+
+        :returns: A list of target data
+        :rtype: List[Any]
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            if index is None:
+                # the generated queries (see jsonpath.aot) take no index
+                return self.expr.find(element, limit=limit, offset=offset)
+
+            return self.expr.find(element, limit=limit, offset=offset, index=index)
+
+    def find_first(self, element: Any) -> Any:
+        """
+        Find first target data by the JSONPath expression with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: the first target data
+        :rtype: Any
+        :raises JSONPathFindError: Found nothing
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.find_first(element)
+
+    def find_iter(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional["DocumentIndex"] = None,
+    ) -> Generator[Any, None, None]:
+        """
+        Iterable find target data by the JSONPath expression
+        with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+        :param index: The index of the root data, see :mod:`jsonpath.index`
+        :type index: Optional[:class:`jsonpath.index.DocumentIndex`]
+
+        :returns: the generator of target data list
+        :rtype: Generator[Any, None, None]
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            if index is None:
+                yield from self.expr.find_iter(element, limit=limit, offset=offset)
+            else:
+                yield from self.expr.find_iter(
+                    element, limit=limit, offset=offset, index=index
+                )
+
+    def find_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Tuple[T_PATH, Any]]:
+        """
+        Find target data with their paths by the JSONPath expression
+        with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+
+        :returns: A list of the paths and the target data
+        :rtype: List[Tuple[Tuple[Union[str, int], ...], Any]]
+        :raises JSONPathError: The target data is not located in the root data
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.find_with_paths(element, limit=limit, offset=offset)
+
+    def find_iter_with_paths(
+        self, element: Any, *, limit: Optional[int] = None, offset: int = 0
+    ) -> Generator[Tuple[T_PATH, Any], None, None]:
+        """
+        Iterable find target data with their paths by the JSONPath expression
+        with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+        :param limit: The maximum number of target data, no limit if it is None.
+        :type limit: Optional[int]
+        :param offset: The number of target data skipped at the beginning
+        :type offset: int
+
+        :returns: the generator of the paths and the target data
+        :rtype: Generator[Tuple[Tuple[Union[str, int], ...], Any], None, None]
+        :raises JSONPathError: The target data is not located in the root data
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            yield from self.expr.find_iter_with_paths(
+                element, limit=limit, offset=offset
+            )
+
+    def exists(self, element: Any) -> bool:
+        """
+        Check whether the JSONPath expression with the bound parameters
+        finds any target data.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: Whether any target data is found
+        :rtype: bool
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.exists(element)
+
+    def count(self, element: Any) -> int:
+        """
+        Count target data found by the JSONPath expression
+        with the bound parameters.
+
+        :param element: Root data where target data found from
+        :type element: Any
+
+        :returns: The number of target data
+        :rtype: int
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.count(element)
 
-        def cls_(*args: Any, **kwargs: Any) -> Expr:
-            expr = cls(*args, **kwargs)
-            return self.chain(next_expr=expr)
+    def update(self, element: Any, value: Any) -> Any:
+        """
+        Replace target data found by the JSONPath expression
+        with the bound parameters, see :meth:`Expr.update`.
 
-        return cls_
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.update(element, value)
 
-    def __lt__(self, value: Any) -> "Expr":
-        return self.LessThan(value)
+    def updated(self, element: Any, value: Any) -> Any:
+        """
+        Get the updated copy of the root data by the JSONPath expression
+        with the bound parameters, see :meth:`Expr.updated`.
 
-    def __le__(self, value: Any) -> "Expr":
-        return self.LessEqual(value)
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.updated(element, value)
 
-    def __eq__(self, value: Any) -> "Expr":  # type: ignore
-        return self.Equal(value)
+    def transform(self, element: Any, func: Callable[[Any], Any]) -> Any:
+        """
+        Replace target data found by the JSONPath expression
+        with the bound parameters, see :meth:`Expr.transform`.
 
-    def __ge__(self, value: Any) -> "Expr":
-        return self.GreaterEqual(value)
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.transform(element, func)
 
-    def __gt__(self, value: Any) -> "Expr":
-        return self.GreaterThan(value)
+    def delete(self, element: Any) -> Any:
+        """
+        Delete target data found by the JSONPath expression
+        with the bound parameters, see :meth:`Expr.delete`.
 
-    def __ne__(self, value: Any) -> "Expr":  # type: ignore
-        return self.NotEqual(value)
+        :raises JSONPathUnboundParameterError: The parameter is not bound
+        """
+        with temporary_set(ctx_params, self.params):
+            return self.expr.delete(element)
 
 
 class Value(Expr):
@@ -400,17 +1720,76 @@ class Value(Expr):
 
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: T_VALUE) -> None:
         super().__init__()
         self.value = value
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.value,)
+
     def _get_partial_expression(self) -> str:
         return json.dumps(self.value)
 
-    def find(self, element: Any) -> List[Any]:
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
         return [self.value]
 
 
+PARAMETER_NAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _get_parameter(name: str, params: Optional[Mapping[str, Any]] = None) -> Any:
+    if params is None:
+        params = ctx_params.get()
+
+    if name not in params:
+        raise JSONPathUnboundParameterError(f"Parameter {name!r} is not bound")
+
+    return params[name]
+
+
+class Parameter(Expr):
+    """
+    Represent the parameter in the expression,
+    its value is bound on finding by :meth:`Expr.bind`.
+
+    One expression serves the findings with different values,
+    instead of formatting them into the expression and parsing it every time.
+
+    >>> p = Root().Name("orders").Predicate(Name("customer") == Parameter("id"))
+    >>> print(p.get_expression())
+    $.orders[customer = $id]
+    >>> p.bind(id=42).find({"orders": [{"customer": 42}, {"customer": 7}]})
+    [{'customer': 42}]
+    >>> p.find({"orders": [{"customer": 42}]})
+    Traceback (most recent call last):
+        ...
+    jsonpath.core.JSONPathUnboundParameterError: Parameter 'id' is not bound
+
+    :param name: The name of the parameter
+    :type name: str
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        super().__init__()
+        if not PARAMETER_NAME_PATTERN.fullmatch(name):
+            raise ValueError(f"{name!r} is not a valid parameter name")
+
+        self.name = name
+
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.name,)
+
+    def _get_partial_expression(self) -> str:
+        return f"${self.name}"
+
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
+        return [_get_parameter(self.name, ctx.params)]
+
+
 class Root(Expr):
     """
     Represent the root of data.
@@ -422,11 +1801,18 @@ class Root(Expr):
 
     """
 
+    __slots__ = ()
+
     def _get_partial_expression(self) -> str:
         return "$"
 
-    def find(self, element: Any) -> List[Any]:
-        return [ctx_root.get()]
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
+        return [ctx.root]
+
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> List[Tuple[T_LOCATION, Any]]:
+        return [(None, ctx.root)]
 
 
 class Name(Expr):
@@ -452,10 +1838,15 @@ class Name(Expr):
 
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: Optional[str] = None) -> None:
         super().__init__()
         self.name = name
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.name,)
+
     def _get_partial_expression(self) -> str:
         if self.name is None:
             return "*"
@@ -466,18 +1857,86 @@ class Name(Expr):
 
         return name
 
-    def find(self, element: Any) -> List[Any]:
+    def _find(self, element: Any, ctx: _Context) -> Iterable[Any]:
         if not isinstance(element, dict):
-            raise JSONPathFindError
+            return []
 
         if self.name is None:
-            return list(element.values())
+            # the view of the values, instead of the copy
+            return element.values()
 
         if self.name not in element:
-            raise JSONPathFindError
+            return []
 
         return [element[self.name]]
 
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> Iterable[Tuple[T_LOCATION, Any]]:
+        if not isinstance(element, dict):
+            return []
+
+        if self.name is None:
+            return _get_children_locations(element, location)
+
+        if self.name not in element:
+            return []
+
+        return [((location, element, self.name), element[self.name])]
+
+
+class NamePath(Expr):
+    """
+    Represent the data of the nested field names,
+    same as the consecutive :class:`Name` but looks up them in one step.
+
+    :param names: The field names of the data, from outer to inner.
+    :type names: str
+
+    >>> p = NamePath("a", "b"); print(p.get_expression())
+    a.b
+    >>> p.find({"a": {"b": 1}})
+    [1]
+    >>> p.find({"a": {"c": 1}})
+    []
+
+    """
+
+    __slots__ = ("names",)
+
+    def __init__(self, *names: str) -> None:
+        super().__init__()
+        if not names:
+            raise TypeError("NamePath() takes at least 1 argument")
+        self.names = names
+
+    def _init_args(self) -> Tuple[Any, ...]:
+        return self.names
+
+    def _get_partial_expression(self) -> str:
+        return ".".join(Name(name)._get_partial_expression() for name in self.names)
+
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
+        for name in self.names:
+            if not isinstance(element, dict) or name not in element:
+                return []
+
+            element = element[name]
+
+        return [element]
+
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> List[Tuple[T_LOCATION, Any]]:
+        for name in self.names:
+            if not isinstance(element, dict) or name not in element:
+                return []
+
+            location = (location, element, name)
+            element = element[name]
+
+        return [(location, element)]
+
 
 class Array(Expr):
     """
@@ -507,6 +1966,8 @@ class Array(Expr):
 
     """
 
+    __slots__ = ("idx",)
+
     def __init__(self, idx: Optional[Union[int, "Slice"]] = None) -> None:
         super().__init__()
         if idx is not None and not isinstance(idx, (int, Slice)):
@@ -516,6 +1977,9 @@ class Array(Expr):
             )
         self.idx = idx
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.idx,)
+
     def _get_partial_expression(self) -> str:
         if self.idx is None:
             return "[*]"
@@ -525,9 +1989,9 @@ class Array(Expr):
             )
             return f"[{idx_str}]"
 
-    def find(self, element: Any) -> List[Any]:
+    def _find(self, element: Any, ctx: _Context) -> Iterable[Any]:
         if not isinstance(element, list):
-            raise JSONPathFindError
+            return []
 
         if self.idx is None:
             return element
@@ -535,9 +1999,27 @@ class Array(Expr):
             with suppress(IndexError):
                 return [element[self.idx]]
         elif isinstance(self.idx, Slice):
-            return self.idx.find(element)
+            return self.idx._find(element, ctx)
+
+        return []
+
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> Iterable[Tuple[T_LOCATION, Any]]:
+        if not isinstance(element, list):
+            return []
+
+        if self.idx is None:
+            return _get_children_locations(element, location)
+        elif isinstance(self.idx, int):
+            # the negative index is located by its positive one
+            idx = self.idx + len(element) if self.idx < 0 else self.idx
+            if 0 <= idx < len(element):
+                return [((location, element, idx), element[idx])]
+        elif isinstance(self.idx, Slice):
+            return self.idx._find_locations(element, location, ctx)
 
-        raise JSONPathFindError
+        return []
 
 
 class Predicate(Expr):
@@ -566,38 +2048,101 @@ class Predicate(Expr):
     [{'a': 1}]
     """
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr: Union["Compare", Expr]) -> None:
         super().__init__()
         if not isinstance(expr, Expr):
             raise TypeError('"expr" parameter must be an instance of the "Expr" class.')
         self.expr = expr
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.expr,)
+
     def _get_partial_expression(self) -> str:
         return f"[{self.expr.get_expression()}]"
 
-    def find(self, element: Union[List[Any], Dict[str, Any]]) -> List[Any]:
-        filtered_items = []
+    def _find(
+        self, element: Union[List[Any], Dict[str, Any]], ctx: _Context
+    ) -> Iterator[Any]:
         items: Union[Iterator[tuple[str, Any]], Iterator[tuple[int, Any]]]
         if isinstance(element, list):
+            if ctx.index is not None and ctx.index.planner:
+                found = _lookup_items(self.expr, element, ctx)
+                if found is not None:
+                    return iter(found)
+
             items = iter(enumerate(element))
         elif isinstance(element, dict):
             items = iter(element.items())
         else:
-            raise JSONPathFindError
+            return iter(())
+
+        return _filter(self.expr, items, ctx.parent, ctx)
+
+    def _find_locations(
+        self,
+        element: Union[List[Any], Dict[str, Any]],
+        location: T_LOCATION,
+        ctx: _Context,
+    ) -> Iterator[Tuple[T_LOCATION, Any]]:
+        items: Union[Iterator[tuple[str, Any]], Iterator[tuple[int, Any]]]
+        if isinstance(element, list):
+            items = iter(enumerate(element))
+        elif isinstance(element, dict):
+            items = iter(element.items())
+        else:
+            return iter(())
+
+        return _filter_locations(self.expr, items, location, element, ctx.parent, ctx)
+
+
+def _filter(
+    expr: Expr, items: Iterator[Tuple[Any, Any]], parent: Any, ctx: _Context
+) -> Generator[Any, None, None]:
+    """
+    Filter the items lazily by the expr.
+
+    The consumer changes the context while the items are filtered,
+    so the parent of the items when the filtering begins is restored
+    for every item, and the context is restored before yielding.
+    """
+    for item in items:
+        outer_parent, outer_item = ctx.parent, ctx.item
+        # save the current item into the context for Self()
+        ctx.parent, ctx.item = parent, item
+        try:
+            # start new finding process for the nested expr
+            rv = _find_first(expr, item[1], ctx)
+        finally:
+            ctx.parent, ctx.item = outer_parent, outer_item
 
-        for item in items:
-            # save the current item into ctx_self for Self()
-            with temporary_set(ctx_self, item):
-                _, value = item
-                # set ctx_finding False to
-                # start new finding process for the nested expr: self.idx
-                with temporary_set(ctx_finding, False):
-                    rv = self.expr.find(value)
+        if rv is not _MISSING and rv:
+            yield item[1]
 
-                if rv and rv[0]:
-                    filtered_items.append(value)
 
-        return filtered_items
+def _filter_locations(
+    expr: Expr,
+    items: Iterator[Tuple[Any, Any]],
+    location: T_LOCATION,
+    container: Any,
+    parent: Any,
+    ctx: _Context,
+) -> Generator[Tuple[T_LOCATION, Any], None, None]:
+    """
+    Same as :func:`_filter` but yields the items with their locations
+    in the container at the location.
+    """
+    for item in items:
+        outer_parent, outer_item = ctx.parent, ctx.item
+        ctx.parent, ctx.item = parent, item
+        try:
+            rv = _find_first(expr, item[1], ctx)
+        finally:
+            ctx.parent, ctx.item = outer_parent, outer_item
+
+        if rv is not _MISSING and rv:
+            yield (location, container, item[0]), item[1]
 
 
 class Slice(Expr):
@@ -608,6 +2153,8 @@ class Slice(Expr):
     .. _Python slice(range): https://docs.python.org/3/library/stdtypes.html#ranges
     """
 
+    __slots__ = ("start", "stop", "step")
+
     def __init__(
         self,
         start: Union[Expr, int, None] = None,
@@ -619,6 +2166,9 @@ class Slice(Expr):
         self.stop = stop
         self.step = step
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.start, self.stop, self.step)
+
     def _get_partial_expression(self) -> str:
         parts = []
         if self.start:
@@ -648,29 +2198,72 @@ class Slice(Expr):
 
         return ":".join(parts)
 
-    def _ensure_int_or_none(self, value: Union[Expr, int, None]) -> Union[int, None]:
+    def _ensure_int_or_none(
+        self, value: Union[Expr, int, None], ctx: _Context
+    ) -> Union[int, None]:
+        """
+        Get the value of the part of the slice,
+        or the :data:`_MISSING` if the expr does not find an integer.
+        """
         if isinstance(value, Expr):
-            # set ctx_finding False to start new finding process for the nested expr
-            with temporary_set(ctx_finding, False):
-                found_elements = value.find(ctx_parent.get())
-            if not found_elements or not isinstance(found_elements[0], int):
-                raise JSONPathFindError
-            return found_elements[0]
+            # start new finding process for the nested expr
+            found = _find_operand(value, ctx.get_parent(), ctx)
+            if not isinstance(found, int):
+                return _MISSING
+            return found
         else:
             return value
 
-    def find(self, element: List[Any]) -> List[Any]:
+    def _get_bounds(
+        self, element: List[Any], ctx: _Context
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Get the start, the end and the step of the slice on the array,
+        or :data:`None` if any of them is not an integer.
+        """
+        start = self._ensure_int_or_none(self.start, ctx)
+        if start is _MISSING:
+            return None
+        end = self._ensure_int_or_none(self.stop, ctx)
+        if end is _MISSING:
+            return None
+        step = self._ensure_int_or_none(self.step, ctx)
+        if step is _MISSING:
+            return None
+
+        return start or 0, len(element) if end is None else end, step or 1
+
+    def _find(self, element: List[Any], ctx: _Context) -> Iterable[Any]:
+        # Slice.find apply on list only.
         if not isinstance(element, list):
-            raise JSONPathFindError("Slice.find apply on list only.")
+            return []
+
+        bounds = self._get_bounds(element, ctx)
+        if bounds is None:
+            return []
+
+        start, end, step = bounds
+        # the lazy view of the items, instead of the copy
+        if start >= 0 and end >= 0 and step > 0:
+            return islice(element, start, end, step)
+
+        return map(element.__getitem__, range(len(element))[start:end:step])
 
-        start = self._ensure_int_or_none(self.start) or 0
-        end = self._ensure_int_or_none(self.stop)
-        step = self._ensure_int_or_none(self.step) or 1
+    def _find_locations(
+        self, element: List[Any], location: T_LOCATION, ctx: _Context
+    ) -> Iterable[Tuple[T_LOCATION, Any]]:
+        if not isinstance(element, list):
+            return []
 
-        if end is None:
-            end = len(element)
+        bounds = self._get_bounds(element, ctx)
+        if bounds is None:
+            return []
 
-        return element[start:end:step]
+        start, end, step = bounds
+        return (
+            ((location, element, idx), element[idx])
+            for idx in range(len(element))[start:end:step]
+        )
 
 
 class Brace(Expr):
@@ -713,39 +2306,112 @@ class Brace(Expr):
 
     """
 
+    __slots__ = ("_expr",)
+
     def __init__(self, expr: Expr) -> None:
         super().__init__()
         if not isinstance(expr, Expr):
             raise TypeError('"expr" parameter must be an instance of the "Expr" class.')
         self._expr = expr
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self._expr,)
+
     def _get_partial_expression(self) -> str:
         return f"({self._expr.get_expression()})"
 
-    def find(self, element: Any) -> List[Any]:
-        # set ctx_finding False to
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
         # start new finding process for the nested expr: self.expr
-        with temporary_set(ctx_finding, False):
-            return [self._expr.find(element)]
+        return [_find_chain(self._expr, element, ctx)]
 
 
-def _recursive_find(expr: Expr, element: Any, rv: List[Any]) -> None:
+def _search(
+    expr: Expr, element: Any, parent: Any, max_depth: int, ctx: _Context
+) -> Generator[Any, None, None]:
     """
-    recursive find in every node.
+    Find by the expr in the element and all its descendants in pre-order,
+    the descendants deeper than the max_depth are not searched in
+    unless it is negative.
+
+    The pending descendants are kept in an explicit stack,
+    so the deeply nested data does not exceed the recursion limit,
+    and the walking stops once the consumer stops.
     """
-    try:
-        find_rv = expr.find(element)
-        rv.extend(find_rv)
-    except JSONPathFindError:
-        pass
+    # the pending elements, their parent and their depth
+    stack: List[Tuple[Iterator[Any], Any, int]] = [(iter((element,)), parent, 0)]
+    while stack:
+        iterator, parent, depth = stack[-1]
+        for node in iterator:
+            # the consumer sets the parent for its own finding
+            outer = ctx.parent
+            ctx.parent = parent
+            try:
+                # the lazy result keeps the state it needs, see Predicate
+                found = expr._find(node, ctx)
+            finally:
+                ctx.parent = outer
+
+            yield from found
+
+            if depth == max_depth:
+                continue
+            elif isinstance(node, list):
+                children: Iterator[Any] = iter(node)
+            elif isinstance(node, dict):
+                children = iter(node.values())
+            else:
+                continue
 
-    with temporary_set(ctx_parent, element):
-        if isinstance(element, list):
-            for item in element:
-                _recursive_find(expr, item, rv)
-        elif isinstance(element, dict):
-            for item in element.values():
-                _recursive_find(expr, item, rv)
+            stack.append((children, node, depth + 1))
+            break
+        else:
+            stack.pop()
+
+
+def _get_children_locations(
+    node: Union[List[Any], Dict[str, Any]], location: T_LOCATION
+) -> Iterator[Tuple[T_LOCATION, Any]]:
+    items = enumerate(node) if isinstance(node, list) else node.items()
+    return (((location, node, key), child) for key, child in items)
+
+
+def _search_locations(
+    expr: Expr,
+    element: Any,
+    location: T_LOCATION,
+    parent: Any,
+    max_depth: int,
+    ctx: _Context,
+) -> Generator[Tuple[T_LOCATION, Any], None, None]:
+    """
+    Same as :func:`_search` but finds the target elements with their locations.
+    """
+    stack: List[Tuple[Iterator[Tuple[T_LOCATION, Any]], Any, int]] = [
+        (iter(((location, element),)), parent, 0)
+    ]
+    while stack:
+        iterator, parent, depth = stack[-1]
+        for location, node in iterator:
+            outer = ctx.parent
+            ctx.parent = parent
+            try:
+                found = expr._find_locations(node, location, ctx)
+            finally:
+                ctx.parent = outer
+
+            yield from found
+
+            if depth == max_depth:
+                continue
+            elif isinstance(node, (list, dict)):
+                children = _get_children_locations(node, location)
+            else:
+                continue
+
+            stack.append((children, node, depth + 1))
+            break
+        else:
+            stack.pop()
 
 
 class Search(Expr):
@@ -754,32 +2420,82 @@ class Search(Expr):
 
     :param expr: The expr is used to search in data recursively.
     :type expr: :class:`Expr`
+    :param max_depth: The maximum depth of the descendants to search in,
+        the data itself is at depth 0. No limit if it is None.
+    :type max_depth: Optional[int]
 
     >>> p = Root().Search(Name("a")); print(p.get_expression())
     $..a
     >>> p.find({"a":{"a": 0}})
     [{'a': 0}, 0]
+    >>> p = Root().Search(Name("a"), max_depth=1)
+    >>> p.find({"a": {"a": {"a": 0}}})
+    [{'a': {'a': 0}}, {'a': 0}]
+
+    It finds the target data lazily,
+    the rest data is not searched once the first one is found.
+
+    >>> next(Root().Search(Name("a")).find_iter({"a": 1, "b": {"a": 2}}))
+    1
 
     """
 
-    def __init__(self, expr: Expr) -> None:
+    __slots__ = ("_expr", "max_depth")
+
+    def __init__(self, expr: Expr, max_depth: Optional[int] = None) -> None:
         super().__init__()
         if not isinstance(expr, Expr):
             raise TypeError('"expr" parameter must be an instance of the "Expr" class.')
+        if max_depth is not None and max_depth < 0:
+            raise ValueError('"max_depth" parameter must not be negative')
         # TODO: Not accepts mixed expr
         self._expr = expr
+        self.max_depth = max_depth
+
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self._expr, self.max_depth)
 
     def _get_partial_expression(self) -> str:
         return f"..{self._expr.get_expression()}"
 
-    def find(self, element: Any) -> List[Any]:
-        rv: List[Any] = []
+    def _find(self, element: Any, ctx: _Context) -> Iterable[Any]:
+        max_depth = -1 if self.max_depth is None else self.max_depth
+        name = self._expr.name if type(self._expr) is Name else None
+        if ctx.index is not None and name is not None:
+            # the index finds the same in the indexed data
+            found = ctx.index.search_name(element, name, max_depth)
+            if found is not None:
+                return found
+
         if isinstance(self._expr, Predicate):
-            # filtering find needs to begin on the current element
-            _recursive_find(self._expr, [element], rv)
-        else:
-            _recursive_find(self._expr, element, rv)
-        return rv
+            # filtering find needs to begin on the current element,
+            # which is one level deeper than the wrapping list.
+            if max_depth >= 0:
+                max_depth += 1
+
+            return _search(self._expr, [element], ctx.parent, max_depth, ctx)
+
+        return _search(self._expr, element, ctx.parent, max_depth, ctx)
+
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> Iterator[Tuple[T_LOCATION, Any]]:
+        max_depth = -1 if self.max_depth is None else self.max_depth
+        if not isinstance(self._expr, Predicate):
+            return _search_locations(
+                self._expr, element, location, ctx.parent, max_depth, ctx
+            )
+
+        # the wrapping list is not located in the root data,
+        # so its item, the current element, is filtered separately.
+        wrapper = [element]
+        found = _filter_locations(
+            self._expr.expr, iter(((0, element),)), None, wrapper, ctx.parent, ctx
+        )
+        return chain(
+            ((location, value) for _, value in found),
+            _search_locations(self._expr, element, location, wrapper, max_depth, ctx),
+        )
 
 
 class Self(Expr):
@@ -793,16 +2509,27 @@ class Self(Expr):
 
     """
 
+    __slots__ = ()
+
     def _get_partial_expression(self) -> str:
         return "@"
 
-    def find(self, element: Any) -> List[Any]:
-        try:
-            _, value = ctx_self.get()
-            return [value]
-        except LookupError:
+    def _find(self, element: Any, ctx: _Context) -> List[Any]:
+        if ctx.item is _MISSING:
             return [element]
 
+        _, value = ctx.item
+        return [value]
+
+    def _find_locations(
+        self, element: Any, location: T_LOCATION, ctx: _Context
+    ) -> Iterable[Tuple[T_LOCATION, Any]]:
+        if ctx.item is _MISSING:
+            return [(location, element)]
+
+        # the item of the predicate is not located in the root data
+        return super()._find_locations(element, location, ctx)
+
 
 class Compare(Expr):
     """
@@ -828,6 +2555,8 @@ class Compare(Expr):
 
     """
 
+    __slots__ = ("target",)
+
     _symbol: str = ""
     _operator: Callable[[Any, Any], bool] = staticmethod(lambda a, b: False)
 
@@ -835,6 +2564,9 @@ class Compare(Expr):
         super().__init__()
         self.target = target
 
+    def _init_args(self) -> Tuple[Any, ...]:
+        return (self.target,)
+
     def _get_target_expression(self) -> str:
         if isinstance(self.target, Expr):
             return self.target.get_expression()
@@ -845,51 +2577,71 @@ class Compare(Expr):
         return f" {self._symbol} {self._get_target_expression()}"
 
     def get_target_value(self) -> Any:
+        value = self._get_target_value(_Context.from_vars())
+        if value is _MISSING:
+            raise JSONPathFindError
+
+        return value
+
+    def _get_target_value(self, ctx: _Context) -> Any:
+        """
+        Get the target value, or the :data:`_MISSING` if the target finds nothing.
+        """
         if isinstance(self.target, Expr):
-            # set ctx_finding False to
             # start new finding process for the nested expr: self.target
-            with temporary_set(ctx_finding, False):
-                # multiple exprs begins on self-value in filtering find,
-                # except the self.target expr starts with root-value.
-                _, value = ctx_self.get()
-                rv = self.target.find(value)
-                if not rv:
-                    raise JSONPathFindError
-
-                return rv[0]
+            # multiple exprs begins on self-value in filtering find,
+            # except the self.target expr starts with root-value.
+            _, value = ctx.get_item()
+            return _find_operand(self.target, value, ctx)
         else:
             return self.target
 
-    def find(self, element: Any) -> List[bool]:
-        return [self._operator(element, self.get_target_value())]
+    def _find(self, element: Any, ctx: _Context) -> List[bool]:
+        target = self._get_target_value(ctx)
+        if target is _MISSING:
+            return []
+
+        return [self._operator(element, target)]
 
 
 class LessThan(Compare):
+    __slots__ = ()
+
     _symbol = "<"
     _operator = staticmethod(operator.lt)
 
 
 class LessEqual(Compare):
+    __slots__ = ()
+
     _symbol = "<="
     _operator = staticmethod(operator.le)
 
 
 class Equal(Compare):
+    __slots__ = ()
+
     _symbol = "="
     _operator = staticmethod(operator.eq)
 
 
 class GreaterEqual(Compare):
+    __slots__ = ()
+
     _symbol = ">="
     _operator = staticmethod(operator.ge)
 
 
 class GreaterThan(Compare):
+    __slots__ = ()
+
     _symbol = ">"
     _operator = staticmethod(operator.gt)
 
 
 class NotEqual(Compare):
+    __slots__ = ()
+
     _symbol = "!="
     _operator = staticmethod(operator.ne)
 
@@ -900,10 +2652,19 @@ class And(Compare):
 
     """
 
+    __slots__ = ()
+
     _symbol = "and"
 
-    def find(self, element: Any) -> List[bool]:
-        return [element and self.get_target_value()]
+    def _find(self, element: Any, ctx: _Context) -> List[bool]:
+        if not element:
+            return [element]
+
+        target = self._get_target_value(ctx)
+        if target is _MISSING:
+            return []
+
+        return [target]
 
 
 class Or(Compare):
@@ -912,10 +2673,19 @@ class Or(Compare):
 
     """
 
+    __slots__ = ()
+
     _symbol = "or"
 
-    def find(self, element: Any) -> List[bool]:
-        return [element or self.get_target_value()]
+    def _find(self, element: Any, ctx: _Context) -> List[bool]:
+        if element:
+            return [element]
+
+        target = self._get_target_value(ctx)
+        if target is _MISSING:
+            return []
+
+        return [target]
 
 
 def _get_expression(target: Any) -> str:
@@ -930,13 +2700,14 @@ class Function(Expr):
     Base class of functions.
     """
 
+    __slots__ = ("args",)
+
     def __init__(self, *args: Any) -> None:
         super().__init__()
         self.args = args
 
-    @abstractmethod
-    def find(self, element: Any) -> List[Any]:
-        raise NotImplementedError
+    def _init_args(self) -> Tuple[Any, ...]:
+        return self.args
 
 
 class Key(Function):
@@ -958,6 +2729,8 @@ class Key(Function):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, *args: List[Any]) -> None:
         super().__init__(*args)
         if self.args:
@@ -966,10 +2739,10 @@ class Key(Function):
     def _get_partial_expression(self) -> str:
         return "key()"
 
-    def find(self, element: Any) -> List[Union[int, str]]:
+    def _find(self, element: Any, ctx: _Context) -> List[Union[int, str]]:
         # Key.find only executed in the predicate.
-        # So Array.find being executed first that set the ctx_self
-        key, _ = ctx_self.get()
+        # So Predicate.find being executed first that set the item
+        key, _ = ctx.get_item()
         return [key]
 
 
@@ -997,6 +2770,8 @@ class Contains(Function):
 
     """
 
+    __slots__ = ("_expr", "_target")
+
     def __init__(self, expr: Expr, target: Any, *args: List[Any]) -> None:
         super().__init__(expr, target, *args)
         if not isinstance(expr, Expr):
@@ -1010,23 +2785,18 @@ class Contains(Function):
         args_list = f"{_get_expression(self._expr)}, {_get_expression(self._target)}"
         return f"contains({args_list})"
 
-    def find(self, element: Any) -> List[bool]:
-        rv = self._expr.find(element)
-        if not rv:
+    def _find(self, element: Any, ctx: _Context) -> List[bool]:
+        # the first found element only, it stops the lazy finding, e.g., Search
+        root_arg = next(iter(self._expr._find(element, ctx)), _MISSING)
+        if root_arg is _MISSING:
             return []
-        root_arg = rv[0]
         target_arg = self._target
         if isinstance(target_arg, Expr):
-            # set ctx_finding False to
             # start new finding process for the nested expr: target_arg
-            with temporary_set(ctx_finding, False):
-                rv = self._target.find(element)
-
-            if not rv:
-                return []
-
             # use the first value of results as target
-            target_arg = rv[0]
+            target_arg = _find_operand(self._target, element, ctx)
+            if target_arg is _MISSING:
+                return []
 
         return [target_arg in root_arg]
 
@@ -1040,6 +2810,8 @@ class Not(Function):
 
     """
 
+    __slots__ = ("_expr",)
+
     def __init__(self, expr: Expr, *args: List[Any]) -> None:
         super().__init__(expr, *args)
         if args:
@@ -1051,18 +2823,193 @@ class Not(Function):
     def _get_partial_expression(self) -> str:
         return f"not({self._expr.get_expression()})"
 
-    def find(self, element: Any) -> List[bool]:
-        # set ctx_finding False to
+    def _find(self, element: Any, ctx: _Context) -> List[bool]:
         # start new finding process for the nested expr: target
-        with temporary_set(ctx_finding, False):
-            rv = self._expr.find(element)
+        rv = _find_chain(self._expr, element, ctx)
 
         return [not v for v in rv]
 
 
+_BUILTIN_CLASSES = frozenset(
+    [
+        And,
+        Array,
+        Brace,
+        Contains,
+        Equal,
+        GreaterEqual,
+        GreaterThan,
+        Key,
+        LessEqual,
+        LessThan,
+        Name,
+        NamePath,
+        Not,
+        NotEqual,
+        Or,
+        Parameter,
+        Predicate,
+        Root,
+        Search,
+        Self,
+        Slice,
+        Value,
+    ]
+)
+_UNKNOWN = object()
+# the operand depends on the item of the predicate
+_VARIANT = object()
+
+
+def _is_item_independent(expr: Expr, bound: bool = False) -> bool:
+    """
+    Whether the chained expr does not depend on the item of the predicate.
+    The :class:`Self` and the :class:`Key` in the nested predicate
+    are bound to the item of the nested predicate.
+    """
+    node: Optional[Expr] = expr.get_begin()
+    while node is not None:
+        cls = type(node)
+        if cls not in _BUILTIN_CLASSES or not bound and cls in (Self, Key):
+            return False
+
+        if (
+            not bound
+            and isinstance(node, Compare)
+            and isinstance(node.target, Expr)
+            and not isinstance(node.target.get_begin(), (Root, Parameter, Value))
+        ):
+            # the target finds in the item of the predicate
+            return False
+
+        for arg in node._init_args():
+            if isinstance(arg, Expr) and not _is_item_independent(
+                arg, bound or cls is Predicate
+            ):
+                return False
+
+        node = node.get_next()
+
+    return True
+
+
+def _find_operand(expr: Expr, element: Any, ctx: _Context) -> Any:
+    """
+    Find the first element by the operand in the predicate,
+    e.g., the target of the comparison,
+    or the :data:`_MISSING` if it finds nothing.
+    Only the first element is used, so the rest elements are not found.
+
+    The operand begins with the root or a parameter
+    and does not depend on the item,
+    e.g., "$.threshold" in "$.items[@.price > $.threshold]",
+    finds the same elements for every item.
+    So its first found element is reused in the whole finding process.
+    """
+    invariants = ctx.invariants
+    if invariants is None:
+        return _find_first(expr, element, ctx)
+
+    key = id(expr)
+    rv = invariants.get(key, _UNKNOWN)
+    if rv is _UNKNOWN:
+        if isinstance(expr.get_begin(), (Root, Parameter)) and _is_item_independent(
+            expr
+        ):
+            rv = invariants[key] = _find_first(expr, element, ctx)
+            return rv
+
+        invariants[key] = _VARIANT
+    elif rv is not _VARIANT:
+        return rv
+
+    return _find_first(expr, element, ctx)
+
+
+def _get_field_names(expr: Expr) -> Optional[Tuple[str, ...]]:
+    """
+    Get the field names of the item looked up by the expr
+    with the parts chained before it, e.g., ("a", "b") of "@.a.b" and "a.b",
+    and () of "@", or :data:`None` if it does other than looking up the fields.
+    """
+    names: List[str] = []
+    node: Optional[Expr] = expr.get_begin()
+    if type(node) is Self:
+        if node is expr:
+            return ()
+
+        node = node.get_next()
+
+    while node is not None:
+        if type(node) is Name and node.name is not None:
+            names.append(node.name)
+        elif type(node) is NamePath:
+            names.extend(node.names)
+        else:
+            return None
+
+        if node is expr:
+            return tuple(names)
+
+        node = node.get_next()
+
+    return None
+
+
+def _lookup_items(expr: Expr, array: List[Any], ctx: _Context) -> Optional[List[Any]]:
+    """
+    Find the items of the array by the value index instead of the filtering,
+    for the predicate compares the field of the item to the item-independent value,
+    e.g., "@.id = $id".
+    It returns :data:`None` if the field of the items in the array is not indexed.
+    """
+    if type(expr) is not Equal or ctx.index is None:
+        return None
+
+    names = _get_field_names(expr.left) if expr.left is not None else None
+    if names is None:
+        return None
+
+    values = ctx.index.get_value_index(array, names)
+    if values is None:
+        return None
+
+    target = expr.target
+    if isinstance(target, Expr):
+        if not isinstance(
+            target.get_begin(), (Root, Parameter, Value)
+        ) or not _is_item_independent(target):
+            return None
+
+        target = _find_operand(target, array, ctx)
+        if target is _MISSING:
+            return []
+
+    return [array[idx] for idx in values.lookup(target)]
+
+
+T_OPERATOR = Literal["<=", ">=", "<", ">", "!=", "="]
+
+COMPARISON_OPERATORS: Dict[T_OPERATOR, Type[Compare]] = {
+    "<": LessThan,
+    "<=": LessEqual,
+    "=": Equal,
+    ">=": GreaterEqual,
+    ">": GreaterThan,
+    "!=": NotEqual,
+}
+
+FUNCTIONS: Dict[str, Type[Function]] = {
+    "key": Key,
+    "contains": Contains,
+    "not": Not,
+}
+
+
 __all__ = (
     "And",
     "Array",
+    "BoundExpr",
     "Brace",
     "Compare",
     "Contains",
@@ -1075,13 +3022,16 @@ __all__ = (
     "LessEqual",
     "LessThan",
     "Name",
+    "NamePath",
     "Not",
     "NotEqual",
     "Or",
+    "Parameter",
     "Predicate",
     "Root",
     "Search",
     "Self",
     "Slice",
     "Value",
+    "legacy_find",
 )
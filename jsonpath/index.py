@@ -0,0 +1,294 @@
+"""
+==================================================
+:mod:`index` -- Index the data for repeated finding
+==================================================
+
+Build the index of a large data once,
+and pass it to find by many expressions in the data.
+
+>>> from jsonpath.parser import parse
+>>> data = {"a": {"sku": 1}, "b": [{"sku": 2}, {"c": {"sku": 3}}]}
+>>> index = DocumentIndex(data)
+>>> parse("$..sku").find(data, index=index)
+[1, 2, 3]
+
+The :class:`~jsonpath.core.Search` of the field name
+gets the dictionaries holding the field from the index,
+instead of walking through all descendants.
+
+The values of the fields of the items in the arrays can be indexed too,
+the :class:`~jsonpath.core.Predicate` compares the field
+to the value not depending on the item (e.g., ``$.users[@.id = $id]``)
+gets the items from the index, instead of filtering all items.
+
+>>> data = {"users": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]}
+>>> index = DocumentIndex(data)
+>>> index.index_values("$.users", "@.id")
+>>> parse("$.users[@.id = 2].name").find(data, index=index)
+['b']
+
+The data must not be changed after indexing,
+the index finds the stale results otherwise.
+"""
+
+# Standard Library
+import operator
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+# Local Folder
+from .core import Expr, _get_field_names
+
+_END = object()
+
+
+class ValueIndex:
+    """
+    The positions of the items in the array by the values of their field,
+    the items without the field are not indexed.
+
+    :param array: The array of the items
+    :type array: List[Any]
+    :param names: The field names of the item, from outer to inner.
+        The item itself is indexed if it is empty.
+    :type names: Tuple[str, ...]
+    """
+
+    __slots__ = ("array", "names", "_positions", "_others")
+
+    def __init__(self, array: List[Any], names: Tuple[str, ...]) -> None:
+        # the array is kept alive, its id is the key of the index
+        self.array = array
+        self.names = names
+        self._positions: Dict[Any, List[int]] = {}
+        # the unhashable values, and the values not equal to themselves (e.g., NaN),
+        # which are compared one by one.
+        self._others: List[Tuple[int, Any]] = []
+        for idx, value in enumerate(array):
+            for name in names:
+                if not isinstance(value, dict) or name not in value:
+                    break
+
+                value = value[name]
+            else:
+                try:
+                    if value == value:
+                        self._positions.setdefault(value, []).append(idx)
+                        continue
+                except TypeError:
+                    pass
+
+                self._others.append((idx, value))
+
+    def lookup(self, value: Any) -> List[int]:
+        """
+        Get the positions of the items whose field is equal to the value, in order.
+
+        :param value: The value to look up
+        :type value: Any
+
+        :returns: The positions of the items
+        :rtype: List[int]
+        """
+        try:
+            found: List[int] = self._positions.get(value, []) if value == value else []
+        except TypeError:
+            found = []
+
+        matches = [idx for idx, other in self._others if other == value]
+        if not matches:
+            return found
+
+        return sorted(found + matches)
+
+
+class DocumentIndex:
+    """
+    The index of the field names in the data.
+
+    It maps each field name to the dictionaries holding it in pre-order,
+    which is the order :class:`~jsonpath.core.Search` walks in.
+    Each dictionary and array is numbered in pre-order,
+    so the descendants of one are numbered in the interval after its number.
+
+    The same dictionary or array may be contained more than once,
+    its descendants are indexed once at its first place.
+    The containers holding it at the other places are not indexed,
+    so the searches in them walk through their descendants instead.
+
+    .. automethod:: index_values
+    .. automethod:: get_value_index
+    .. automethod:: search_name
+
+    :param data: The data to index, which is also the root data to find in.
+    :type data: Any
+    :param planner: Whether the predicates get the items from the value indexes,
+        or filter all items. It can be switched by the attribute of the same name.
+    :type planner: bool
+    """
+
+    def __init__(self, data: Any, planner: bool = True) -> None:
+        self.data = data
+        self.planner = planner
+        # the value indexes by the ids of the arrays and the field names
+        self._values: Dict[Tuple[int, Tuple[str, ...]], ValueIndex] = {}
+        # the number, the number of the last descendant and the depth
+        # of the dictionaries and the arrays, by their ids.
+        self._spans: Dict[int, Tuple[int, int, int]] = {}
+        # the numbers, the depths and the dictionaries holding the field names
+        self._fields: Dict[str, Tuple[List[int], List[int], List[Dict[str, Any]]]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        if not isinstance(self.data, (dict, list)):
+            return
+
+        number = 0
+        ambiguous: Set[int] = set()
+        # the pending children, their container and its number
+        stack: List[Tuple[Iterator[Any], Any, int]] = []
+        node: Any = self.data
+        while True:
+            if isinstance(node, (dict, list)) and id(node) in self._spans:
+                # the same container again, the intervals of the containers
+                # holding it here miss its descendants.
+                ambiguous.update(id(container) for _, container, _ in stack)
+            elif isinstance(node, (dict, list)):
+                depth = len(stack)
+                self._spans[id(node)] = (number, number, depth)
+                if isinstance(node, dict):
+                    for name in node:
+                        numbers, depths, nodes = self._fields.setdefault(
+                            name, ([], [], [])
+                        )
+                        numbers.append(number)
+                        depths.append(depth)
+                        nodes.append(node)
+
+                    children: Iterator[Any] = iter(node.values())
+                else:
+                    children = iter(node)
+
+                stack.append((children, node, number))
+                number += 1
+
+            while stack:
+                iterator, container, begin = stack[-1]
+                node = next(iterator, _END)
+                if node is not _END:
+                    break
+
+                stack.pop()
+                _, _, depth = self._spans[id(container)]
+                self._spans[id(container)] = (begin, number - 1, depth)
+            else:
+                break
+
+        for key in ambiguous:
+            del self._spans[key]
+
+    def index_values(self, array: Union[str, Expr], field: Union[str, Expr]) -> None:
+        """
+        Index the values of the field of the items
+        in the arrays found by the expression.
+
+        >>> data = {"groups": [{"users": [{"id": 1}]}, {"users": [{"id": 2}]}]}
+        >>> index = DocumentIndex(data)
+        >>> index.index_values("$.groups[*].users", "@.id")
+        >>> index.get_value_index(data["groups"][1]["users"], ("id",)).lookup(2)
+        [0]
+
+        :param array: The expression finds the arrays in the data
+        :type array: Union[str, :class:`~jsonpath.core.Expr`]
+        :param field: The expression of the field in the item,
+            e.g., "@.id", "@.a.b" or "@" for the item itself.
+        :type field: Union[str, :class:`~jsonpath.core.Expr`]
+        :raises ValueError: The field expression does other than
+            looking up the fields.
+        """
+        array_expr = _parse(array) if isinstance(array, str) else array
+        field_expr = _parse(field) if isinstance(field, str) else field
+        names = _get_field_names(field_expr)
+        if names is None or field_expr.get_next() is not None:
+            raise ValueError(
+                f"{field_expr.get_expression()!r} does other than looking up the fields"
+            )
+
+        for found in array_expr.find(self.data):
+            if isinstance(found, list):
+                self._values[(id(found), names)] = ValueIndex(found, names)
+
+    def get_value_index(
+        self, array: List[Any], names: Tuple[str, ...]
+    ) -> Optional[ValueIndex]:
+        """
+        Get the value index of the field of the items in the array.
+
+        :param array: The array in the data
+        :type array: List[Any]
+        :param names: The field names of the item, from outer to inner
+        :type names: Tuple[str, ...]
+
+        :returns: The value index, or :data:`None` if it is not indexed.
+        :rtype: Optional[:class:`ValueIndex`]
+        """
+        return self._values.get((id(array), names))
+
+    def search_name(
+        self, element: Any, name: str, max_depth: Optional[int] = None
+    ) -> Optional[Iterable[Any]]:
+        """
+        Get the values of the field in the element and all its descendants
+        in pre-order, the same as searching by :class:`~jsonpath.core.Name`.
+
+        >>> index = DocumentIndex({"a": 1, "b": {"a": 2, "c": {"a": 3}}})
+        >>> list(index.search_name(index.data, "a"))
+        [1, 2, 3]
+        >>> list(index.search_name(index.data["b"], "a", max_depth=0))
+        [2]
+
+        :param element: The dictionary or the array in the data
+        :type element: Any
+        :param name: The field name
+        :type name: str
+        :param max_depth: The maximum depth of the descendants,
+            the element itself is at depth 0. No limit if it is None.
+        :type max_depth: Optional[int]
+
+        :returns: The values of the field,
+            or :data:`None` if the element is not in the data or not indexed.
+        :rtype: Optional[Iterable[Any]]
+        """
+        span = self._spans.get(id(element))
+        if span is None:
+            return None
+
+        fields = self._fields.get(name)
+        if fields is None:
+            return ()
+
+        begin, end, depth = span
+        numbers, depths, nodes = fields
+        lo = bisect_left(numbers, begin)
+        hi = bisect_right(numbers, end, lo)
+        if max_depth is not None and max_depth >= 0:
+            max_depth += depth
+            return (
+                node[name]
+                for node_depth, node in zip(depths[lo:hi], nodes[lo:hi])
+                if node_depth <= max_depth
+            )
+
+        return map(operator.itemgetter(name), nodes[lo:hi])
+
+
+def _parse(expression: str) -> Expr:
+    # import the parser on first use, see jsonpath.__getattr__
+    # Local Folder
+    from .parser import parse
+
+    return parse(expression)
+
+
+__all__ = ("DocumentIndex", "ValueIndex")
@@ -2,8 +2,10 @@
 # Ignore variable already redefined error
 try:
     # Third Party Library
-    from lark import Lark, Token, Transformer, v_args
-    from lark.exceptions import UnexpectedToken, VisitError
+    from lark import Lark, Token, Transformer
+    from lark import __version__ as lark_version
+    from lark import v_args
+    from lark.exceptions import UnexpectedInput, UnexpectedToken, VisitError
 
 except ImportError:
     # Local Folder
@@ -12,10 +14,12 @@ except ImportError:
         Lark_StandAlone,
         Token,
         Transformer,
+        UnexpectedInput,
         UnexpectedToken,
         VisitError,
-        v_args,
     )
+    from .lark_parser import __version__ as lark_version
+    from .lark_parser import v_args
 
 
 __all__ = (
@@ -24,6 +28,8 @@ __all__ = (
     "v_args",
     "Lark",
     "Lark_StandAlone",
+    "UnexpectedInput",
     "UnexpectedToken",
     "VisitError",
+    "lark_version",
 )
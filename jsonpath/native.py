@@ -0,0 +1,347 @@
+"""
+===============================================================
+:mod:`native` -- Translate expression without the Lark parser
+===============================================================
+
+A hand-written recursive descent parser of the grammar in ``grammar.lark``.
+It builds the same executable objects
+as the Lark parser with :class:`~jsonpath.transformer.JSONPathTransformer` do,
+but it is faster and needs not to load Lark at all.
+
+The simple paths like ``$.a.b[0]`` are matched by a single regular expression
+and built directly, without going through the recursive descent.
+
+Select it by the ``backend`` parameter of :func:`jsonpath.parser.parse`,
+or the environment variable ``JSONPATH_PARSER=native``.
+"""
+
+# Standard Library
+import re
+
+from typing import List, NoReturn, Optional, Tuple, Union
+
+# Local Folder
+from .core import (
+    COMPARISON_OPERATORS,
+    FUNCTIONS,
+    T_VALUE,
+    And,
+    Array,
+    Brace,
+    Expr,
+    JSONPathError,
+    JSONPathSyntaxError,
+    JSONPathUndefinedFunctionError,
+    Name,
+    Or,
+    Parameter,
+    Predicate,
+    Root,
+    Search,
+    Self,
+    Slice,
+    Value,
+)
+
+# the terminals of the grammar.lark
+CNAME_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+NUMBER_PATTERN = re.compile(
+    r"[+-]?(?:[0-9]+[eE][+-]?[0-9]+"
+    r"|(?:[0-9]+\.(?:[0-9]+)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+    r"|[0-9]+)"
+)
+STRING_PATTERN = re.compile(
+    r"`([^`\\]|\\.)*?`|'([^'\\]|\\.)*?'|\"([^\"\\]|\\.)*?\"", re.IGNORECASE
+)
+COMPARE_OPERATOR_PATTERN = re.compile(r"<=|>=|!=|<|>|=")
+WS_INLINE = " \t"
+KEYWORDS = {"true": True, "false": False, "null": None}
+
+SIMPLE_PATH_PATTERN = re.compile(
+    r"(\$|@|[A-Za-z_][A-Za-z0-9_]*)"
+    r"(?:\.(?:[A-Za-z_][A-Za-z0-9_]*|\*)|\[(?:[+-]?[0-9]+|\*)\])*"
+)
+SIMPLE_STEP_PATTERN = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*|\*)|\[([+-]?[0-9]+|\*)\]")
+
+
+def _parse_simple_path(expr: str) -> Optional[Expr]:
+    """
+    Build the expression consists of names, indexes and stars only,
+    returns None if it is not such a simple path.
+    """
+    match = SIMPLE_PATH_PATTERN.fullmatch(expr)
+    if match is None:
+        return None
+
+    first = match.group(1)
+    node: Expr
+    if first == "$":
+        node = Root()
+    elif first == "@":
+        node = Self()
+    elif first in KEYWORDS:
+        # a value can not be the whole expression
+        return None
+    else:
+        node = Name(first)
+
+    for step in SIMPLE_STEP_PATTERN.finditer(expr, match.end(1)):
+        name, idx = step.groups()
+        if name is not None:
+            node = node.chain(Name(None if name == "*" else name))
+        else:
+            node = node.chain(Array(None if idx == "*" else int(idx)))
+
+    return node
+
+
+class _Parser:
+    """
+    The parser state of an expression.
+
+    Like the Lark parser does, the expression is checked for syntax errors
+    as a whole before raising the other errors,
+    which are deferred until the end of parsing.
+    """
+
+    def __init__(self, expr: str) -> None:
+        self.expr = expr
+        self.pos = 0
+        self.deferred_error: Optional[JSONPathError] = None
+
+    def fail(self) -> NoReturn:
+        raise JSONPathSyntaxError(self.expr)
+
+    def defer(self, exc: JSONPathError) -> Expr:
+        if self.deferred_error is None:
+            self.deferred_error = exc
+
+        # the placeholder of the failed part, never be returned
+        return Value(None)
+
+    def skip(self) -> None:
+        expr = self.expr
+        pos = self.pos
+        while pos < len(expr) and expr[pos] in WS_INLINE:
+            pos += 1
+
+        self.pos = pos
+
+    def peek(self) -> str:
+        self.skip()
+        return self.expr[self.pos : self.pos + 1]
+
+    def accept(self, literal: str) -> bool:
+        self.skip()
+        if self.expr.startswith(literal, self.pos):
+            self.pos += len(literal)
+            return True
+
+        return False
+
+    def expect(self, literal: str) -> None:
+        if not self.accept(literal):
+            self.fail()
+
+    def match(self, pattern: "re.Pattern[str]") -> Optional[str]:
+        self.skip()
+        match = pattern.match(self.expr, self.pos)
+        if match is None:
+            return None
+
+        self.pos = match.end()
+        return match.group()
+
+    def start(self) -> Expr:
+        node, is_path = self.atom()
+        self.skip()
+        if not is_path or self.pos != len(self.expr):
+            self.fail()
+
+        if self.deferred_error is not None:
+            raise self.deferred_error
+
+        return node
+
+    def test(self) -> Expr:
+        left = self.test_and()
+        while self.accept("or"):
+            left = left.chain(Or(self.test_and()))
+
+        return left
+
+    def test_and(self) -> Expr:
+        left = self.test_comparison()
+        while self.accept("and"):
+            left = left.chain(And(self.test_comparison()))
+
+        return left
+
+    def test_comparison(self) -> Expr:
+        left, _ = self.atom()
+        operator = self.match(COMPARE_OPERATOR_PATTERN)
+        if operator is None:
+            return left
+
+        right, _ = self.atom()
+        return left.chain(COMPARISON_OPERATORS[operator](right))  # type: ignore
+
+    def atom(self) -> Tuple[Expr, bool]:
+        """
+        Parse an atom with its following actions,
+        and tell whether it is a path or a function call,
+        which can be the whole expression.
+        """
+        node, is_path = self.primary()
+        while True:
+            action: Expr
+            if self.accept(".."):
+                if self.accept("["):
+                    action = Search(self.predicate())
+                else:
+                    action = Search(Name(self.identifier()))
+            elif self.accept("."):
+                if self.accept("*"):
+                    action = Name()
+                else:
+                    action = Name(self.identifier())
+            elif self.accept("["):
+                action = self.predicate()
+            else:
+                return node, is_path
+
+            node = node.chain(action)
+            is_path = True
+
+    def primary(self) -> Tuple[Expr, bool]:
+        char = self.peek()
+        if char == "$":
+            self.pos += 1
+            # no whitespaces between the dollar sign and the parameter name
+            match = CNAME_PATTERN.match(self.expr, self.pos)
+            if match is not None:
+                self.pos = match.end()
+                return Parameter(match.group()), False
+
+            return Root(), True
+        elif char == "@":
+            self.pos += 1
+            return Self(), True
+        elif char == "(":
+            self.pos += 1
+            expr = self.test()
+            self.expect(")")
+            return Brace(expr), False
+
+        word = self.match(CNAME_PATTERN)
+        if word is not None:
+            if word in KEYWORDS:
+                return Value(KEYWORDS[word]), False
+            elif self.accept("()"):
+                return self.func_call(word, []), True
+            elif self.accept("("):
+                args = [self.test()]
+                while self.accept(","):
+                    args.append(self.test())
+
+                self.expect(")")
+                return self.func_call(word, args), True
+
+            return Name(word), True
+
+        string = self.match(STRING_PATTERN)
+        if string is not None:
+            return Value(string[1:-1]), False
+
+        number = self.match(NUMBER_PATTERN)
+        if number is not None:
+            return self.number(number), False
+
+        self.fail()
+
+    def identifier(self) -> str:
+        name = self.match(CNAME_PATTERN)
+        if name is not None:
+            return name
+
+        string = self.match(STRING_PATTERN)
+        if string is not None:
+            return string[1:-1]
+
+        self.fail()
+
+    def predicate(self) -> Union[Array, Predicate]:
+        if self.accept("*"):
+            self.expect("]")
+            return Array()
+
+        start = None
+        if not self.accept(":"):
+            start = self.test()
+            if not self.accept(":"):
+                self.expect("]")
+                if isinstance(start, Value) and isinstance(start.value, int):
+                    return Array(start.value)
+
+                return Predicate(start)
+
+        stop = None if self.peek() in (":", "]") else self.test()
+        if not self.accept(":"):
+            self.expect("]")
+            return Array(Slice(start=start, stop=stop))
+
+        step = None if self.peek() == "]" else self.test()
+        self.expect("]")
+        return Array(Slice(start=start, stop=stop, step=step))
+
+    def number(self, number: str) -> Expr:
+        value: T_VALUE
+        try:
+            value = float(number) if "." in number else int(number)
+        except ValueError as exc:
+            # e.g., "1e3", the same as the JSONPathTransformer
+            error = JSONPathSyntaxError(self.expr)
+            error.__cause__ = exc
+            return self.defer(error)
+
+        return Value(value)
+
+    def func_call(self, name: str, args: List[Expr]) -> Expr:
+        func_cls = FUNCTIONS.get(name)
+        if func_cls is None:
+            return self.defer(
+                JSONPathUndefinedFunctionError(f"Function {name!r} not exists")
+            )
+
+        try:
+            return func_cls(*args)
+        except TypeError as exc:
+            error = JSONPathSyntaxError(self.expr)
+            error.__cause__ = exc
+            return self.defer(error)
+
+
+def parse(expr: str) -> Expr:
+    """
+    Transform JSONPath expression into an executable object
+    without the Lark parser.
+
+    >>> parse("$.a[@ > 1]").find({"a": [1, 2, 3]})
+    [2, 3]
+
+    :param expr: JSONPath expression
+    :type expr: str
+
+    :returns: An executable object.
+    :rtype: :class:`jsonpath.core.Expr`
+    :raises ~jsonpath.core.JSONPathError: \
+        Transform JSONPath expression error.
+    """
+    node = _parse_simple_path(expr)
+    if node is not None:
+        return node
+
+    return _Parser(expr).start()
+
+
+__all__ = ("parse",)
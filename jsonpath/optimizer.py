@@ -0,0 +1,488 @@
+"""
+========================================================
+:mod:`optimizer` -- Rewrite expression into cheaper one
+========================================================
+
+Rewrite the parsed expression into an equivalent one,
+which finds the same target data with less work.
+
+- Fold the comparisons and the functions of constant values,
+  e.g., ``$[@.a = 1 and 1 < 2]`` into ``$[@.a = 1 and true]``.
+- Drop the double :class:`~jsonpath.core.Not`
+  whose result is only used as a condition,
+  e.g., ``$[not(not(a))]`` into ``$[a]``.
+- Fuse the chaining filters into one,
+  e.g., ``($[@ < 100])[@ >= 50]`` into ``$[@ < 100 and @ >= 50]``.
+- Collapse the consecutive :class:`~jsonpath.core.Name`
+  into one nested lookup :class:`~jsonpath.core.NamePath`,
+  e.g., ``$.a.b.c`` looks up the fields "a", "b" and "c" in one step.
+
+The rewritten expression is still printable by
+:meth:`~jsonpath.core.Expr.get_expression`,
+and parsing the printed expression gets an equivalent one.
+
+>>> from jsonpath.parser import parse
+>>> print(optimize_expr(parse("($[@ < 100])[@ >= 50]")).get_expression())
+$[@ < 100 and @ >= 50]
+
+The expression contains the user-defined expr classes is not rewritten.
+"""
+
+# Standard Library
+import copy
+
+from typing import Any, List, Optional, Tuple, Type
+
+# Local Folder
+from .core import (
+    COMPARISON_OPERATORS,
+    And,
+    Array,
+    Brace,
+    Compare,
+    Contains,
+    Expr,
+    Key,
+    Name,
+    NamePath,
+    Not,
+    Or,
+    Parameter,
+    Predicate,
+    Root,
+    Search,
+    Self,
+    Slice,
+    Value,
+    _rebuild_chain,
+)
+
+T_PART = Tuple[Type[Expr], Tuple[Any, ...]]
+
+_OPTIMIZABLE = frozenset(
+    [
+        And,
+        Array,
+        Brace,
+        Contains,
+        Key,
+        Name,
+        NamePath,
+        Not,
+        Or,
+        Parameter,
+        Predicate,
+        Root,
+        Search,
+        Self,
+        Slice,
+        Value,
+        *COMPARISON_OPERATORS.values(),
+    ]
+)
+_BOOLEANS = (And, Or)
+_NOT_CONSTANT = object()
+
+
+class _Unsupported(Exception):
+    """
+    The expression can not be rewritten, e.g., it has the user-defined expr.
+    """
+
+
+def _get_parts(expr: Expr) -> List[T_PART]:
+    """
+    Get the classes and the constructor arguments of all parts of the chained expr.
+    """
+    if expr.get_next() is not None:
+        raise _Unsupported("only the last part represents the whole chained expr")
+
+    parts: List[T_PART] = []
+    node: Optional[Expr] = expr.get_begin()
+    while node is not None:
+        if type(node) not in _OPTIMIZABLE:
+            raise _Unsupported(f"{type(node).__name__} is not optimizable")
+
+        parts.append((type(node), node._init_args()))
+        node = node.get_next()
+
+    return parts
+
+
+def _get_boolean_start(parts: List[T_PART]) -> Optional[int]:
+    """
+    Get the index of the first boolean operator,
+    if the rest parts of the chained expr are all boolean operators.
+    """
+    for idx, (cls, _) in enumerate(parts):
+        if issubclass(cls, _BOOLEANS):
+            if all(issubclass(cls, _BOOLEANS) for cls, _ in parts[idx:]):
+                return idx
+
+            return None
+
+    return len(parts)
+
+
+def _get_constant(expr: Any) -> Any:
+    """
+    Get the value of the constant expr, the :class:`Value` only.
+    """
+    if not isinstance(expr, Expr):
+        return expr
+
+    parts = _get_parts(expr)
+    if len(parts) == 1 and parts[0][0] is Value:
+        return parts[0][1][0]
+
+    return _NOT_CONSTANT
+
+
+def _reads_parent(part: T_PART) -> bool:
+    """
+    Whether the part finds with the parent of the element it finds in,
+    i.e., the slice finds its fields in the parent.
+    """
+    cls, args = part
+    if cls is Search:
+        expr = args[0]
+        return _reads_parent((type(expr), expr._init_args()))
+    elif cls is Array and isinstance(args[0], Slice):
+        return any(isinstance(field, Expr) for field in args[0]._init_args())
+
+    return False
+
+
+def _is_item_independent(expr: Expr) -> bool:
+    """
+    Whether the condition does not depend on the key of the item
+    or the parent of the element.
+    """
+    for cls, args in _get_parts(expr):
+        if cls in (Key, Slice):
+            return False
+
+        for arg in args:
+            if isinstance(arg, Expr) and not _is_item_independent(arg):
+                return False
+
+    return True
+
+
+class Optimizer:
+    """
+    Rewrite the JSONPath expression into an equivalent but cheaper one.
+
+    The rewriting of each part of the chained expr is performed
+    by the method named ``_optimize_<class name>``,
+    it returns the class and the constructor arguments of the rewritten part.
+    """
+
+    def optimize(
+        self, expr: Expr, truthy: bool = False, in_predicate: bool = False
+    ) -> Expr:
+        """
+        Rewrite the whole chained expr.
+
+        :param expr: The last part of the chained expr
+        :type expr: :class:`jsonpath.core.Expr`
+        :param truthy: Only the truthiness of the first found element is used,
+            e.g., the condition of the predicate
+        :type truthy: bool
+        :param in_predicate: The expr finds in the predicate
+        :type in_predicate: bool
+
+        :returns: The last part of the rewritten chained expr.
+        :rtype: :class:`jsonpath.core.Expr`
+        """
+        parts = _get_parts(expr)
+        start = _get_boolean_start(parts) if truthy else None
+        parts = [
+            self._optimize_part(
+                cls, args, start is not None and idx >= start, in_predicate
+            )
+            for idx, (cls, args) in enumerate(parts)
+        ]
+        parts = self._fold(parts, in_predicate)
+        if truthy:
+            parts = self._drop_double_not(parts)
+
+        parts = self._fuse_predicates(parts)
+        parts = self._collapse_names(parts)
+        return _rebuild_chain(tuple(parts))
+
+    def _optimize_part(
+        self, cls: Type[Expr], args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> T_PART:
+        name = "Compare" if issubclass(cls, Compare) else cls.__name__
+        method = getattr(self, f"_optimize_{name}", None)
+
+        if method is None:
+            return cls, args
+
+        return cls, method(args, truthy, in_predicate)
+
+    def _optimize_node(self, expr: Expr, in_predicate: bool) -> Expr:
+        """
+        Rewrite the expr which finds by the part itself only,
+        instead of the whole chained expr.
+        """
+        if expr.ref_begin is not None:
+            return copy.deepcopy(expr)
+
+        ((cls, args),) = _get_parts(expr)
+        cls, args = self._optimize_part(cls, args, False, in_predicate)
+        return cls(*args)
+
+    def _optimize_Array(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        (idx,) = args
+        if isinstance(idx, Slice):
+            return (self._optimize_node(idx, in_predicate),)
+
+        return args
+
+    def _optimize_Slice(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        return tuple(
+            (
+                self.optimize(field, in_predicate=in_predicate)
+                if isinstance(field, Expr)
+                else field
+            )
+            for field in args
+        )
+
+    def _optimize_Predicate(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        (expr,) = args
+        rv = self.optimize(expr, truthy=True, in_predicate=True)
+        value = _get_constant(rv)
+        if isinstance(value, int):
+            # "$[1]" and "$[true]" are parsed as the index of the array
+            return (copy.deepcopy(expr),)
+
+        return (rv,)
+
+    def _optimize_Brace(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        (expr,) = args
+        return (self.optimize(expr, in_predicate=in_predicate),)
+
+    def _optimize_Search(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        expr, *rest = args
+        return (self._optimize_node(expr, in_predicate), *rest)
+
+    def _optimize_Compare(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        (target,) = args
+        if isinstance(target, Expr):
+            return (self.optimize(target, truthy, in_predicate),)
+
+        return args
+
+    def _optimize_Not(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        (expr,) = args
+        return (self.optimize(expr, truthy=True, in_predicate=in_predicate),)
+
+    def _optimize_Contains(
+        self, args: Tuple[Any, ...], truthy: bool, in_predicate: bool
+    ) -> Tuple[Any, ...]:
+        expr, target = args
+        if isinstance(target, Expr):
+            target = self.optimize(target, in_predicate=in_predicate)
+
+        return (self._optimize_node(expr, in_predicate), target)
+
+    def _fold(self, parts: List[T_PART], in_predicate: bool) -> List[T_PART]:
+        """
+        Replace the parts that always find the same value with :class:`Value`.
+        """
+        rv: List[T_PART] = []
+        for cls, args in parts:
+            value: Any = _NOT_CONSTANT
+            if cls is Not:
+                operand = _get_constant(args[0])
+                if operand is not _NOT_CONSTANT:
+                    value = not operand
+            elif cls is Contains:
+                value = self._fold_contains(*args)
+            elif issubclass(cls, Compare) and rv and rv[-1][0] is Value:
+                (left,) = rv[-1][1]
+                value = self._fold_compare(cls, left, args[0], in_predicate)
+                if value is not _NOT_CONSTANT:
+                    rv.pop()
+
+            if value is _NOT_CONSTANT:
+                rv.append((cls, args))
+            else:
+                rv.append((Value, (value,)))
+
+        return rv
+
+    def _fold_contains(self, expr: Expr, target: Any) -> Any:
+        value = _get_constant(expr)
+        target = _get_constant(target)
+        if value is _NOT_CONSTANT or target is _NOT_CONSTANT:
+            return _NOT_CONSTANT
+
+        try:
+            return target in value
+        except TypeError:
+            # raises the error on finding
+            return _NOT_CONSTANT
+
+    def _fold_compare(
+        self, cls: Type[Expr], left: Any, target: Any, in_predicate: bool
+    ) -> Any:
+        # the boolean operators do not find the target if short-circuited
+        if cls is And and not left or cls is Or and left:
+            return left
+
+        if isinstance(target, Expr) and not in_predicate:
+            # the target finds in the item of the predicate only
+            return _NOT_CONSTANT
+
+        right = _get_constant(target)
+        if right is _NOT_CONSTANT:
+            return _NOT_CONSTANT
+        elif cls is And:
+            return left and right
+        elif cls is Or:
+            return left or right
+
+        try:
+            return cls._operator(left, right)  # type: ignore
+        except TypeError:
+            # raises the error on finding
+            return _NOT_CONSTANT
+
+    def _drop_double_not(self, parts: List[T_PART]) -> List[T_PART]:
+        """
+        Drop the double :class:`Not` whose result is only used as a condition.
+        """
+        if _get_boolean_start(parts) != 1 or parts[0][0] is not Not:
+            return parts
+
+        inner = _get_parts(parts[0][1][0])
+        if len(inner) != 1 or inner[0][0] is not Not:
+            return parts
+
+        return _get_parts(inner[0][1][0]) + parts[1:]
+
+    def _fuse_predicates(self, parts: List[T_PART]) -> List[T_PART]:
+        """
+        Fuse the predicate chained after the brace
+        into the last predicate in the brace.
+        """
+        rv: List[T_PART] = []
+        for idx, (cls, args) in enumerate(parts):
+            if (
+                cls is Predicate
+                and rv
+                and rv[-1][0] is Brace
+                and not (idx + 1 < len(parts) and _reads_parent(parts[idx + 1]))
+            ):
+                fused = self._fuse_predicate(rv[-1][1][0], args[0])
+                if fused is not None:
+                    rv.pop()
+                    rv.extend(fused)
+                    continue
+
+            rv.append((cls, args))
+
+        return rv
+
+    def _fuse_predicate(
+        self, brace_expr: Expr, condition: Expr
+    ) -> Optional[List[T_PART]]:
+        inner = _get_parts(brace_expr)
+        if inner[-1][0] is not Predicate:
+            return None
+
+        # the item of the chaining filter is the element the brace found,
+        # so the condition must not depend on its key.
+        if not _is_item_independent(condition):
+            return None
+
+        first = _get_parts(inner[-1][1][0])
+        second = _get_parts(condition)
+        start = _get_boolean_start(second)
+        if not start or any(cls is Or for cls, _ in first + second):
+            # "a or b and c" is parsed as "a or (b and c)"
+            return None
+
+        # "first and second" is the same as "first and a and b"
+        # if the second condition is "a and b"
+        expr = _rebuild_chain(
+            tuple(
+                first
+                + [(And, (_rebuild_chain(tuple(second[:start])),))]
+                + second[start:]
+            )
+        )
+        return inner[:-1] + [(Predicate, (expr,))]
+
+    def _collapse_names(self, parts: List[T_PART]) -> List[T_PART]:
+        """
+        Collapse the consecutive :class:`Name` into :class:`NamePath`.
+        """
+        rv: List[T_PART] = []
+        idx = 0
+        while idx < len(parts):
+            end = idx
+            while (
+                end < len(parts)
+                and parts[end][0] is Name
+                and parts[end][1][0] is not None
+            ):
+                end += 1
+
+            if end < len(parts) and _reads_parent(parts[end]):
+                # keep the parent of the element the next part finds in
+                end -= 1
+
+            if end - idx > 1:
+                rv.append((NamePath, tuple(args[0] for _, args in parts[idx:end])))
+                idx = end
+            else:
+                rv.append(parts[idx])
+                idx += 1
+
+        return rv
+
+
+def optimize_expr(expr: Expr) -> Expr:
+    """
+    Rewrite the JSONPath expression into an equivalent but cheaper one.
+
+    :param expr: JSONPath expression
+    :type expr: :class:`jsonpath.core.Expr`
+
+    :returns: The rewritten expression,
+        or the given one if it has the user-defined expr classes
+        or it is rewritten into a single value.
+    :rtype: :class:`jsonpath.core.Expr`
+    """
+    try:
+        rv = Optimizer().optimize(expr)
+    except _Unsupported:
+        return expr
+
+    if _get_constant(rv) is not _NOT_CONSTANT:
+        # the single value is not a valid expression, e.g., "true"
+        return expr
+
+    return rv
+
+
+__all__ = ("Optimizer", "optimize_expr")
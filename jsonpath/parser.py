@@ -2,38 +2,204 @@
 =====================================================
 :mod:`parser` -- Translate expression into executable
 =====================================================
+
+Two parser backends are available:
+
+- ``"lark"``, the default one,
+  parses the expression with Lark and the grammar in ``grammar.lark``.
+- ``"native"``, a hand-written recursive descent parser of the same grammar,
+  see :mod:`jsonpath.native`.
+
+The default backend can be changed by the environment variable
+``JSONPATH_PARSER``.
+
+The Lark parser is constructed on the first use of the "lark" backend,
+from the parse tables precomputed at build time,
+so importing this module stays cheap.
 """
 
+# Standard Library
+import os
+import re
+import threading
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
 # Local Folder
+from .cache import _LRUCache
 from .core import Expr, JSONPathSyntaxError, JSONPathUndefinedFunctionError
-from .lark import UnexpectedToken, VisitError
-from .transformer import JSONPathTransformer
+from .native import STRING_PATTERN
+from .native import parse as native_parse
+from .optimizer import optimize_expr
+
+_lark_lock = threading.Lock()
+_lark: Optional[Tuple[Any, Any]] = None
+
+
+def _load_lark() -> Tuple[Any, Any]:
+    """
+    Construct the Lark parser and the transformer on first use,
+    importing and building them takes quite a while.
+    The parser is created from the precomputed parse tables if possible,
+    see :mod:`jsonpath.tables`.
+    """
+    global _lark
+    if _lark is not None:
+        return _lark
+
+    with _lark_lock:
+        if _lark is None:
+            # Local Folder
+            from .lark import Lark, lark_version
+            from .tables import LARK_OPTIONS, load_lark_tables
+            from .transformer import JSONPathTransformer
+
+            transformer = JSONPathTransformer(visit_tokens=True)
+            parser = load_lark_tables(Lark, lark_version)
+            if parser is None:
+                try:
+                    parser = Lark.open_from_package(
+                        __name__, "grammar.lark", **LARK_OPTIONS
+                    )
+
+                except NameError:
+                    # Local Folder
+                    from .lark import Lark_StandAlone
+
+                    parser = Lark_StandAlone()
+
+            _lark = (parser, transformer)
+
+    return _lark
+
+
+def __getattr__(name: str) -> Any:
+    if name == "parser":
+        return _load_lark()[0]
+    elif name == "transformer":
+        return _load_lark()[1]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+# characters may be a part of the same token with their neighbors.
+_WORD = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_WORDISH = _WORD | frozenset(".+-")
 
-transformer = JSONPathTransformer(visit_tokens=True)
-try:
-    # Local Folder
-    from .lark import Lark
 
-    parser = Lark.open_from_package(
-        __name__,
-        "grammar.lark",
-        parser="lalr",
-        maybe_placeholders=True,
+def _is_separator(left: str, right: str) -> bool:
+    """
+    Check the whitespace between two characters separates two tokens,
+    which become the other tokens if the whitespace is removed.
+    e.g., "a and b", "< =", "- 1" and ". .".
+    """
+    return (
+        (left in _WORDISH and right in _WORDISH)
+        or (left in "<>!" and right == "=")
+        or (left == "$" and right in _WORD)
     )
 
-except NameError:
-    # Local Folder
-    from .lark import Lark_StandAlone
 
-    parser = Lark_StandAlone()
+def _normalize_whitespaces(part: str) -> str:
+    def repl(match: "re.Match[str]") -> str:
+        start, end = match.span()
+        if start == 0 or end == len(part):
+            return ""
+
+        if _is_separator(part[start - 1], part[end]):
+            return " "
+
+        return ""
+
+    return WHITESPACE_PATTERN.sub(repl, part)
 
 
-def parse(expr: str) -> Expr:
+def normalize_expression(expr: str) -> Tuple[Hashable, ...]:
     """
-    Transform JSONPath expression into an executable object.
+    Normalize JSONPath expression into a hashable key,
+    equivalent spellings of the expression share the same key.
 
-    >>> parse("$.a").find({"a": 1})
-    [1]
+    Insignificant whitespaces are removed,
+    and the quoted strings are compared by their content
+    no matter what quote styles they use.
+
+    >>> normalize_expression("$[ name = 'a' ]") == normalize_expression('$[name="a"]')
+    True
+    >>> normalize_expression("$[a and b]") == normalize_expression("$[aandb]")
+    False
+
+    :param expr: JSONPath expression
+    :type expr: str
+
+    :returns: The key of the expression.
+    :rtype: Tuple[Hashable, ...]
+    """
+    parts: List[Hashable] = []
+    pos = 0
+    for match in STRING_PATTERN.finditer(expr):
+        parts.append(_normalize_whitespaces(expr[pos : match.start()]))
+        # the content of quoted string is taken literally by the transformer
+        parts.append((match.group()[1:-1],))
+        pos = match.end()
+
+    parts.append(_normalize_whitespaces(expr[pos:]))
+    return tuple(parts)
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of :class:`ExprCache`.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ExprCache(_LRUCache[Union[Expr, Exception]]):
+    """
+    Thread-safe and size-bounded LRU cache of the parsed expressions.
+
+    The syntax errors are cached as well,
+    so parsing the same invalid expression repeatedly is cheap too.
+
+    The cached expressions are frozen and shared by all callers,
+    chaining new parts onto them (e.g., ``parse("$.a").Name("b")``)
+    copies them first and leaves the cached ones unchanged.
+
+    :param maxsize: The maximum number of cached expressions,
+        the cache is disabled if it is zero.
+    :type maxsize: int
+    """
+
+    def info(self) -> CacheInfo:
+        """
+        Get the statistics of the cache.
+
+        :rtype: :class:`CacheInfo`
+        """
+        return CacheInfo(*self._stats())
+
+
+cache = ExprCache()
+
+
+def lark_parse(expr: str) -> Expr:
+    """
+    Transform JSONPath expression into an executable object with Lark.
 
     :param expr: JSONPath expression
     :type expr: str
@@ -43,9 +209,13 @@ def parse(expr: str) -> Expr:
     :raises ~jsonpath.core.JSONPathError: \
         Transform JSONPath expression error.
     """
+    # Local Folder
+    from .lark import UnexpectedInput, VisitError
+
+    parser, transformer = _load_lark()
     try:
         tree = parser.parse(expr)
-    except UnexpectedToken as exc:
+    except UnexpectedInput as exc:
         raise JSONPathSyntaxError(expr) from exc
 
     try:
@@ -54,4 +224,104 @@ def parse(expr: str) -> Expr:
         if isinstance(exc.orig_exc, JSONPathUndefinedFunctionError):
             raise exc.orig_exc
 
-        raise
+        # e.g., the number "1e3" as the array index,
+        # the native backend rejects them while parsing too.
+        raise JSONPathSyntaxError(expr) from exc.orig_exc
+
+
+BACKENDS: Dict[str, Callable[[str], Expr]] = {
+    "lark": lark_parse,
+    "native": native_parse,
+}
+DEFAULT_BACKEND = os.environ.get("JSONPATH_PARSER", "lark")
+
+
+def _get_backend(backend: Optional[str]) -> str:
+    if backend is None:
+        backend = DEFAULT_BACKEND
+
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Parser backend {backend!r} not exists, "
+            f"choose one of {', '.join(map(repr, BACKENDS))}"
+        )
+
+    return backend
+
+
+def _parse(expr: str, backend: str, optimize: bool) -> Expr:
+    rv = BACKENDS[backend](expr)
+    if optimize:
+        rv = optimize_expr(rv)
+
+    return rv
+
+
+def parse(
+    expr: str,
+    cached: bool = True,
+    backend: Optional[str] = None,
+    optimize: bool = False,
+) -> Expr:
+    """
+    Transform JSONPath expression into an executable object.
+
+    >>> parse("$.a").find({"a": 1})
+    [1]
+    >>> parse("$.a", backend="native").find({"a": 1})
+    [1]
+    >>> parse("($[@ < 100])[@ >= 50]", optimize=True)
+    JSONPath('$[@ < 100 and @ >= 50]', '[@ < 100 and @ >= 50]')
+
+    The parsed expressions and the syntax errors are cached
+    by :data:`jsonpath.parser.cache`,
+    the same expression is returned for the equivalent spellings.
+
+    >>> parse("$.a[0]") is parse("$.a[ 0 ]")
+    True
+    >>> parse("$.a").Name("b").get_expression()
+    '$.a.b'
+    >>> parse("$.a").get_expression()
+    '$.a'
+
+    :param expr: JSONPath expression
+    :type expr: str
+    :param cached: Use the cache of the parsed expressions, defaults to True
+    :type cached: bool
+    :param backend: The parser backend, "lark" or "native",
+        defaults to the environment variable ``JSONPATH_PARSER`` or "lark"
+    :type backend: Optional[str]
+    :param optimize: Rewrite the parsed expression into an equivalent
+        but cheaper one, see :mod:`jsonpath.optimizer`, defaults to False
+    :type optimize: bool
+
+    :returns: An executable object.
+    :rtype: :class:`jsonpath.core.Expr`
+    :raises ~jsonpath.core.JSONPathError: \
+        Transform JSONPath expression error.
+    :raises ValueError: The parser backend not exists.
+    """
+    backend = _get_backend(backend)
+    if not cached:
+        return _parse(expr, backend, optimize)
+
+    key = (backend, optimize, normalize_expression(expr))
+    entry = cache.get(key)
+    if entry is None:
+        try:
+            entry = _parse(expr, backend, optimize)
+        except (JSONPathSyntaxError, JSONPathUndefinedFunctionError) as exc:
+            entry = exc
+        else:
+            # the shared expr is copied before chaining onto it
+            entry.frozen = True
+
+        cache.put(key, entry)
+
+    if isinstance(entry, JSONPathSyntaxError):
+        # report the error with the given spelling of the expression
+        raise JSONPathSyntaxError(expr) from entry.__cause__
+    elif isinstance(entry, Exception):
+        raise entry.with_traceback(None)
+
+    return entry
@@ -0,0 +1,65 @@
+"""
+===================================================
+:mod:`runtime` -- The helpers of the generated code
+===================================================
+
+The modules generated by :mod:`jsonpath.aot` import
+the names below only, so they keep working across the releases
+with the same major version.
+"""
+
+# Standard Library
+from typing import Any, Generator, Iterable, Optional
+
+# Local Folder
+from .core import BoundExpr, JSONPathFindError, _get_parameter, _limit
+
+
+def get_parameter(name: str) -> Any:
+    """
+    Get the value of the parameter bound on the current finding.
+
+    >>> from jsonpath import Parameter
+    >>> Parameter("a").bind(a=1).find(None)
+    [1]
+    >>> get_parameter("a")
+    Traceback (most recent call last):
+        ...
+    jsonpath.core.JSONPathUnboundParameterError: Parameter 'a' is not bound
+
+    :param name: The name of the parameter
+    :type name: str
+
+    :returns: The value of the parameter
+    :rtype: Any
+    :raises ~jsonpath.core.JSONPathUnboundParameterError: \
+        The parameter is not bound.
+    """
+    return _get_parameter(name)
+
+
+def limit_results(
+    results: Iterable[Any], limit: Optional[int], offset: int
+) -> Generator[Any, None, None]:
+    """
+    Skip the offset of the results and take the limit of the rest,
+    the lazy results stop finding once the limit is reached.
+
+    >>> list(limit_results(iter(range(10)), 3, 2))
+    [2, 3, 4]
+
+    :param results: The found results
+    :type results: Iterable[Any]
+    :param limit: The maximum number of the results, no limit if it is None.
+    :type limit: Optional[int]
+    :param offset: The number of the results to skip
+    :type offset: int
+
+    :returns: The results in the window
+    :rtype: Generator[Any, None, None]
+    :raises ValueError: The limit or the offset is negative.
+    """
+    return _limit(results, limit, offset)
+
+
+__all__ = ("BoundExpr", "JSONPathFindError", "get_parameter", "limit_results")
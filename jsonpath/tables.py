@@ -0,0 +1,129 @@
+"""
+========================================================
+:mod:`tables` -- Precomputed parse tables of the grammar
+========================================================
+
+Analyzing the grammar and computing the LALR parse tables
+takes much longer than parsing expressions.
+The tables are computed ahead of time at build time,
+and loaded on the first use of the Lark parser instead.
+
+.. code-block:: shell
+
+    python -m jsonpath.tables
+
+The tables file is the zlib-compressed pickle of plain data,
+i.e. dictionaries, lists, tuples, strings, numbers, booleans and None,
+which is loaded without resolving any global objects.
+It records the digest of the grammar and the version of Lark it computed by,
+the stale tables are ignored and the grammar is analyzed as before,
+so are the corrupt ones.
+"""
+
+# Standard Library
+import hashlib
+import io
+import os
+import pickle
+import zlib
+
+from typing import Any, Dict, NoReturn, Optional
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(__file__), "grammar.lark")
+LARK_TABLES_PATH = os.path.join(os.path.dirname(__file__), "grammar.lalr")
+LARK_OPTIONS: Dict[str, Any] = {"parser": "lalr", "maybe_placeholders": True}
+
+
+class _TablesUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> NoReturn:
+        raise pickle.UnpicklingError(f"global '{module}.{name}' is forbidden")
+
+
+def _get_grammar_digest(grammar_path: str) -> str:
+    with open(grammar_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def dump_lark_tables(
+    tables_path: str = LARK_TABLES_PATH, grammar_path: str = GRAMMAR_PATH
+) -> None:
+    """
+    Analyze the grammar and save the parse tables, needs the Lark package.
+
+    :param tables_path: The path of the tables file
+    :type tables_path: str
+    :param grammar_path: The path of the grammar file
+    :type grammar_path: str
+    """
+    # Third Party Library
+    from lark import Lark, __version__
+    from lark.grammar import Rule
+    from lark.lexer import TerminalDef
+
+    with open(grammar_path) as f:
+        parser = Lark(f.read(), **LARK_OPTIONS)
+
+    data, memo = parser.memo_serialize([TerminalDef, Rule])
+    tables = {
+        "grammar_digest": _get_grammar_digest(grammar_path),
+        "lark_version": __version__,
+        "data": data,
+        "memo": memo,
+    }
+    with open(tables_path, "wb") as f:
+        f.write(zlib.compress(pickle.dumps(tables, protocol=4), 9))
+
+
+def load_lark_tables(
+    lark_cls: Any,
+    lark_version: str,
+    tables_path: str = LARK_TABLES_PATH,
+    grammar_path: str = GRAMMAR_PATH,
+) -> Optional[Any]:
+    """
+    Create the Lark parser from the saved parse tables.
+
+    :param lark_cls: The Lark class of the Lark package or the standalone module
+    :type lark_cls: Type[Lark]
+    :param lark_version: The version of the Lark package or the standalone module
+    :type lark_version: str
+    :param tables_path: The path of the tables file
+    :type tables_path: str
+    :param grammar_path: The path of the grammar file
+    :type grammar_path: str
+
+    :returns: The Lark parser,
+        or None if the tables file not exists, is stale or is corrupt.
+    :rtype: Optional[Lark]
+    """
+    try:
+        with open(tables_path, "rb") as f:
+            content = f.read()
+
+        grammar_digest = _get_grammar_digest(grammar_path)
+    except OSError:
+        return None
+
+    try:
+        tables = _TablesUnpickler(io.BytesIO(zlib.decompress(content))).load()
+        if (
+            tables["grammar_digest"] != grammar_digest
+            or tables["lark_version"] != lark_version
+        ):
+            return None
+
+        return lark_cls._load_from_dict(tables["data"], tables["memo"])
+    except (
+        zlib.error,
+        pickle.UnpicklingError,
+        EOFError,
+        LookupError,
+        TypeError,
+        ValueError,
+    ):
+        # the truncated, corrupt or forged tables file
+        return None
+
+
+if __name__ == "__main__":
+    dump_lark_tables()
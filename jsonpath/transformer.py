@@ -1,30 +1,22 @@
 # Standard Library
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
-
-# Third Party Library
-from typing_extensions import Literal
+from typing import Any, Iterable, List, Literal, Optional, Union
 
 # Local Folder
 from .core import (
+    COMPARISON_OPERATORS,
+    FUNCTIONS,
+    T_OPERATOR,
     T_VALUE,
     And,
     Array,
     Brace,
     Compare,
-    Contains,
-    Equal,
     Expr,
     Function,
-    GreaterEqual,
-    GreaterThan,
     JSONPathUndefinedFunctionError,
-    Key,
-    LessEqual,
-    LessThan,
     Name,
-    Not,
-    NotEqual,
     Or,
+    Parameter,
     Predicate,
     Root,
     Search,
@@ -34,26 +26,10 @@ from .core import (
 )
 from .lark import Token, Transformer, v_args
 
-T_OPERATOR = Literal["<=", ">=", "<", ">", "!=", "="]
 T_ARG = Union[Expr, T_VALUE]
 T_NO_ARG = Iterable[Any]
 T_ARGS = Union[T_NO_ARG, List[T_ARG]]
 
-COMPARISON_OPERATORS: Dict[T_OPERATOR, Type[Compare]] = {
-    "<": LessThan,
-    "<=": LessEqual,
-    "=": Equal,
-    ">=": GreaterEqual,
-    ">": GreaterThan,
-    "!=": NotEqual,
-}
-
-FUNCTIONS: Dict[str, Type[Function]] = {
-    "key": Key,
-    "contains": Contains,
-    "not": Not,
-}
-
 
 @v_args(inline=True)
 class JSONPathTransformer(Transformer[Token, Expr]):
@@ -85,7 +61,8 @@ class JSONPathTransformer(Transformer[Token, Expr]):
         return quoted_string[1:-1]
 
     def identifier(self, string: str) -> Name:
-        return Name(string)
+        # the plain string instead of the token, e.g., in the found paths
+        return Name(str(string))
 
     def STAR(self, star_: Literal["*"]) -> None:
         return None
@@ -99,6 +76,9 @@ class JSONPathTransformer(Transformer[Token, Expr]):
     def value(self, value: T_VALUE) -> Value:
         return Value(value)
 
+    def parameter(self, name: str) -> Parameter:
+        return Parameter(name[1:])
+
     def comparison_expr(
         self,
         left: Expr,
@@ -113,7 +93,7 @@ class JSONPathTransformer(Transformer[Token, Expr]):
 
     def first_path(self, expr_or_str: Union[Expr, str]) -> Expr:
         if isinstance(expr_or_str, str):
-            return Name(expr_or_str)
+            return Name(str(expr_or_str))
         return expr_or_str
 
     chain_with_identifier = cdr
@@ -20,9 +20,19 @@ def build_lark_parser(pybin_path=None) -> None:
         f.write(output)
 
 
+def build_lark_tables(pybin_path=None) -> None:
+    # Standard Library
+    import subprocess
+    import sys
+
+    subprocess.check_call(args=[pybin_path or sys.executable, "-m", "jsonpath.tables"])
+
+
 def __getattr__(name: str) -> Any:
     if name == "build_lark_parser":
         return build_lark_parser
+    elif name == "build_lark_tables":
+        return build_lark_tables
 
     try:
         # Third Party Library
@@ -38,6 +48,7 @@ def __getattr__(name: str) -> Any:
                 metadata_directory: Optional[str] = None,
             ) -> str:
                 build_lark_parser()
+                build_lark_tables()
                 return func(wheel_directory, config_settings, metadata_directory)
 
             return build_wheel
@@ -49,6 +60,7 @@ def __getattr__(name: str) -> Any:
                 config_settings: Optional[Mapping[str, Any]] = None,
             ) -> str:
                 build_lark_parser()
+                build_lark_tables()
                 return func(sdist_directory, config_settings)
 
             return build_sdist
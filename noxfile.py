@@ -9,7 +9,7 @@ import nox
 
 sys.path.insert(0, "")
 # First Party Library
-from jsonpath_build import build_lark_parser  # noqa: E402
+from jsonpath_build import build_lark_parser, build_lark_tables  # noqa: E402
 
 nox.options.stop_on_first_error = True
 
@@ -19,6 +19,7 @@ os.environ.update({"PDM_IGNORE_SAVED_PYTHON": "1"})
 os.environ.pop("PYTHONPATH", None)
 
 lark_parser_path = Path("jsonpath/lark_parser.py")
+lark_tables_path = Path("jsonpath/grammar.lalr")
 
 
 def get_nox_session_pybin(session):
@@ -45,6 +46,9 @@ def coverage_test(session, parser_backend):
         "parser",
         external=True,
     )
+    if not lark_tables_path.exists():
+        build_lark_tables(get_nox_session_pybin(session))
+
     if parser_backend == "standalone":
         if not lark_parser_path.exists():
             pybin_path = get_nox_session_pybin(session)
@@ -73,6 +77,8 @@ def coverage_report(session):
 def build(session):
     if not lark_parser_path.exists():
         build_lark_parser()
+    if not lark_tables_path.exists():
+        build_lark_tables()
     session.run("pdm", "build", external=True)
 
 
@@ -0,0 +1,211 @@
+# Standard Library
+import importlib.util
+import subprocess
+import sys
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.aot import cli, create_args_parser, generate_module
+from jsonpath.compiler import MISSING, CodeGenerator, _runtime
+from jsonpath.core import (
+    JSONPathFindError,
+    JSONPathSyntaxError,
+    JSONPathUnboundParameterError,
+    Name,
+    legacy_find,
+)
+from jsonpath.parser import parse
+
+# Local Folder
+from .test_compiler import DOCUMENTS, EXPRESSIONS
+
+QUERIES = {f"query_{idx}": expression for idx, expression in enumerate(EXPRESSIONS)}
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def compiled_queries(tmp_path_factory):
+    path = tmp_path_factory.mktemp("aot") / "compiled_queries.py"
+    path.write_text(generate_module(QUERIES))
+    return load_module(path)
+
+
+def _outcome(func, *args):
+    try:
+        return "ok", func(*args)
+    except Exception as exc:
+        return "raise", type(exc)
+
+
+@pytest.mark.parametrize("name", QUERIES)
+def test_generated_query(compiled_queries, name):
+    expr = parse(QUERIES[name])
+    query = getattr(compiled_queries, name)
+    assert compiled_queries.QUERIES[name] is query
+    assert query.get_expression() == expr.get_expression()
+    assert parse(query.get_expression()).get_expression() == query.get_expression()
+
+    for data in DOCUMENTS:
+        expect = _outcome(expr.find, data)
+        if expect[0] == "raise":
+            # the compiled operands stop finding at their first result
+            rv = _outcome(query.find, data)
+            assert rv[0] == "ok" or rv == expect
+            continue
+
+        assert query.find(data) == expect[1]
+        assert query(data) == expect[1]
+        assert list(query.find_iter(data)) == expect[1]
+        if expect[1]:
+            assert query.find_first(data) == expect[1][0]
+        else:
+            with pytest.raises(JSONPathFindError):
+                query.find_first(data)
+
+
+def test_generated_source():
+    source = generate_module({"a": "$.a[@ > 1]", "b": "$..b"})
+    assert "lark" not in source
+    assert "jsonpath.parser" not in source
+    assert "def " in source
+    # the generated code depends on the public runtime helpers only
+    imports = [line for line in source.splitlines() if "import " in line]
+    assert imports and all(
+        line.startswith("from jsonpath.runtime import ") for line in imports
+    )
+
+
+def test_generate_optimized_query(tmp_path):
+    generator = CodeGenerator(allow_objects=False)
+    expr = parse("$.a.b[@.c.d > 1].e", cached=False, optimize=True)
+    find, _ = generator.query(expr)
+    assert "_legacy" not in generator.source()
+    namespace = dict(_runtime, **generator.namespace)
+    exec(generator.source(), namespace)
+    data = {"a": {"b": [{"c": {"d": 2}, "e": 1}, {"c": {"d": 0}, "e": 2}]}}
+    assert namespace[find](data, MISSING, MISSING, data) == expr.find(data) == [1]
+
+
+def test_generated_query_bind(tmp_path):
+    path = tmp_path / "compiled_queries.py"
+    path.write_text(generate_module({"orders": "$.orders[@.customer = $id].no"}))
+    module = load_module(path)
+    data = {"orders": [{"customer": 42, "no": 1}, {"customer": 7, "no": 2}]}
+    assert module.orders.bind(id=42).find(data) == [1]
+    assert module.orders.bind(id=7).find_first(data) == 2
+    with pytest.raises(JSONPathUnboundParameterError):
+        module.orders.find(data)
+
+
+def test_generated_query_limit_and_count(tmp_path):
+    path = tmp_path / "compiled_queries.py"
+    path.write_text(generate_module({"values": "$..v"}))
+    module = load_module(path)
+    data = {"a": [{"v": 1}, {"v": 2}], "b": {"v": 3}}
+    assert module.values.find(data, limit=2) == [1, 2]
+    assert module.values.find(data, offset=1) == [2, 3]
+    assert list(module.values.find_iter(data, limit=1, offset=2)) == [3]
+    assert module.values.count(data) == 3
+    assert module.values.exists(data)
+    assert not module.values.exists([])
+    assert module.values.bind().count(data) == 3
+    with pytest.raises(ValueError):
+        module.values.find(data, limit=-1)
+
+
+@pytest.mark.parametrize(
+    "queries,exc_cls",
+    [
+        ({"not-identifier": "$.a"}, ValueError),
+        ({"class": "$.a"}, ValueError),
+        ({"_private": "$.a"}, ValueError),
+        ({"QUERIES": "$.a"}, ValueError),
+        ({"a": "$*"}, JSONPathSyntaxError),
+    ],
+)
+def test_generate_module_error(queries, exc_cls):
+    with pytest.raises(exc_cls):
+        generate_module(queries)
+
+
+def test_generate_module_user_defined_expr(monkeypatch):
+    # First Party Library
+    import jsonpath.aot
+
+    class TestName(Name):
+        @legacy_find
+        def find(self, element):
+            return super().find(element)
+
+    monkeypatch.setattr(jsonpath.aot, "parse", lambda _: TestName("a"))
+    with pytest.raises(TypeError):
+        generate_module({"a": "a"})
+
+
+@pytest.mark.parametrize(
+    "filename,content",
+    [
+        (
+            "queries.toml",
+            "[queries]\nprices = '$.goods[*].price'\ncheap = '$.goods[@.price < 10]'\n",
+        ),
+        (
+            "queries.toml",
+            "prices = '$.goods[*].price'\ncheap = '$.goods[@.price < 10]'\n",
+        ),
+        (
+            "queries.json",
+            '{"prices": "$.goods[*].price", "cheap": "$.goods[@.price < 10]"}',
+        ),
+    ],
+)
+def test_cli(tmp_path, filename, content):
+    catalogue = tmp_path / filename
+    catalogue.write_text(content)
+    output = tmp_path / "compiled_queries.py"
+    subprocess.run(
+        [sys.executable, "-m", "jsonpath.aot", str(catalogue), "-o", str(output)],
+        check=True,
+    )
+
+    module = load_module(output)
+    data = {"goods": [{"price": 1}, {"price": 20}]}
+    assert module.prices.find(data) == [1, 20]
+    assert module.cheap.find(data) == [{"price": 1}]
+    assert module.cheap.get_expression() == "$.goods[@.price < 10]"
+    assert set(module.QUERIES) == {"prices", "cheap"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["a = '$*'", "a = 1", "a = '", "[queries]\n'a b' = '$.a'"],
+)
+def test_cli_error(tmp_path, content):
+    catalogue = tmp_path / "queries.toml"
+    catalogue.write_text(content)
+    proc = subprocess.run(
+        [sys.executable, "-m", "jsonpath.aot", str(catalogue)],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 1
+    assert proc.stderr.startswith(f"Error compiling {catalogue}:")
+
+
+def test_cli_toml_unsupported(tmp_path, monkeypatch):
+    # neither tomllib (Python 3.11+) nor tomli is importable
+    monkeypatch.setitem(sys.modules, "tomllib", None)
+    monkeypatch.setitem(sys.modules, "tomli", None)
+    catalogue = tmp_path / "queries.toml"
+    catalogue.write_text("a = '$.a'")
+    with pytest.raises(SystemExit, match=r"requires Python 3\.11\+ or tomli"):
+        cli(create_args_parser().parse_args([str(catalogue)]))
@@ -0,0 +1,191 @@
+# Standard Library
+import gc
+import threading
+
+from typing import Any, List, Optional
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.cache import Document, ResultCache, ResultCacheInfo
+from jsonpath.core import BoundExpr
+from jsonpath.index import DocumentIndex
+from jsonpath.parser import parse
+
+DATA = {"a": [{"b": 1}, {"b": 2}, {"b": 3}], "c": {"d": 4}}
+
+
+class _Counting(BoundExpr):
+    calls = 0
+
+    def find(
+        self,
+        element: Any,
+        *,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        index: Optional[DocumentIndex] = None,
+    ) -> List[Any]:
+        self.calls += 1
+        return super().find(element, limit=limit, offset=offset, index=index)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: parse("$.a[@.b > $b].b", cached=False).bind(b=1),
+        lambda: parse("$.a[@.b > 1].b", cached=False).compile(),
+    ],
+    ids=["bound", "compiled"],
+)
+def test_find_bound_and_compiled(make):
+    expr = make()
+    document = Document(DATA)
+    cache = ResultCache()
+    assert cache.find(expr, document) == (2, 3)
+    assert cache.find(expr, document) == (2, 3)
+    assert cache.info() == ResultCacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=1024, currsize=1
+    )
+
+
+def test_find_cached():
+    expr = _Counting(parse("$.a[*].b", cached=False), {})
+    document = Document(DATA)
+    cache = ResultCache()
+    rv = cache.find(expr, document)
+    assert rv == (1, 2, 3)
+    for _ in range(3):
+        # the hits share the cached results
+        assert cache.find(expr, document) is rv
+
+    assert expr.calls == 1
+    assert cache.find(expr, document, limit=1, offset=1) == (2,)
+    assert cache.find(expr, Document(DATA)) == (1, 2, 3)
+    assert expr.calls == 3
+    info = cache.info()
+    assert info == ResultCacheInfo(
+        hits=3, misses=3, evictions=0, maxsize=1024, currsize=3
+    )
+    assert info.hit_rate == 0.5
+
+
+def test_find_parsed():
+    document = Document(DATA)
+    cache = ResultCache()
+    for _ in range(3):
+        # parse returns the same cached expr, so it hits
+        assert cache.find(parse("$.a[*].b"), document) == (1, 2, 3)
+
+    # the expr created again misses and takes another entry
+    assert cache.find(parse("$.a[*].b", cached=False), document) == (1, 2, 3)
+    assert cache.info() == ResultCacheInfo(
+        hits=2, misses=2, evictions=0, maxsize=1024, currsize=2
+    )
+
+
+def test_find_invalidated():
+    expr = parse("$.a[*].b", cached=False)
+    document = Document({"a": [{"b": 1}]})
+    cache = ResultCache()
+    assert cache.find(expr, document) == (1,)
+    document.data["a"].append({"b": 2})
+    assert cache.find(expr, document) == (1,)
+    document.invalidate()
+    assert cache.find(expr, document) == (1, 2)
+    document.data = {"a": []}
+    assert cache.find(expr, document) == ()
+    assert cache.find(expr, document) == ()
+    assert cache.info() == ResultCacheInfo(
+        hits=2, misses=3, evictions=0, maxsize=1024, currsize=1
+    )
+
+
+def test_find_reused_ids():
+    cache = ResultCache()
+    for value in range(10):
+        # the ids of the dropped exprs and documents are likely reused
+        expr = parse("$.a", cached=False)
+        assert cache.find(expr, Document({"a": value})) == (value,)
+        del expr
+        gc.collect()
+
+    assert cache.info().hits == 0
+
+
+def test_evict():
+    cache = ResultCache(maxsize=2)
+    document = Document(DATA)
+    exprs = [parse(f"$.a[{i}].b", cached=False) for i in range(3)]
+    for expr in exprs:
+        cache.find(expr, document)
+
+    assert len(cache) == 2
+    cache.find(exprs[1], document)
+    cache.find(exprs[0], document)
+    assert cache.info() == ResultCacheInfo(
+        hits=1, misses=4, evictions=2, maxsize=2, currsize=2
+    )
+    # the least recently used is exprs[2]
+    cache.find(exprs[1], document)
+    assert cache.info().hits == 2
+    cache.resize(1)
+    assert cache.info() == ResultCacheInfo(
+        hits=2, misses=4, evictions=3, maxsize=1, currsize=1
+    )
+    cache.find(exprs[1], document)
+    assert cache.info().hits == 3
+    cache.clear()
+    assert cache.info() == ResultCacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=1, currsize=0
+    )
+    assert cache.info().hit_rate == 0
+
+
+def test_disabled():
+    cache = ResultCache(maxsize=0)
+    expr = parse("$.c.d", cached=False)
+    document = Document(DATA)
+    assert cache.find(expr, document) == (4,)
+    assert cache.find(expr, document) == (4,)
+    assert cache.info() == ResultCacheInfo(
+        hits=0, misses=2, evictions=0, maxsize=0, currsize=0
+    )
+
+
+def test_negative_maxsize():
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=-1)
+
+    with pytest.raises(ValueError):
+        ResultCache().resize(-1)
+
+
+def test_threads():
+    cache = ResultCache(maxsize=8)
+    exprs = [parse(f"$.a[{i}].b", cached=False) for i in range(3)] + [
+        parse("$.c.d", cached=False)
+    ]
+    documents = [Document(DATA), Document({"a": [{"b": 5}], "c": {"d": 6}})]
+    expected = [[tuple(expr.find(doc.data)) for expr in exprs] for doc in documents]
+    errors = []
+
+    def worker():
+        for _ in range(200):
+            for i, document in enumerate(documents):
+                for j, expr in enumerate(exprs):
+                    if cache.find(expr, document) != expected[i][j]:
+                        errors.append((i, j))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    info = cache.info()
+    assert info.currsize == len(exprs) * len(documents)
+    assert info.hits + info.misses == 4 * 200 * len(exprs) * len(documents)
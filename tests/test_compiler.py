@@ -0,0 +1,319 @@
+# Standard Library
+import random
+import reprlib
+
+from typing import Any, List
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.compiler import MISSING, CodeGenerator, _runtime
+from jsonpath.core import (
+    Array,
+    Brace,
+    Compare,
+    Contains,
+    JSONPathFindError,
+    Key,
+    Name,
+    Not,
+    Predicate,
+    Root,
+    Search,
+    Self,
+    Slice,
+    Value,
+    ctx_parent,
+    ctx_self,
+    legacy_find,
+)
+from jsonpath.parser import parse
+
+EXPRESSIONS = [
+    "boo",
+    "boo.bar",
+    "boo.bar.boo",
+    "$",
+    "@",
+    "$.*",
+    "$.'*'",
+    "boo.*",
+    "boo.*.boo",
+    "$[0]",
+    "$[1]",
+    "$[-1]",
+    "$[-5]",
+    "boo[0]",
+    "$[*]",
+    "$[:1]",
+    "$[1:2]",
+    "$[:]",
+    "$[:-1]",
+    "$[::2]",
+    "$[::-1]",
+    "$[a:]",
+    "$[:a]",
+    "$[::a]",
+    "$.data[$.a:]",
+    "$.data[a:b]",
+    "$.data[$.start:$.stop:$.step]",
+    "$.*[0]",
+    "$.*[*]",
+    "($.*)[0]",
+    "($.*[*])[0]",
+    "$..boo",
+    "$..boo.bar",
+    "$..[0]",
+    "$..[*]",
+    "$..[:-1:2]",
+    "$..[result]",
+    "$..[price > 100]",
+    "$..[key() = 0]",
+    "$[@ < 10]",
+    "($[@ < 10])[@ > 1]",
+    "$[@.price > 100]",
+    "$[price >= 100]",
+    "$[price < 100]",
+    "$[price <= 100]",
+    "$[price = 100]",
+    "$[price != 100]",
+    "$[@.price]",
+    "$[@]",
+    "$[@.*]",
+    "$[price > 100.5]",
+    "$[on = null]",
+    "$[on = true]",
+    "$[on = false]",
+    "$.systems[on = $.on]",
+    "$.systems[on = $.notexists]",
+    '$[name = "john"]',
+    "$[*].name",
+    '$[key() = "bookA"]',
+    "$[key() = 0]",
+    '$[contains(key(), "book")]',
+    '$[contains(@.category, "book")]',
+    "$.goods[contains(@.category, $.targetCategory)]",
+    '$[type = "book" and price > 100]',
+    '$[(type = "book" or type = "video") and price > 100]',
+    '$[type = "book" or type = "video" or type = "audio"]',
+    "$[is]",
+    '$[contains(@, "is")]',
+    "$[not(is)]",
+    '$[not(contains(@, "is"))]',
+    '$[not(type = "book" or type = "video")]',
+    "$[100 = price]",
+    "$[@ and 1]",
+    "$[c and (a or b)]",
+    "$[not((a and b)) or c]",
+    "$.goods[@.price >= 10 and @.price < 20]",
+    "$.goods[@.tags[@ = 'x']]",
+    "$.goods[@.tags[*] = 'x'].name",
+    "$[*][*][*]",
+    "$.*.*.*",
+    "$..[@ > 1]",
+    '$..goods[@.category = "magazine"].price',
+    "a[(b[0] or b[1]) and (b.c)[0].d]",
+    "$[(a.b).c]",
+    "((a.b).c).d",
+    "$[1 < @]",
+]
+
+
+def _random_value(rnd, depth):
+    choice = rnd.random()
+    if depth <= 0 or choice < 0.3:
+        return rnd.choice(
+            [0, 1, 2, 10, 99, 100, 150, 200, -1, 0.0, 100.5, True, False, None]
+            + ["", "x", "book", "Comic book", "magazine", "john", "is"]
+        )
+    elif choice < 0.65:
+        keys = rnd.sample(
+            [
+                "boo",
+                "bar",
+                "price",
+                "name",
+                "is",
+                "on",
+                "type",
+                "tags",
+                "category",
+                "goods",
+                "result",
+                "a",
+                "b",
+                "c",
+                "d",
+                "data",
+                "start",
+                "stop",
+                "step",
+                "bookA",
+            ],
+            rnd.randint(0, 5),
+        )
+        return {key: _random_value(rnd, depth - 1) for key in keys}
+    else:
+        return [_random_value(rnd, depth - 1) for _ in range(rnd.randint(0, 5))]
+
+
+IS_VALUES: List[Any] = [1, 0, True, False, [], None, {}, "str", 1.1, 0.0]
+DOCUMENTS = [
+    {"boo": {"boo": {"boo": 1}, "bar": {"boo": 2}}},
+    {"boo": [1, 2, 3], "bar": [2, 3, 4]},
+    [0, 10, 12, 1, 3],
+    [{"price": 100}, {"price": 200}, {"isbn": ""}, {}],
+    {"bookA": {"price": 100}, "bookB": {"price": 200}, "pictureA": {}},
+    {"data": [0, 1, 2, 3, 4], "start": 1, "stop": 10, "step": 2, "a": 1, "b": 3},
+    {"data": [0, 1, 2, 3, 4], "start": "1", "stop": 10, "step": 2},
+    {"systems": [{"on": True}, {"on": False}, {"on": None}], "on": False},
+    {
+        "goods": [
+            {"price": 100, "category": "Comic book", "tags": ["x", "y"]},
+            {"price": 15, "category": "magazine", "tags": ["y"], "name": "m"},
+            {"price": 200, "no category": "", "tags": [], "name": "n"},
+        ],
+        "targetCategory": "book",
+    },
+    [
+        {"type": "book", "price": 100},
+        {"type": "book", "price": 200},
+        {"type": "video", "price": 200},
+        {"type": "audio", "price": 100},
+    ],
+    [{"is": v} for v in IS_VALUES] + [{}],
+    [{"result": {"result": "result"}}, [[1, [2]]], {"a": {"b": {"c": {"d": 1}}}}],
+    [[[1, 2], [3]], [[4]]],
+    "abc",
+    1,
+    None,
+    *(_random_value(random.Random(seed), 5) for seed in range(30)),
+]
+
+
+def _outcome(func, *args):
+    try:
+        return "ok", func(*args)
+    except Exception as exc:
+        return "raise", type(exc)
+
+
+def assert_same(expr, data):
+    compiled = expr.compile()
+    assert compiled.get_expression() == expr.get_expression()
+
+    expect = _outcome(expr.find, data)
+    if expect[0] == "raise":
+        # the compiled operands stop finding at their first result,
+        # so the errors of the rest results may not be raised.
+        rv = _outcome(compiled.find, data)
+        assert rv[0] == "ok" or rv == expect
+        return
+
+    assert _outcome(compiled.find, data) == expect
+    assert _outcome(lambda d: list(compiled.find_iter(d)), data) == expect
+    if expect[0] == "ok":
+        if expect[1]:
+            assert compiled.find_first(data) == expect[1][0]
+        else:
+            with pytest.raises(JSONPathFindError):
+                compiled.find_first(data)
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_compiled_parsed_expression(expression):
+    expr = parse(expression)
+    for data in DOCUMENTS:
+        assert_same(expr, data)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        Name("boo"),
+        Name(),
+        Root(),
+        Self(),
+        Value(1),
+        Array(0),
+        Array(Slice(1, None, 2)),
+        Slice(None, -1),
+        Root().Slice(Root().Name("start"), Root().Name("stop")),
+        Root().Array(Slice(Name("a"), step=Value(2))),
+        Root().Search(Name("boo").Name("bar")),
+        Root().Search(Search(Name("boo"))),
+        Root().Search(Name("boo"), max_depth=0),
+        Root().Search(Name("boo"), max_depth=2),
+        Root().Search(Predicate(Name("price") > 1), max_depth=1),
+        Root().Predicate(Contains(Name("boo").Name("bar"), 1)),
+        Root().Predicate(Contains(Self(), Value("is"))),
+        Root().Predicate(Contains(Self(), Root().Name("name"))),
+        Root().Predicate(Not(Not(Name("price")))),
+        Root().Predicate(Name("price").Predicate(Self() > 1)),
+        Root().Predicate(Brace(Name("price")).Array(0) > 1),
+        Root().Predicate(Name("price").Compare(1)),
+        Root().Predicate(Name("price").And(True)),
+        Root().Predicate(Name("price").Or(Name("name"))),
+        Root().Predicate(Self() == float("inf")),
+        Root().Predicate(Key() == Root().Name("key")),
+        Root().Name().Predicate(Key() != 0),
+        Brace(Root().Predicate(Self() < 100)).Predicate(Self() >= 50),
+        Brace(Root().Name().Array()).Array(0),
+        Value(1).LessThan(Value(2)),
+        Value(1).LessThan(2),
+        Key(),
+    ],
+    ids=reprlib.repr,
+)
+def test_compiled_builder_expression(expr):
+    for data in DOCUMENTS:
+        assert_same(expr, data)
+
+
+def test_compiled_user_defined_expr():
+    history = []
+
+    class TestName(Name):
+        @legacy_find
+        def find(self, element):
+            history.append((ctx_parent.get(), ctx_self.get(None)))
+            return super().find(element)
+
+    class TestCompare(Compare):
+        _operator = staticmethod(lambda a, b: a % b == 0)
+
+    root = {"a": [{"b": 4}, {"b": 3}]}
+    expr = Root().Name("a").Predicate(TestName("b").TestCompare(2))
+    assert expr.compile().find(root) == [{"b": 4}]
+    assert history == [(root, (0, {"b": 4})), (root, (1, {"b": 3}))]
+    assert_same(expr, root)
+
+
+def test_generate_dropped_exprs():
+    generator = CodeGenerator()
+    # the exprs are dropped after generating, their ids are likely reused
+    names = [
+        generator.query(parse(expression, cached=False)) for expression in EXPRESSIONS
+    ]
+    namespace = dict(_runtime, **generator.namespace)
+    exec(generator.source(), namespace)
+    for expression, (find, _) in zip(EXPRESSIONS, names):
+        expr = parse(expression)
+        for data in DOCUMENTS:
+            expect = _outcome(expr.find, data)
+            if expect[0] == "ok":
+                assert namespace[find](data, MISSING, MISSING, data) == expect[1]
+
+
+def test_compiled_expr_repr():
+    compiled = parse("$.a[@ > 1]").compile()
+    assert repr(compiled) == "CompiledJSONPath('$.a[@ > 1]')"
+    assert "def " in compiled.source
+
+
+def test_compiled_expr_find_iter_lazily():
+    compiled = parse("$[*]").compile()
+    it = compiled.find_iter([1, 2, 3])
+    assert next(it) == 1
+    assert list(it) == [2, 3]
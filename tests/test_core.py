@@ -1,5 +1,10 @@
 # Standard Library
+import copy
+import pickle
 import reprlib
+import weakref
+
+from typing import Any, Dict, List, Tuple
 
 # Third Party Library
 import pytest
@@ -7,21 +12,36 @@ import pytest
 # First Party Library
 from jsonpath.core import (
     Array,
+    BoundExpr,
     Brace,
     Contains,
+    Expr,
+    ExprInterner,
+    JSONPathError,
+    JSONPathFindError,
+    JSONPathUnboundParameterError,
     Key,
     Name,
     Not,
+    Parameter,
     Predicate,
     Root,
+    Search,
     Self,
     Slice,
     Value,
+    ctx_params,
     ctx_parent,
+    ctx_root,
+    ctx_self,
+    legacy_find,
 )
+from jsonpath.parser import parse
 
 # Local Folder
-from .utils import assert_find
+from .test_compiler import DOCUMENTS, _outcome
+from .test_native import ExpressionGenerator
+from .utils import assert_find, dump
 
 
 @pytest.mark.parametrize(
@@ -416,6 +436,7 @@ def test_get_parent_object():
     root = {"a": 1}
 
     class TestName1(Name):
+        @legacy_find
         def find(self, element):
             with pytest.raises(LookupError):
                 ctx_parent.get()
@@ -428,6 +449,7 @@ def test_get_parent_object():
     root_2 = {"a": {"b": 1}}
 
     class TestName2(Name):
+        @legacy_find
         def find(self, element):
             assert ctx_parent.get() == root_2
             assert element == {"b": 1}
@@ -440,6 +462,7 @@ def test_get_parent_array():
     root = [{"a": 1}, {"a": 2}]
 
     class TestName(Name):
+        @legacy_find
         def find(self, element):
             assert ctx_parent.get() == root
             assert element in root
@@ -455,6 +478,7 @@ def test_get_parent_while_searching():
     history = []
 
     class TestName(Name):
+        @legacy_find
         def find(self, element):
             parents.append(ctx_parent.get())
             history.append(element)
@@ -463,3 +487,1029 @@ def test_get_parent_while_searching():
     assert Root().Search(TestName("c")).find(root) == [1]
     assert parents == [root, root, root["a"], root["a"]["b"]]
     assert history == [root, root["a"], root["a"]["b"], 1]
+
+
+def test_user_defined_expr_context():
+    history = []
+
+    class Record(Expr):
+        def _get_partial_expression(self):
+            return "record()"
+
+        @legacy_find
+        def find(self, element):
+            history.append(
+                (
+                    element,
+                    ctx_root.get(),
+                    ctx_parent.get(),
+                    ctx_self.get(),
+                    ctx_params.get(),
+                )
+            )
+            # finds by the built-in expr in the user-defined expr
+            return Self().Name("v").find(element)
+
+    root = {"a": [{"v": 1}, {"v": 0}]}
+    expr = Root().Name("a").Predicate(Record())
+    assert expr.find(root) == [{"v": 1}]
+    assert expr.bind(p=1).find(root) == [{"v": 1}]
+    assert history == [
+        ({"v": 1}, root, root, (0, {"v": 1}), {}),
+        ({"v": 0}, root, root, (1, {"v": 0}), {}),
+        ({"v": 1}, root, root, (0, {"v": 1}), {"p": 1}),
+        ({"v": 0}, root, root, (1, {"v": 0}), {"p": 1}),
+    ]
+    with pytest.raises(LookupError):
+        ctx_root.get()
+
+
+def test_user_defined_expr_find_error():
+    class Odd(Expr):
+        def _get_partial_expression(self):
+            return "odd()"
+
+        @legacy_find
+        def find(self, element):
+            if not isinstance(element, int) or element % 2 == 0:
+                raise JSONPathFindError
+            return [element]
+
+    data = {"a": [1, 2, 3], "b": {"c": 4}}
+    assert Root().Name("a").Array().Odd().find(data) == [1, 3]
+    assert Root().Name("a").Array().Odd().find(data, offset=1) == [3]
+    assert Root().Search(Odd()).find(data) == [1, 3]
+    assert Root().Name("a").Predicate(Odd()).find(data) == [1, 3]
+    assert Root().Name("a").Predicate(Odd() > 1).find(data) == [3]
+    assert Root().Name("b").Name("c").Odd().find(data) == []
+    assert Root().Name("b").Name("c").Odd().compile().find(data) == []
+    with pytest.raises(JSONPathFindError):
+        Root().Name("b").Name("c").Odd().find_first(data)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$.a.b.c",
+        "$.a[0].b",
+        "$.a[$.x:$.y]",
+        "$.a[@.b = $.x]",
+        "$.a[@.b and @.c or $.x]",
+        "$..[@.b > 1].c",
+        "$.a[contains(@.b, $.x)]",
+    ],
+)
+def test_find_misses_without_raising(monkeypatch, expression):
+    def init(self, *args):
+        raise AssertionError("the miss raises JSONPathFindError")
+
+    monkeypatch.setattr(JSONPathFindError, "__init__", init)
+    expr = parse(expression, cached=False)
+    documents: List[Dict[str, Any]] = [
+        {},
+        {"a": {}},
+        {"a": [{}, {"c": 1}, 1]},
+        {"a": [], "x": "z"},
+    ]
+    for data in documents:
+        assert expr.find(data) == list(expr.find_iter(data))
+        assert expr.optimize().find(data) == expr.find(data)
+
+    with pytest.raises(AssertionError):
+        expr.find_first({})
+
+
+def _long_chain(begin: Expr, length: int) -> Tuple[Expr, Dict[str, Any]]:
+    data: Dict[str, Any] = {"a": [0, 1, 2]}
+    for _ in range(length - 1):
+        data = {"a": data}
+
+    expr = begin
+    for _ in range(length):
+        expr = expr.Name("a")
+
+    return expr.Array(), data
+
+
+def test_find_iter_long_chain():
+    expr, data = _long_chain(Root(), 5001)
+    rv = expr.find_iter(data)
+    assert next(rv) == 0
+    assert list(rv) == [1, 2]
+
+
+def test_find_long_chain():
+    expr, data = _long_chain(Root(), 5001)
+    assert expr.find(data) == [0, 1, 2]
+    assert expr.find(data, limit=1, offset=1) == [1]
+    assert expr.find_first(data) == 0
+    assert expr.count(data) == 3
+    assert expr.exists(data)
+    assert not expr.exists({"a": {}})
+    assert len(expr.find_with_paths(data)) == 3
+
+    # the operands in the predicate
+    operand, data = _long_chain(Self(), 5001)
+    assert Root().Predicate(operand == 0).find([data, {}]) == [data]
+    assert Root().Predicate(operand < 1).count([data, {}]) == 1
+
+
+SEARCH_DATA = {"a": 1, "b": {"a": 2, "c": [{"a": 3}]}}
+
+
+@pytest.mark.parametrize(
+    "expr,expect",
+    [
+        (Root().Search(Name("a")), [1, 2, 3]),
+        (Root().Search(Name("a"), max_depth=0), [1]),
+        (Root().Search(Name("a"), max_depth=2), [1, 2]),
+        (Root().Search(Name("a"), max_depth=3), [1, 2, 3]),
+        (
+            Root().Search(Predicate(Name("a") > 0)),
+            [SEARCH_DATA, SEARCH_DATA["b"], {"a": 3}],
+        ),
+        (
+            Root().Search(Predicate(Name("a") > 0), max_depth=0),
+            [SEARCH_DATA, SEARCH_DATA["b"]],
+        ),
+        (Root().Name("b").Search(Name("a"), max_depth=0), [2]),
+    ],
+    ids=reprlib.repr,
+)
+def test_search_max_depth(expr, expect):
+    assert expr.find(SEARCH_DATA) == expect
+    assert list(expr.find_iter(SEARCH_DATA)) == expect
+    assert expr.compile().find(SEARCH_DATA) == expect
+
+
+def test_search_invalid_max_depth():
+    with pytest.raises(ValueError):
+        Search(Name("a"), max_depth=-1)
+
+
+def test_search_deep_document():
+    data: Dict[str, Any] = {"a": 0}
+    for _ in range(10000):
+        data = {"b": [data]}
+
+    expr = Root().Search(Name("a"))
+    assert expr.find(data) == [0]
+    assert expr.find_first(data) == 0
+    assert expr.compile().find(data) == [0]
+
+
+class Untouchable(List[Any]):
+    def __iter__(self):
+        raise AssertionError("the rest data is searched")
+
+
+def test_search_lazily():
+    data = {"a": 1, "b": Untouchable([{"a": 2}])}
+    expr = Root().Search(Name("a"))
+    assert next(expr.find_iter(data)) == 1
+    assert expr.find_first(data) == 1
+    assert expr.compile().find_first(data) == 1
+    with pytest.raises(AssertionError):
+        expr.find(data)
+
+    # the first found element is used only
+    data = {"a": [1], "b": Untouchable([{"a": [2]}])}
+    expr = Root().Predicate(Contains(Self().Search(Name("a")), 1))
+    assert expr.find([data]) == [data]
+
+
+class Unreachable:
+    def __gt__(self, other):
+        raise AssertionError("the rest items are filtered")
+
+
+class FirstOnly(List[Any]):
+    def __getitem__(self, idx):
+        if idx != 0:
+            raise AssertionError("the rest items are sliced")
+
+        return super().__getitem__(idx)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+@pytest.mark.parametrize(
+    "expression,expect",
+    [
+        ("$.a[@.x > 1]", {"x": 2}),
+        ("$.*[@.x > 1]", {"x": 2}),
+        ("$..[@.x > 1]", {"x": 2}),
+        ("$.b[0:]", 0),
+        ("$.b[::2]", 0),
+        ("$.b[-3:]", 0),
+    ],
+)
+def test_find_iter_lazily(expression, expect):
+    data = {"a": [{"x": 2}, {"x": Unreachable()}], "b": FirstOnly([0, [1], 2])}
+    expr = parse(expression, cached=False)
+    assert next(expr.find_iter(data)) == expect
+    assert expr.find_first(data) == expect
+    with pytest.raises(AssertionError):
+        expr.find(data)
+
+
+def test_operand_first_value_only():
+    values = [2, Unreachable()]
+    data = {"a": [{"v": values}], "b": FirstOnly([1, 2, 3])}
+    for expression, expect in [
+        ("$.a[@.v[*] > 1]", data["a"]),
+        ("$.a[@.v[0] > $.b[*]]", data["a"]),
+        ("$.a[0].v[$.b[*]:]", values[1:]),
+        ("$.a[contains(@.v, $.b[*])]", []),
+    ]:
+        expr = parse(expression, cached=False)
+        assert expr.find(data) == expect
+        assert expr.compile().find(data) == expect
+
+
+LIMIT_DATA = {"a": [{"v": 1}, {"v": 2}], "b": {"v": 3, "c": {"v": 4}}}
+
+
+@pytest.mark.parametrize("load", [lambda expr: expr, lambda expr: expr.compile()])
+@pytest.mark.parametrize(
+    "limit,offset,expect",
+    [
+        (None, 0, [1, 2, 3, 4]),
+        (2, 0, [1, 2]),
+        (2, 1, [2, 3]),
+        (None, 3, [4]),
+        (0, 0, []),
+        (10, 2, [3, 4]),
+        (1, 10, []),
+    ],
+)
+def test_find_limit_offset(load, limit, offset, expect):
+    expr = load(parse("$..v"))
+    assert expr.find(LIMIT_DATA, limit=limit, offset=offset) == expect
+    assert list(expr.find_iter(LIMIT_DATA, limit=limit, offset=offset)) == expect
+    assert expr.bind().find(LIMIT_DATA, limit=limit, offset=offset) == expect
+    assert list(expr.bind().find_iter(LIMIT_DATA, limit=limit, offset=offset)) == expect
+
+
+@pytest.mark.parametrize("load", [lambda expr: expr, lambda expr: expr.compile()])
+@pytest.mark.parametrize("kwargs", [{"limit": -1}, {"offset": -1}])
+def test_find_invalid_limit_offset(load, kwargs):
+    expr = load(parse("$..v"))
+    with pytest.raises(ValueError):
+        expr.find(LIMIT_DATA, **kwargs)
+    with pytest.raises(ValueError):
+        list(expr.find_iter(LIMIT_DATA, **kwargs))
+
+
+@pytest.mark.parametrize(
+    "expression,expect",
+    [
+        ("$..v", 4),
+        ("$.a[*]", 2),
+        ("$.b.*", 2),
+        ("$.a[1:]", 1),
+        ("$.a[@.v > 1]", 1),
+        ("$.b[@.v > 1]", 1),
+        ("$.c", 0),
+        ("$.b.c.v[0]", 0),
+    ],
+)
+def test_exists_and_count(expression, expect):
+    expr = parse(expression)
+    for found in (expr, expr.compile(), expr.bind()):
+        assert found.count(LIMIT_DATA) == expect
+        assert found.exists(LIMIT_DATA) is bool(expect)
+
+
+@pytest.mark.parametrize("expression", ["$.a[@.x > 1]", "$..[@.x > 1]"])
+def test_limit_stops_finding(expression):
+    data = {"a": [{"x": 2}, {"x": 3}, {"x": Unreachable()}]}
+    expr = parse(expression)
+    for found in (expr, expr.compile()):
+        assert found.find(data, limit=2) == [{"x": 2}, {"x": 3}]
+        assert found.find(data, limit=1, offset=1) == [{"x": 3}]
+        assert found.exists(data)
+        with pytest.raises(AssertionError):
+            found.find(data, limit=3)
+        with pytest.raises(AssertionError):
+            found.count(data)
+
+
+def pickle_roundtrip(expr):
+    return pickle.loads(pickle.dumps(expr))
+
+
+@pytest.mark.parametrize("load", [pickle_roundtrip, copy.deepcopy])
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$.a.b[0]",
+        "$..price",
+        "$[*]",
+        "$.data[$.start:$.stop:$.step]",
+        "$[::-1]",
+        '$.goods[@.price >= 10 and @.price < 20 and @.category = "book"]',
+        '$[contains(key(), "book") or not(@.disabled)].name',
+        "($.data[@ < 3])[@ > 1]",
+        "$..[price > 100]",
+        "$[on = null]",
+        "$[price > 100.5]",
+    ],
+)
+def test_pickle_and_deepcopy(load, expression, monkeypatch):
+    expr = parse(expression)
+    # First Party Library
+    import jsonpath.parser
+
+    def parse_(expression):
+        raise AssertionError("loading must not parse the expression")
+
+    for backend in jsonpath.parser.BACKENDS:
+        monkeypatch.setitem(jsonpath.parser.BACKENDS, backend, parse_)
+
+    loaded = load(expr)
+    assert loaded is not expr
+    assert dump(loaded) == dump(expr)
+    assert loaded.get_expression() == expression
+
+    data = {
+        "a": {"b": [1]},
+        "price": 200,
+        "goods": [{"price": 15, "category": "book"}, {"price": 1}],
+        "data": [0, 1, 2, 3, 4],
+        "start": 1,
+        "stop": 4,
+        "step": 2,
+    }
+    assert loaded.find(data) == expr.find(data)
+
+
+@pytest.mark.parametrize("load", [pickle_roundtrip, copy.deepcopy])
+def test_pickle_and_deepcopy_part_of_chain(load):
+    root = Root()
+    name = root.Name("a")
+    expr = name.Predicate(Self() > 1)
+    loaded = load(name)
+    assert loaded.get_expression() == "$.a"
+    assert loaded.find({"a": [1, 2]}) == [[1, 2]]
+    # the original chain is untouched
+    assert expr.get_expression() == "$.a[@ > 1]"
+
+    loaded = load(root)
+    assert loaded.get_expression() == "$"
+    assert loaded.get_begin() is loaded
+
+
+@pytest.mark.parametrize("load", [pickle_roundtrip, copy.deepcopy])
+def test_pickle_and_deepcopy_shared_expr(load):
+    target = Root().Name("target")
+    expr = Root().Predicate(Self() == target).Predicate(Self() != target)
+    loaded = load([expr, target])
+    assert loaded[0].get_expression() == expr.get_expression()
+    assert loaded[1].get_expression() == "$.target"
+
+
+def test_pickle_compiled_expr():
+    compiled = parse("$.a[@ > 1]").compile()
+    loaded = pickle_roundtrip(compiled)
+    assert repr(loaded) == repr(compiled)
+    assert loaded.find({"a": [1, 2, 3]}) == [2, 3]
+
+
+def test_chain_twice():
+    data = {"a": {"b": 1, "c": 2}}
+    expr = Root().Name("a")
+    b = expr.Name("b")
+    c = expr.Name("c")
+    assert b.get_expression() == "$.a.b"
+    assert c.get_expression() == "$.a.c"
+    assert b.find(data) == [1]
+    assert c.find(data) == [2]
+
+
+def test_chain_frozen():
+    expr = Root().Name("a")
+    expr.frozen = True
+    chained = expr.Name("b")
+    assert not chained.frozen and chained.left is not expr
+    assert expr.get_next() is None
+    assert expr.find({"a": {"b": 1}}) == [{"b": 1}]
+    assert chained.find({"a": {"b": 1}}) == [1]
+    assert Root().chain(expr).left is not expr.left
+
+
+class CountingDict(Dict[str, Any]):
+    """
+    Count the lookups of the fields.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = {}
+
+    def __getitem__(self, key):
+        self.lookups[key] = self.lookups.get(key, 0) + 1
+        return super().__getitem__(key)
+
+
+@pytest.mark.parametrize(
+    "expression,data,expect",
+    [
+        (
+            "$.items[@.price > $.threshold].price",
+            {"threshold": 2, "items": [{"price": i} for i in range(5)]},
+            [3, 4],
+        ),
+        (
+            "$.*[$.start:$.stop]",
+            {"start": 1, "stop": 2, "a": [0, 1, 2], "b": [3, 4], "c": [5]},
+            [1, 4],
+        ),
+        (
+            "$..[@.v > $.threshold].v",
+            {"threshold": 2, "a": [{"v": 3}, {"b": [{"v": 1}, {"v": 4}]}]},
+            [3, 4],
+        ),
+        (
+            '$.items[contains(@.tags, $.tag) and @.tags[@ = "x"]].name',
+            {
+                "tag": "a",
+                "items": [
+                    {"tags": ["a", "x"], "name": 1},
+                    {"tags": ["b", "x"], "name": 2},
+                    {"tags": ["a"], "name": 3},
+                ],
+            },
+            [1],
+        ),
+        (
+            # "@" in the nested predicate is the item of the nested predicate
+            "$.items[@ > $.limits[@ > 1]]",
+            {"items": [1, 2, 3, 4], "limits": [0, 2, 5]},
+            [3, 4],
+        ),
+    ],
+    ids=reprlib.repr,
+)
+def test_root_invariant_operand(expression, data, expect):
+    data = CountingDict(data)
+    assert parse(expression).find(data) == expect
+    assert set(data.lookups.values()) == {1}, data.lookups
+
+
+@pytest.mark.parametrize(
+    "expression,data,expect",
+    [
+        (
+            # the slice field "@.i" finds in the item of the outer predicate
+            "$.items[@.v = $.data[@.i:]].v",
+            {"data": [0, 1, 2, 3], "items": [{"v": 1, "i": 1}, {"v": 2, "i": 2}]},
+            [1, 2],
+        ),
+        (
+            "$.items[@ > $.limit and @]",
+            {"limit": 0, "items": [0, 1, 2]},
+            [1, 2],
+        ),
+    ],
+    ids=reprlib.repr,
+)
+def test_item_dependent_operand(expression, data, expect):
+    assert parse(expression).find(data) == expect
+
+
+def test_root_invariant_operand_per_finding():
+    expr = parse("$.items[@ > $.threshold]")
+    assert expr.find({"threshold": 1, "items": [1, 2, 3]}) == [2, 3]
+    assert expr.find({"threshold": 2, "items": [1, 2, 3]}) == [3]
+    assert list(expr.find_iter({"threshold": 0, "items": [1, 2]})) == [1, 2]
+
+
+@pytest.mark.parametrize("backend", ["lark", "native"])
+@pytest.mark.parametrize(
+    "expression,params,data,expect",
+    [
+        (
+            "$.orders[@.customer = $id].no",
+            {"id": 42},
+            {"orders": [{"customer": 42, "no": 1}, {"customer": 7, "no": 2}]},
+            [1],
+        ),
+        ("$[$start:$stop]", {"start": 1, "stop": 3}, [0, 1, 2, 3], [1, 2]),
+        ("$[contains($tags, @)]", {"tags": ["a", "b"]}, ["a", "c", "b"], ["a", "b"]),
+        ("$[@.v > $limits.v]", {"limits": {"v": 1}}, [{"v": 1}, {"v": 2}], [{"v": 2}]),
+        ("$user.name", {"user": {"name": "boo"}}, None, ["boo"]),
+        ("$[not($flag)]", {"flag": False}, [1, 2], [1, 2]),
+    ],
+    ids=reprlib.repr,
+)
+def test_parameter(backend, expression, params, data, expect):
+    expr = parse(expression, backend=backend)
+    assert expr.get_expression() == expression
+    bound = expr.bind(**params)
+    assert bound.find(data) == expect
+    assert list(bound.find_iter(data)) == expect
+    assert bound.find_first(data) == expect[0]
+    assert expr.compile().bind(**params).find(data) == expect
+    assert expr.optimize().bind(**params).find(data) == expect
+
+
+def test_parameter_rebind():
+    expr = Root().Predicate(Self() > Parameter("min"))
+    assert isinstance(expr.bind(min=1), BoundExpr)
+    assert repr(expr.bind(min=1)) == "BoundJSONPath('$[@ > $min]', {'min': 1})"
+    assert expr.bind(min=1).find([0, 1, 2]) == [2]
+    assert expr.bind(min=1).bind(min=0).find([0, 1, 2]) == [1, 2]
+    assert expr.bind(min=1).bind(other=0).find([0, 1, 2]) == [2]
+    with pytest.raises(JSONPathFindError):
+        expr.bind(min=2).find_first([0, 1, 2])
+
+
+def test_unbound_parameter():
+    expr = parse("$[@ > $min]")
+    with pytest.raises(JSONPathUnboundParameterError, match="'min'"):
+        expr.find([1])
+    with pytest.raises(JSONPathUnboundParameterError, match="'min'"):
+        expr.bind(max=1).find([1])
+    with pytest.raises(JSONPathUnboundParameterError, match="'min'"):
+        expr.compile().find([1])
+
+    # the parameters are bound on finding only
+    bound = expr.bind(min=0)
+    assert next(bound.find_iter([1])) == 1
+    with pytest.raises(JSONPathUnboundParameterError):
+        expr.find([1])
+
+
+@pytest.mark.parametrize("name", ["", "1a", "a-b", "$a", "a b"])
+def test_invalid_parameter_name(name):
+    with pytest.raises(ValueError):
+        Parameter(name)
+
+
+@pytest.mark.parametrize("load", [pickle_roundtrip, copy.deepcopy])
+def test_pickle_and_deepcopy_search_max_depth(load):
+    loaded = load(Root().Search(Name("a"), max_depth=1))
+    assert loaded.max_depth == 1
+    assert loaded.find({"a": 1, "b": {"a": 2, "c": {"a": 3}}}) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        '$.a[@.b > 1 and contains(@.c, "d") or not(@.e)][0]',
+        "$..f[$.g:$.h:2].*",
+        "($.i[@ < $j])[key() != 1]",
+    ],
+)
+def test_expr_slots(expression):
+    expr = parse(expression, cached=False, optimize=True)
+    nodes = [expr]
+    while nodes:
+        node = nodes.pop()
+        assert not hasattr(node, "__dict__"), type(node)
+        assert weakref.ref(node)() is node
+        nodes.extend(arg for arg in node._init_args() if isinstance(arg, Expr))
+        if node.left is not None:
+            nodes.append(node.left)
+
+    class Double(Self):
+        label: str
+
+        def _find(self, element, ctx):
+            return [element * 2]
+
+    double = Double()
+    double.label = "double"
+    assert Root().Name("a").chain(double).find({"a": 1}) == [2]
+
+
+@pytest.mark.parametrize("load", [pickle_roundtrip, copy.deepcopy])
+def test_pickle_and_deepcopy_bound_expr(load):
+    bound = parse("$[@.v = $v]", cached=False).bind(v=1)
+    loaded = load(bound)
+    assert dump(loaded.expr) == dump(bound.expr)
+    assert loaded.params == {"v": 1}
+    assert loaded.find([{"v": 1}, {"v": 2}]) == [{"v": 1}]
+
+
+def test_parameter_invariant_operand():
+    data = CountingDict({"v": 2})
+    expr = parse("$.items[@ > $data.v]")
+    params = {"data": data}
+    assert expr.bind(**params).find({"items": [1, 2, 3, 4]}) == [3, 4]
+    assert data.lookups == {"v": 1}
+
+
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        ["$.a.b", "$ . a . b", "$.'a'.b"],
+        ["$[@.a > 1]", "$[@.a>1]"],
+        ['$.a[contains(@.b, "c") and $x]', '$.a[contains(@.b,"c") and $x]'],
+        ["$..a[$.b:$.c:2]", "$..a[$.b : $.c : 2]"],
+    ],
+)
+def test_expr_key(expressions):
+    keys = {
+        parse(expression, cached=False, backend=backend).key()
+        for expression in expressions
+        for backend in ("lark", "native")
+    }
+    assert len(keys) == 1
+    key = keys.pop()
+    assert hash(key) == hash(pickle_roundtrip(parse(expressions[0])).key())
+    assert {key: 1}[copy.deepcopy(parse(expressions[0])).key()] == 1
+
+
+@pytest.mark.parametrize(
+    "expression,other",
+    [
+        ("$.a.b", "$.a.c"),
+        ("$.a.b", "$.a"),
+        ("$[@ = 1]", "$[@ = 1.0]"),
+        ("$[@ = 1]", "$[@ = true]"),
+        ("$[@ = 1]", '$[@ = "1"]'),
+        ("$[@.a > 1]", "$[@.a >= 1]"),
+        ("$[@.a > 1]", "$[(@.a > 1)]"),
+        ("$..a", "$..a[0]"),
+    ],
+)
+def test_expr_key_differs(expression, other):
+    assert parse(expression).key() != parse(other).key()
+
+
+def test_expr_key_of_chained_before():
+    expr = Root().Name("a")
+    key = expr.key()
+    expr.Name("b")
+    assert expr.key() == key
+    assert Root().Search(Name("a"), max_depth=1).key() != Root().Search(Name("a")).key()
+
+
+def test_expr_interner():
+    interner = ExprInterner()
+    # walk down the interned nodes without narrowing their types
+    a: Any = interner.intern(parse("$.items[@.price > $.limit and @.tags[*] = $.tag]"))
+    b: Any = interner.intern(parse("$.items[@.price>$.limit and @.tags[*]=$.tag].name"))
+    assert b.left is not a
+    assert a.expr.target is b.left.expr.target
+    assert a.expr.left.target is b.left.expr.left.target
+    assert type(a.expr.left.left.name) is str
+    assert a.expr.left.left.name is b.left.expr.left.left.name
+
+    data = {"limit": 1, "tag": "x", "items": [{"price": 2, "tags": ["x"], "name": 1}]}
+    assert a.find(data) == data["items"]
+    assert b.find(data) == [1]
+    assert a.get_expression() == "$.items[@.price > $.limit and @.tags[*] = $.tag]"
+    assert interner.intern(parse("$.items[@.price > $.limit and @.tags[*]=$.tag]")) is a
+
+    count = len(interner)
+    del a, b
+    assert len(interner) < count
+    interner.clear()
+    assert len(interner) == 0
+
+
+def test_expr_interner_keeps_unchanged_expr():
+    interner = ExprInterner()
+    expr = Root().Predicate(Self() > Root().Name("limit"))
+    assert interner.intern(expr) is expr
+    # the part chained before another one is created again
+    expr = Root().Name("a")
+    expr.Name("b")
+    interned = interner.intern(expr)
+    assert interned is not expr
+    assert interned.get_next() is None
+    assert interned.find({"a": {"b": 1}}) == [{"b": 1}]
+
+
+def test_expr_interner_chaining():
+    interner = ExprInterner()
+    a: Any = interner.intern(parse("$.items[@.price > $.limit]", cached=False))
+    b: Any = interner.intern(parse("$.others[@.price > $.limit]", cached=False))
+    limit = a.expr.target
+    assert limit is b.expr.target
+    assert limit.frozen
+    # chaining onto the shared nodes copies them first
+    assert limit.Name("x").get_expression() == "$.limit.x"
+    assert limit.get_next() is None
+    assert a.Name("x").get_expression() == "$.items[@.price > $.limit].x"
+    assert a.get_next() is None
+    assert b.get_expression() == "$.others[@.price > $.limit]"
+    data = {"limit": 1, "items": [{"price": 2}], "others": [{"price": 0}]}
+    assert a.find(data) == [{"price": 2}]
+    assert b.find(data) == []
+    assert interner.intern(parse("$.items[@.price > $.limit]", cached=False)) is a
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_expr_interner_fuzz(seed):
+    interner = ExprInterner()
+    generator = ExpressionGenerator(seed)
+    interned = []
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False, backend="native")
+        except JSONPathError:
+            continue
+
+        rv = interner.intern(expr)
+        interned.append(rv)
+        assert rv.key() == expr.key()
+        assert rv.get_expression() == expr.get_expression()
+        assert interner.intern(parse(expression, cached=False, backend="native")) is rv
+        for data in DOCUMENTS:
+            assert _outcome(rv.find, data) == _outcome(expr.find, data)
+
+
+def _locate(data, path):
+    for key in path:
+        data = data[key]
+
+    return data
+
+
+@pytest.mark.parametrize(
+    "expression,data,expect",
+    [
+        ("$", [1], [((), [1])]),
+        ("$.a.b", {"a": {"b": 1}}, [(("a", "b"), 1)]),
+        ("$.*", {"a": 1, "b": 2}, [(("a",), 1), (("b",), 2)]),
+        ("$[*].a", [{"a": 1}, {}, {"a": 2}], [((0, "a"), 1), ((2, "a"), 2)]),
+        ("$[-1]", [1, 2, 3], [((2,), 3)]),
+        ("$[-4]", [1, 2, 3], []),
+        ("$[1:]", [1, 2, 3], [((1,), 2), ((2,), 3)]),
+        ("$[-1:0:-1]", [1, 2, 3], [((2,), 3), ((1,), 2)]),
+        ("$[@ > 1]", [1, 2, 3], [((1,), 2), ((2,), 3)]),
+        ("$[@ > 1]", {"a": 1, "b": 2}, [(("b",), 2)]),
+        ("$.a[key() = $.k]", {"a": {"x": 1, "y": 2}, "k": "y"}, [(("a", "y"), 2)]),
+        (
+            "$..a",
+            {"a": {"a": 1}, "b": [{"a": 2}]},
+            [(("a",), {"a": 1}), (("a", "a"), 1), (("b", 0, "a"), 2)],
+        ),
+        (
+            "$..[@.a = 1]",
+            {"a": 1, "b": [{"a": 1}, {"a": 2}]},
+            [((), {"a": 1, "b": [{"a": 1}, {"a": 2}]}), (("b", 0), {"a": 1})],
+        ),
+        ("$.a[$.b.c:]", {"a": [1, 2], "b": {"c": 1}}, [(("a", 1), 2)]),
+    ],
+)
+def test_find_with_paths(expression, data, expect):
+    expr = parse(expression, cached=False)
+    assert expr.find_with_paths(data) == expect
+    assert list(expr.find_iter_with_paths(data)) == expect
+    assert expr.compile().find_with_paths(data) == expect
+    assert expr.find_with_paths(data, limit=1, offset=1) == expect[1:2]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        Root().Name("a").Equal(1),
+        Brace(Root().Name("a")).Array(0),
+        Root().Name("a").Array().Name("b").Predicate(Self() == 1).Value(1),
+        Root().Search(Key()),
+    ],
+)
+def test_find_with_paths_not_located(expr):
+    with pytest.raises(JSONPathError):
+        expr.find_with_paths({"a": [{"b": [1]}]})
+
+
+def test_find_with_paths_bound_expr():
+    expr = parse("$[@.a = $a].b", cached=False).bind(a=1)
+    data = [{"a": 2, "b": 0}, {"a": 1, "b": 1}]
+    assert expr.find_with_paths(data) == [((1, "b"), 1)]
+    assert list(expr.find_iter_with_paths(data)) == [((1, "b"), 1)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_with_paths_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False, backend="native")
+        except JSONPathError:
+            continue
+
+        for data in DOCUMENTS:
+            kind, rv = _outcome(expr.find_with_paths, data)
+            if kind == "raise":
+                continue
+
+            assert [value for _, value in rv] == expr.find(data)
+            for path, value in rv:
+                assert _locate(data, path) is value
+
+
+@pytest.mark.parametrize(
+    "expression,data,value,expect",
+    [
+        ("$.a", {"a": 1, "b": 2}, 0, {"a": 0, "b": 2}),
+        ("$.*", {"a": 1, "b": 2}, 0, {"a": 0, "b": 0}),
+        ("$[-1]", [1, 2, 3], 0, [1, 2, 0]),
+        ("$[1:]", [1, 2, 3], 0, [1, 0, 0]),
+        ("$[@ > 1]", [1, 2, 3], lambda v: -v, [1, -2, -3]),
+        ("$..password", {"password": 1, "u": [{"password": 2}]}, "***", None),
+        ("$", [1], 0, 0),
+        ("$.missing", {"a": 1}, 0, {"a": 1}),
+    ],
+)
+def test_update(expression, data, value, expect):
+    if expect is None:
+        expect = {"password": "***", "u": [{"password": "***"}]}
+    expr = parse(expression, cached=False)
+    assert expr.update(copy.deepcopy(data), value) == expect
+    assert expr.compile().update(copy.deepcopy(data), value) == expect
+
+
+def test_update_in_place():
+    data = {"a": [{"b": 1}, {"b": 2}]}
+    inner = data["a"]
+    assert parse("$.a[*].b").update(data, 0) is data
+    assert inner == [{"b": 0}, {"b": 0}]
+
+
+def test_transform_inner_first():
+    data = {"a": {"a": {"a": 1}}}
+    seen = []
+
+    def wrap(value):
+        seen.append(copy.deepcopy(value))
+        return [value]
+
+    assert parse("$..a").transform(data, wrap) == {"a": [{"a": [{"a": [1]}]}]}
+    assert seen == [1, {"a": [1]}, {"a": [{"a": [1]}]}]
+
+
+@pytest.mark.parametrize(
+    "expression,data,expect",
+    [
+        ("$.a", {"a": 1, "b": 2}, {"b": 2}),
+        ("$[*]", [1, 2, 3], []),
+        ("$[@ > 1]", [3, 1, 2, 1, 4], [1, 1]),
+        ("$[-1:0:-2]", [0, 1, 2, 3, 4], [0, 1, 3]),
+        ("$[@ > 1]", {"a": 1, "b": 2, "c": 3}, {"a": 1}),
+        ("$..[@.secret]", {"a": [{"secret": 1}, {}, {"b": [{"secret": 2}]}]}, None),
+        ("$..a", {"a": {"a": 1}, "b": [{"a": 2}, 1]}, {"b": [{}, 1]}),
+        ("$.missing", {"a": 1}, {"a": 1}),
+    ],
+)
+def test_delete(expression, data, expect):
+    if expect is None:
+        expect = {"a": [{}, {"b": []}]}
+    expr = parse(expression, cached=False)
+    assert expr.delete(copy.deepcopy(data)) == expect
+    assert expr.bind().delete(copy.deepcopy(data)) == expect
+
+
+def test_delete_root():
+    data = {"a": 1}
+    with pytest.raises(JSONPathError):
+        parse("$").delete(data)
+    with pytest.raises(JSONPathError):
+        parse("$..[@.a = 1]").delete(data)
+    assert data == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "method,args",
+    [("update", (0,)), ("transform", (str,)), ("delete", ())],
+)
+def test_change_not_located(method, args):
+    data = {"a": [1, 2]}
+    expr = Root().Name("a").Array().GreaterThan(1)
+    with pytest.raises(JSONPathError):
+        getattr(expr, method)(data, *args)
+    assert data == {"a": [1, 2]}
+
+
+def test_change_bound_expr():
+    expr = parse("$[@.a = $a].b", cached=False).bind(a=1)
+    data = [{"a": 1, "b": 1}, {"a": 2, "b": 2}]
+    assert expr.update(data, 0) == [{"a": 1, "b": 0}, {"a": 2, "b": 2}]
+    assert expr.transform(data, str) == [{"a": 1, "b": "0"}, {"a": 2, "b": 2}]
+    assert expr.delete(data) == [{"a": 1}, {"a": 2, "b": 2}]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_change_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    marker = object()
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False, backend="native")
+        except JSONPathError:
+            continue
+
+        for data in DOCUMENTS:
+            kind, rv = _outcome(expr.find_with_paths, data)
+            if kind == "raise":
+                assert _outcome(expr.delete, copy.deepcopy(data))[0] == "raise"
+                continue
+
+            paths = [path for path, _ in rv]
+            if () in paths:
+                continue
+
+            expect = copy.deepcopy(data)
+            for path in reversed(paths):
+                _locate(expect, path[:-1])[path[-1]] = marker
+            assert expr.update(copy.deepcopy(data), marker) == expect
+
+            expect = copy.deepcopy(data)
+            for path in sorted(set(paths), reverse=True):
+                del _locate(expect, path[:-1])[path[-1]]
+            assert expr.delete(copy.deepcopy(data)) == expect
+
+
+def _walk(data):
+    yield data
+    if isinstance(data, dict):
+        data = data.values()
+    elif not isinstance(data, list):
+        return
+
+    for child in data:
+        yield from _walk(child)
+
+
+@pytest.mark.parametrize(
+    "expression,value",
+    [
+        ("$.a[*].b", 0),
+        ("$..b", lambda v: [v]),
+        ("$.a[1:]", "x"),
+        ("$..[@.b = 1]", lambda v: {**v, "c": 1}),
+        ("$", 0),
+        ("$.missing", 0),
+    ],
+)
+def test_updated(expression, value):
+    data = {"a": [{"b": 1, "x": {}}, {"b": {"b": 2}}, {"c": [1]}], "d": {"e": []}}
+    origin = copy.deepcopy(data)
+    expr = parse(expression, cached=False)
+    rv = expr.updated(data, value)
+    assert data == origin
+    assert rv == expr.update(copy.deepcopy(data), value)
+
+    # the untouched containers are shared, the changed ones are copied
+    shared = {id(element) for element in _walk(data)}
+    changed = {
+        id(element)
+        for location, _ in expr._find_locations_in_root(data)
+        for element in _get_containers(location)
+    }
+    for element in _walk(rv):
+        if isinstance(element, (dict, list)) and id(element) in shared:
+            assert id(element) not in changed
+    if not changed:
+        assert rv is data or expression == "$"
+
+
+def _get_containers(location):
+    while location is not None:
+        location, container, _ = location
+        yield container
+
+
+def test_updated_shared_element():
+    shared = {"b": 1}
+    data = {"x": [shared], "y": [shared]}
+    rv = parse("$..b").updated(data, 0)
+    assert rv == {"x": [{"b": 0}], "y": [{"b": 0}]}
+    assert shared == {"b": 1}
+
+
+def test_updated_bound_and_compiled_expr():
+    data = [{"a": 1, "b": 1}, {"a": 2, "b": 2}]
+    expr = parse("$[@.a = $a].b", cached=False)
+    assert expr.bind(a=1).updated(data, 0) == [{"a": 1, "b": 0}, {"a": 2, "b": 2}]
+    assert parse("$[*].b").compile().updated(data, 0)[1] == {"a": 2, "b": 0}
+    assert data == [{"a": 1, "b": 1}, {"a": 2, "b": 2}]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_updated_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    marker = object()
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False, backend="native")
+        except JSONPathError:
+            continue
+
+        for data in DOCUMENTS:
+            origin = copy.deepcopy(data)
+            expect = _outcome(expr.update, copy.deepcopy(data), marker)
+            assert _outcome(expr.updated, data, marker) == expect
+            assert data == origin
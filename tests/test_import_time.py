@@ -0,0 +1,92 @@
+# Standard Library
+import os
+import subprocess
+import sys
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.aot import generate_module
+
+LARK_MODULES = {
+    "lark",
+    "jsonpath.lark",
+    "jsonpath.lark_parser",
+    "jsonpath.transformer",
+}
+
+
+def import_time(code, tmp_path, backend="lark"):
+    """
+    Run the code in a fresh interpreter with "-X importtime",
+    returns the cumulative import time of every imported module.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env={**os.environ, "JSONPATH_PARSER": backend},
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rv = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            rv[name.strip()] = int(cumulative)
+
+    return rv
+
+
+@pytest.fixture
+def pythonpath(monkeypatch):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.setenv(
+        "PYTHONPATH", os.pathsep.join(filter(None, [root, os.getenv("PYTHONPATH")]))
+    )
+
+
+@pytest.mark.usefixtures("pythonpath")
+@pytest.mark.parametrize("backend", ["lark", "native"])
+def test_import_without_parser(tmp_path, backend):
+    modules = import_time(
+        "import jsonpath; jsonpath.Root().Name('a').find({'a': 1})",
+        tmp_path,
+        backend,
+    )
+    assert "jsonpath" in modules
+    assert "jsonpath.parser" not in modules
+    assert not LARK_MODULES & modules.keys(), modules
+
+
+@pytest.mark.usefixtures("pythonpath")
+@pytest.mark.parametrize("backend", ["lark", "native"])
+def test_import_parser_on_first_use(tmp_path, backend):
+    modules = import_time(
+        "import jsonpath; assert jsonpath.parse('$.a[@ > 1]').find({'a': [2]}) == [2]",
+        tmp_path,
+        backend,
+    )
+    assert "jsonpath.parser" in modules
+    if backend == "lark":
+        assert "jsonpath.lark" in modules
+        assert "jsonpath.transformer" in modules
+    else:
+        assert not LARK_MODULES & modules.keys(), modules
+
+
+@pytest.mark.usefixtures("pythonpath")
+def test_import_aot_module(tmp_path):
+    (tmp_path / "compiled_queries.py").write_text(
+        generate_module({"prices": "$.goods[@.price > 1].price"})
+    )
+    modules = import_time(
+        "import compiled_queries;"
+        "assert compiled_queries.prices.find({'goods': [{'price': 2}]}) == [2]",
+        tmp_path,
+    )
+    assert "compiled_queries" in modules
+    assert "jsonpath.parser" not in modules
+    assert not LARK_MODULES & modules.keys(), modules
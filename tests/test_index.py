@@ -0,0 +1,263 @@
+# Standard Library
+import copy
+import functools
+import json
+import random
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.core import JSONPathError, Name, Root, Self
+from jsonpath.index import DocumentIndex, ValueIndex
+from jsonpath.parser import parse
+
+# Local Folder
+from .test_compiler import DOCUMENTS, _outcome
+from .test_native import ExpressionGenerator
+
+DATA = {
+    "sku": 0,
+    "a": {"sku": 1, "b": [{"sku": 2}, {"c": {"sku": 3}}, [{"sku": 4}]]},
+    "d": [{"e": {"sku": 5}}, 1, "sku"],
+}
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$..sku",
+        "$.a..sku",
+        "$.a.b..sku",
+        "$.d[*]..sku",
+        "$..c..sku",
+        "$..missing",
+        "$[@..sku]",
+        "$.a.b[@..sku = 3]",
+        "$..sku[@ > 1]",
+    ],
+)
+def test_find_with_index(expression):
+    index = DocumentIndex(DATA)
+    expr = parse(expression, cached=False)
+    expect = expr.find(DATA)
+    assert expr.find(DATA, index=index) == expect
+    assert list(expr.find_iter(DATA, index=index)) == expect
+    assert expr.compile().find(DATA, index=index) == expect
+    assert list(expr.compile().find_iter(DATA, index=index)) == expect
+    assert expr.find(DATA, limit=2, offset=1, index=index) == expect[1:3]
+
+
+@pytest.mark.parametrize("max_depth", [0, 1, 2, 3])
+def test_search_max_depth_with_index(max_depth):
+    index = DocumentIndex(DATA)
+    expr = Root().Name("a").Search(Name("sku"), max_depth=max_depth)
+    assert expr.find(DATA, index=index) == expr.find(DATA)
+
+
+def test_search_not_indexed_element():
+    data = {"a": [{"sku": 1}]}
+    index = DocumentIndex(data)
+    # the brace creates the array not in the indexed data
+    expr = parse("($.a[*])..sku")
+    assert expr.find(data, index=index) == [1]
+    assert index.search_name([{"sku": 1}], "sku") is None
+
+
+def test_index_of_other_data():
+    index = DocumentIndex(DATA)
+    with pytest.raises(ValueError):
+        parse("$..sku").find(copy.deepcopy(DATA), index=index)
+
+
+def test_index_shared_container():
+    shared = {"sku": 1, "b": {"sku": 2}}
+    data = {"a": shared, "b": [shared], "c": {"sku": 3}}
+    index = DocumentIndex(data)
+    expr = parse("$..sku")
+    assert expr.find(data, index=index) == expr.find(data)
+    assert parse("$.b..sku").find(data, index=index) == [1, 2]
+    # the containers holding it twice are searched without the index
+    assert index.search_name(data, "sku") is None
+    assert index.search_name(data["b"], "sku") is None
+    assert list(index.search_name(shared, "sku") or ()) == [1, 2]
+    assert list(index.search_name(data["c"], "sku") or ()) == [3]
+
+
+@pytest.mark.parametrize("data", [1, "abc", None, [], {}])
+def test_index_scalar_and_empty_data(data):
+    index = DocumentIndex(data)
+    assert Root().Search(Name("a")).find(data, index=index) == []
+
+
+def test_bound_expr_with_index():
+    data = {"a": [{"sku": 1}, {"sku": 2}]}
+    index = DocumentIndex(data)
+    expr = parse("$.a[@.sku = $sku]..sku", cached=False).bind(sku=2)
+    assert expr.find(data, index=index) == [2]
+    assert list(expr.find_iter(data, index=index)) == [2]
+
+
+def test_search_name_without_index():
+    expr = Root().Search(Name("sku"))
+    assert expr.find(DATA) == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_index_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    indexes = [DocumentIndex(data) for data in DOCUMENTS]
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False, backend="native")
+        except JSONPathError:
+            continue
+
+        for data, index in zip(DOCUMENTS, indexes):
+            find = functools.partial(expr.find, index=index)
+            assert _outcome(find, data) == _outcome(expr.find, data)
+            assert _outcome(list, expr.find_iter(data, index=index)) == _outcome(
+                list, expr.find_iter(data)
+            )
+
+
+VALUES = [1, 1.0, True, 0, False, "1", None, [1], {"a": 1}, [], float("nan"), 2.5]
+
+
+def _unshare(data):
+    # the index rejects the shared containers, and the deep copy keeps them
+    return json.loads(json.dumps(data))
+
+
+RECORDS = _unshare(
+    {
+        "items": [
+            {"id": value, "a": {"b": value}, "n": idx % 3}
+            for idx, value in enumerate(VALUES * 2)
+        ]
+        + [{}, 1, [1], {"a": 1}, {"a": {"c": 1}}],
+        "scalars": VALUES * 2,
+        "targets": {"one": 1, "list": [1], "none": None},
+    }
+)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "$.items[@.id = 1]",
+        "$.items[id = 1.0]",
+        "$.items[@.id = true]",
+        '$.items[@.id = "1"]',
+        "$.items[@.id = null]",
+        "$.items[@.id = $.targets.one]",
+        "$.items[@.id = $.targets.list]",
+        "$.items[@.id = $.targets.none]",
+        "$.items[@.id = $.targets.missing]",
+        "$.items[@.a.b = 0]",
+        "$.items[a.b = 2.5].n",
+        "$.items[@.n = 1].id",
+        "$.scalars[@ = 1]",
+        "$.scalars[@ = $.targets.list]",
+        "$.items[@.id = 1 and @.n = 0]",
+        "$.items[@.id = @.a.b]",
+    ],
+)
+def test_value_index(expression):
+    expr = parse(expression, cached=False)
+    expect = expr.find(RECORDS)
+    index = DocumentIndex(RECORDS)
+    for field in ["@.id", "@.a.b", "a.b", "@.n", "@"]:
+        index.index_values("$.items", field)
+    index.index_values("$.scalars", "@")
+
+    assert expr.find(RECORDS, index=index) == expect
+    index.planner = False
+    assert expr.find(RECORDS, index=index) == expect
+
+
+def test_value_index_parameter():
+    expr = parse("$.items[@.id = $id]", cached=False)
+    index = DocumentIndex(RECORDS)
+    index.index_values("$.items", "@.id")
+    for value in VALUES:
+        expect = expr.bind(id=value).find(RECORDS)
+        assert expr.bind(id=value).find(RECORDS, index=index) == expect
+
+
+def _count_lookups(monkeypatch):
+    calls = []
+    lookup = ValueIndex.lookup
+
+    def wrapper(self, value):
+        calls.append(value)
+        return lookup(self, value)
+
+    monkeypatch.setattr(ValueIndex, "lookup", wrapper)
+    return calls
+
+
+def test_value_index_planner(monkeypatch):
+    calls = _count_lookups(monkeypatch)
+    data = {"users": [{"id": i, "name": str(i)} for i in range(10)], "id": 3}
+    index = DocumentIndex(data)
+    index.index_values("$.users", "@.id")
+
+    assert parse("$.users[@.id = $.id].name").find(data, index=index) == ["3"]
+    assert calls == [3]
+
+    # the compared value depends on the item, or the field is not indexed
+    assert parse("$.users[@.id = @.id].name").find(data, index=index) == [
+        str(i) for i in range(10)
+    ]
+    assert parse('$.users[@.name = "3"].id').find(data, index=index) == [3]
+    assert parse("$.users[@.id > 8].id").find(data, index=index) == [9]
+    assert calls == [3]
+
+    index.planner = False
+    assert parse("$.users[@.id = 3].name").find(data, index=index) == ["3"]
+    assert calls == [3]
+    assert DocumentIndex(data, planner=False).planner is False
+
+
+@pytest.mark.parametrize(
+    "field", ["$.id", "@.id[0]", "@[@.id = 1]", "@.*", Self().Name("id") == 1]
+)
+def test_index_values_invalid_field(field):
+    index = DocumentIndex(RECORDS)
+    with pytest.raises(ValueError):
+        index.index_values("$.items", field)
+
+
+def test_index_values_of_expr():
+    index = DocumentIndex(RECORDS)
+    index.index_values(Root().Name("items"), Name("a").Name("b"))
+    assert index.get_value_index(RECORDS["items"], ("a", "b")) is not None
+    assert index.get_value_index(RECORDS["items"], ("a",)) is None
+    assert index.get_value_index(RECORDS["scalars"], ("a", "b")) is None
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_value_index_fuzz(seed):
+    rnd = random.Random(seed)
+    values = [0, 1, 2, "a", "b", None, True, 1.0, [1], {}]
+    data = _unshare(
+        {
+            "items": [
+                (
+                    {"x": rnd.choice(values), "y": {"z": rnd.choice(values)}}
+                    if rnd.random() < 0.9
+                    else rnd.choice(values)
+                )
+                for _ in range(200)
+            ],
+        }
+    )
+    index = DocumentIndex(data)
+    index.index_values("$.items", "@.x")
+    index.index_values("$.items", "@.y.z")
+    for value in values:
+        for field in ["@.x", "@.y.z"]:
+            expr = parse(f"$.items[{field} = $value]", cached=False).bind(value=value)
+            assert expr.find(data, index=index) == expr.find(data)
@@ -1,16 +1,22 @@
 # Standard Library
 import json
 import logging
+import reprlib
 
-from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext, suppress
 
 # Third Party Library
 import pytest
 
 # First Party Library
-from jsonpath.core import JSONPathSyntaxError, JSONPathUndefinedFunctionError
+from jsonpath.core import (
+    JSONPathSyntaxError,
+    JSONPathUndefinedFunctionError,
+    Root,
+)
 from jsonpath.lark import Lark, UnexpectedToken
-from jsonpath.parser import parse, parser
+from jsonpath.parser import CacheInfo, ExprCache, parse, parser
 
 # Local Folder
 from .utils import assert_find
@@ -525,3 +531,147 @@ def test_syntax_error(expression):
 def test_undefined_function_error():
     with pytest.raises(JSONPathUndefinedFunctionError):
         parse("$[abc(@)]")
+
+
+@pytest.fixture
+def expr_cache(monkeypatch):
+    # First Party Library
+    import jsonpath.parser
+
+    cache = ExprCache(maxsize=2)
+    monkeypatch.setattr(jsonpath.parser, "cache", cache)
+    return cache
+
+
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        ["$.a", " $.a ", "$ .a", "$.a\t"],
+        ["$[@ < 1]", "$[@<1]", "$[ @ <1 ]"],
+        ["$[a and b]", "$[a  and\tb]"],
+        ["$[name = 'a']", '$[name="a"]', "$[name=`a`]"],
+        ["$.'a b'", '$."a b"'],
+        ['$[contains(@, "a")]', '$[contains( @ , "a" )]'],
+    ],
+    ids=reprlib.repr,
+)
+def test_cache_equivalent_spellings(expr_cache, expressions):
+    jp = parse(expressions[0])
+    for expression in expressions[1:]:
+        assert parse(expression) is jp
+
+    assert expr_cache.info() == CacheInfo(
+        hits=len(expressions) - 1, misses=1, evictions=0, maxsize=2, currsize=1
+    )
+
+
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        ["$[a and b]", "$[aandb]"],
+        ["$[@ <= 1]", "$[@ < = 1]"],
+        ["$[@ = -1]", "$[@ = - 1]"],
+        ["$..a", "$. .a"],
+        ["$.'a b'", "$.'ab'"],
+    ],
+    ids=reprlib.repr,
+)
+def test_cache_different_spellings(expr_cache, expressions):
+    for expression in expressions:
+        with suppress(Exception):
+            parse(expression)
+
+    assert expr_cache.info().misses == len(expressions)
+
+
+def test_cache_syntax_error(expr_cache):
+    with pytest.raises(JSONPathSyntaxError) as exc_info:
+        parse("$*")
+
+    assert exc_info.value.expr == "$*"
+    with pytest.raises(JSONPathSyntaxError) as exc_info:
+        parse(" $* ")
+
+    assert exc_info.value.expr == " $* "
+    assert isinstance(exc_info.value.__cause__, UnexpectedToken)
+
+    for _ in range(2):
+        with pytest.raises(JSONPathUndefinedFunctionError):
+            parse("$[abc(@)]")
+
+    assert expr_cache.info() == CacheInfo(
+        hits=2, misses=2, evictions=0, maxsize=2, currsize=2
+    )
+
+
+def test_cache_eviction(expr_cache):
+    a = parse("a")
+    parse("b")
+    assert parse("a") is a
+    parse("c")  # evicts "b"
+    assert parse("a") is a
+    assert expr_cache.info() == CacheInfo(
+        hits=2, misses=3, evictions=1, maxsize=2, currsize=2
+    )
+    parse("b")
+    assert expr_cache.info().evictions == 2
+
+    expr_cache.resize(1)
+    assert expr_cache.info() == CacheInfo(
+        hits=2, misses=4, evictions=3, maxsize=1, currsize=1
+    )
+    assert parse("b") is parse("b")
+
+    expr_cache.resize(0)
+    assert parse("b") is not parse("b")
+    assert len(expr_cache) == 0
+
+    expr_cache.resize(2)
+    parse("b")
+    expr_cache.clear()
+    assert expr_cache.info() == CacheInfo(
+        hits=0, misses=0, evictions=0, maxsize=2, currsize=0
+    )
+
+    with pytest.raises(ValueError):
+        expr_cache.resize(-1)
+
+
+def test_cache_chaining(expr_cache):
+    expr = parse("$.a")
+    assert expr.frozen
+    assert expr.Name("b").get_expression() == "$.a.b"
+    assert parse("$.a") is expr
+    assert expr.get_expression() == "$.a"
+    assert expr.find({"a": {"b": 1}}) == [{"b": 1}]
+
+    assert (parse("@.x") > 1).get_expression() == "@.x > 1"
+    assert parse("@.x").get_expression() == "@.x"
+    data = [{"x": 2}, {"x": 0}]
+    assert parse("$").Predicate(parse("@.x") > 1).find(data) == [{"x": 2}]
+    assert parse("$").get_expression() == "$"
+    self_expr = parse("@")
+    assert Root().chain(self_expr) is not self_expr
+    assert self_expr.left is None and self_expr.ref_begin is None
+    assert expr_cache.info().hits == 4
+
+
+def test_cache_disabled(expr_cache):
+    assert parse("a", cached=False) is not parse("a", cached=False)
+    assert expr_cache.info().currsize == 0
+
+
+def test_cache_thread_safety(expr_cache):
+    expressions = [f"$.a{i}[@ > {i}]" for i in range(10)]
+    expr_cache.resize(5)
+
+    def worker(idx):
+        for expression in expressions[idx:] + expressions[:idx]:
+            assert parse(expression).get_expression() == expression
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(worker, range(len(expressions))))
+
+    info = expr_cache.info()
+    assert info.hits + info.misses == len(expressions) ** 2
+    assert info.currsize == 5
@@ -0,0 +1,346 @@
+# Standard Library
+import random
+import subprocess
+import sys
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.core import JSONPathSyntaxError, JSONPathUndefinedFunctionError
+from jsonpath.native import parse as native_parse
+from jsonpath.parser import ExprCache, lark_parse, parse
+
+# Local Folder
+from .test_compiler import EXPRESSIONS
+from .test_lark import (
+    parser_parse_not_raises_exception_testcases,
+    parser_parse_raises_exception_testcases,
+)
+from .utils import dump
+
+
+def outcome(parse_func, expression):
+    try:
+        return ("ok", dump(parse_func(expression)))
+    except JSONPathUndefinedFunctionError:
+        return ("undefined",)
+    except JSONPathSyntaxError:
+        return ("invalid",)
+
+
+def assert_equivalent(expression):
+    assert outcome(native_parse, expression) == outcome(
+        lark_parse, expression
+    ), expression
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        *parser_parse_not_raises_exception_testcases,
+        *parser_parse_raises_exception_testcases,
+        *EXPRESSIONS,
+        # keywords
+        "and",
+        "$.and",
+        "$[and]",
+        "$[a and b or c and d]",
+        "$[a andy]",
+        "$[a orb]",
+        "$[1and 2]",
+        "$[aand b]",
+        "$[@and b]",
+        "$[a and$]",
+        "$[a and(b)]",
+        "true",
+        "true.a",
+        "$.true",
+        "$[true]",
+        "$[false]",
+        "$[null]",
+        "$[a.true]",
+        "$[TRUE]",
+        "$[nulls]",
+        "$[null.a]",
+        "$[null[0]]",
+        "$[true()]",
+        # numbers
+        "1.a",
+        "1 .a",
+        "1..a",
+        "1[0]",
+        "$[1.a]",
+        "$[+1]",
+        "$[-0]",
+        "$[-a]",
+        "$[- 1]",
+        "$[1e3]",
+        "$[1E+2]",
+        "$[1.5]",
+        "$[1.]",
+        "$[.5]",
+        "$[1.5e3]",
+        "$[1.e3]",
+        "$[.5e1]",
+        "$[1e3.5]",
+        "$.5",
+        "a.1",
+        "$[a=-1]",
+        # strings
+        '"a".b',
+        '"a"[0]',
+        "$.`x`",
+        '$.."a"',
+        "$['a\\'b']",
+        "$[a=`x`]",
+        '$["a"]',
+        # functions
+        "key()",
+        "key ()",
+        "key( )",
+        "key()[0]",
+        "key().a",
+        "foo()",
+        "foo(1)",
+        "foo(key(1))",
+        "foo(1e3)",
+        "contains(1e3, foo())",
+        "contains(a,1)",
+        "contains(a,b,c)",
+        "contains(a)",
+        "contains(a,)",
+        "key(1)",
+        "not(a)",
+        "not (a)",
+        "not(a,b)",
+        "a.b.c()",
+        "$[a (b)]",
+        "$[a.b(c)]",
+        "foo() b",
+        # paths
+        "(a)",
+        "($)",
+        "(a).b",
+        "$[(1)]",
+        "$[()]",
+        "$ [0]",
+        "$[0 ]",
+        "$ . a",
+        "$ ..a",
+        "$.. a",
+        "$..[ 0]",
+        "$. .a",
+        "$...a",
+        "$..*",
+        "$a",
+        "$[a]b",
+        "$[a,b]",
+        "$[a b]",
+        "$[a=b=c]",
+        "$[a<b<c]",
+        "$[a<=1]",
+        "$[a< =1]",
+        "$[1 2]",
+        "$[*a]",
+        "$[*:]",
+        "$[]",
+        # slices
+        "$[::]",
+        "$[ : ]",
+        "$[:2:]",
+        "$[::1]",
+        "$[1:2:3:4]",
+        "$[-1:]",
+        "$[a and b:c]",
+        # parameters
+        "$[@ = $a]",
+        "$[$a:$b:$c]",
+        "$a.b",
+        "$a[0]",
+        "$[$ a]",
+        "$$a",
+        "$[$1]",
+        "$[contains($a, @)]",
+        # whitespaces
+        "",
+        " ",
+        "\t$.a\t",
+        "$.a\n",
+        "$[ a  and\tb ]",
+    ],
+)
+def test_native_parse(expression):
+    assert_equivalent(expression)
+
+
+KEYWORDS = ["and", "or", "true", "false", "null", "key", "contains", "not"]
+NAMES = ["a", "b", "boo", "_", "a1", "A", "andy", "orb", "nulls", *KEYWORDS]
+NUMBERS = ["0", "1", "-1", "+2", "10", "1.5", ".5", "1.", "-0.5", "1.5e3", "1e3"]
+STRINGS = ['"a"', "'b'", "`c`", "'*'", '""', "'a b'", '"\\""']
+OPERATORS = ["<", "<=", "=", ">=", ">", "!="]
+PARAMETERS = ["$a", "$and", "$_1"]
+NOISE = list("$@.[]()*:,'\"`=<>!-+ 0123456789abe_") + KEYWORDS
+
+
+class ExpressionGenerator:
+    """
+    Generate random expressions by the rules of the grammar.lark,
+    and mutate some of them into invalid ones.
+    """
+
+    def __init__(self, seed):
+        self.rnd = random.Random(seed)
+
+    def ws(self):
+        return self.rnd.choice(["", "", "", "", " ", "  ", "\t"])
+
+    def start(self):
+        if self.rnd.random() < 0.1:
+            return self.func_call(3)
+
+        return self.ws() + self.path(3) + self.ws()
+
+    def path(self, depth):
+        if depth <= 0 or self.rnd.random() < 0.3:
+            return self.rnd.choice(["$", "@", *NAMES])
+
+        return self.atom(depth - 1) + self.ws() + self.action(depth - 1)
+
+    def action(self, depth):
+        choice = self.rnd.random()
+        if choice < 0.3:
+            return "." + self.ws() + self.rnd.choice([*NAMES, *STRINGS, "*"])
+        elif choice < 0.45:
+            return ".." + self.ws() + self.rnd.choice([*NAMES, *STRINGS])
+        elif choice < 0.55:
+            return ".." + self.ws() + self.predicate(depth)
+
+        return self.predicate(depth)
+
+    def predicate(self, depth):
+        choice = self.rnd.random()
+        if choice < 0.1:
+            body = "*"
+        elif choice < 0.35:
+            body = self.slice(depth)
+        else:
+            body = self.expr(depth)
+
+        return "[" + self.ws() + body + self.ws() + "]"
+
+    def slice(self, depth):
+        fields = [
+            self.expr(depth) if self.rnd.random() < 0.6 else ""
+            for _ in range(self.rnd.choice([2, 3]))
+        ]
+        return (self.ws() + ":" + self.ws()).join(fields)
+
+    def expr(self, depth):
+        rv = self.comparison(depth)
+        for _ in range(self.rnd.choice([0, 0, 0, 1, 2])):
+            operator = self.rnd.choice(["and", "or"])
+            rv += self.rnd.choice([" ", self.ws()]) + operator + self.ws()
+            rv += self.comparison(depth)
+
+        return rv
+
+    def comparison(self, depth):
+        if self.rnd.random() < 0.3:
+            return (
+                self.atom(depth)
+                + self.ws()
+                + self.rnd.choice(OPERATORS)
+                + self.ws()
+                + self.atom(depth)
+            )
+
+        return self.atom(depth)
+
+    def atom(self, depth):
+        choice = self.rnd.random()
+        if depth <= 0 or choice < 0.25:
+            return self.rnd.choice(
+                [*NUMBERS, *STRINGS, *PARAMETERS, "true", "false", "null"]
+            )
+        elif choice < 0.7:
+            return self.path(depth - 1)
+        elif choice < 0.85:
+            return self.func_call(depth - 1)
+
+        return "(" + self.ws() + self.expr(depth - 1) + self.ws() + ")"
+
+    def func_call(self, depth):
+        name = self.rnd.choice(["key", "key", "contains", "not", "foo", "a"])
+        if self.rnd.random() < 0.3:
+            return name + self.ws() + "()"
+
+        args = (self.ws() + "," + self.ws()).join(
+            self.expr(depth) for _ in range(self.rnd.randint(1, 3))
+        )
+        return name + self.ws() + "(" + self.ws() + args + self.ws() + ")"
+
+    def mutate(self, expression):
+        pos = self.rnd.randint(0, len(expression))
+        choice = self.rnd.random()
+        if choice < 0.4:
+            return expression[:pos] + expression[pos + 1 :]
+        elif choice < 0.8:
+            return expression[:pos] + self.rnd.choice(NOISE) + expression[pos:]
+
+        return expression[:pos] + expression[pos:][::-1]
+
+    def generate(self):
+        expression = self.start()
+        while self.rnd.random() < 0.3:
+            expression = self.mutate(expression)
+
+        return expression
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_native_parse_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    for _ in range(300):
+        assert_equivalent(generator.generate())
+
+
+def test_parse_backend(monkeypatch):
+    # First Party Library
+    import jsonpath.parser
+
+    monkeypatch.setattr(jsonpath.parser, "cache", ExprCache())
+    lark_expr = parse("$.a[@ > 1]", backend="lark")
+    native_expr = parse("$.a[@ > 1]", backend="native")
+    assert lark_expr is not native_expr
+    assert dump(lark_expr) == dump(native_expr)
+    assert parse("$.a[@ > 1]", backend="native") is native_expr
+    assert parse("$.a[@ > 1]") is lark_expr
+    assert jsonpath.parser.cache.info().currsize == 2
+
+    monkeypatch.setattr(jsonpath.parser, "DEFAULT_BACKEND", "native")
+    assert parse("$.a[@ > 1]") is native_expr
+
+    for backend in ("lark", "native"):
+        # the invalid tokens, the invalid characters and the invalid literals
+        for expression in ("$*", "$[#]", "$[1e3]"):
+            with pytest.raises(JSONPathSyntaxError):
+                parse(expression, backend=backend)
+
+    with pytest.raises(ValueError):
+        parse("$.a", backend="unknown")
+
+
+def test_parse_backend_from_environment_variable():
+    code = (
+        "from jsonpath.parser import DEFAULT_BACKEND, parse;"
+        "print(DEFAULT_BACKEND, parse('$[a > 1]').find([{'a': 2}]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        env={"JSONPATH_PARSER": "native"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert proc.stdout == "native [{'a': 2}]\n"
@@ -0,0 +1,252 @@
+# Standard Library
+import pickle
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.core import (
+    Brace,
+    Contains,
+    Expr,
+    JSONPathError,
+    Name,
+    NamePath,
+    Not,
+    Predicate,
+    Root,
+    Self,
+    Value,
+    legacy_find,
+)
+from jsonpath.optimizer import optimize_expr
+from jsonpath.parser import ExprCache, parse
+
+# Local Folder
+from .test_compiler import DOCUMENTS, EXPRESSIONS, _outcome
+from .test_native import ExpressionGenerator
+from .utils import dump
+
+
+def assert_equivalent(expr, optimized):
+    try:
+        reparsed = parse(expr.get_expression(), cached=False, backend="native")
+    except JSONPathError:
+        # the printed expression is not always valid, e.g., "1 < 2"
+        reparsed = None
+    else:
+        reparsed_optimized = parse(
+            optimized.get_expression(), cached=False, backend="native"
+        )
+
+    compiled = optimized.compile()
+    for data in DOCUMENTS:
+        expect = _outcome(expr.find, data)
+        assert _outcome(optimized.find, data) == expect, data
+        if reparsed is not None:
+            assert _outcome(reparsed_optimized.find, data) == _outcome(
+                reparsed.find, data
+            ), data
+
+        rv = _outcome(compiled.find, data)
+        # the compiled operands stop finding at their first result,
+        # so the errors of the rest results may not be raised.
+        assert rv == expect or expect[0] == "raise" and rv[0] == "ok", data
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_optimize_parsed_expression(expression):
+    expr = parse(expression, cached=False)
+    assert_equivalent(expr, optimize_expr(expr))
+
+
+@pytest.mark.parametrize(
+    "expression,expect",
+    [
+        ("$.a.b.c", "$.a.b.c"),
+        ("$[@.a = 1 and 1 < 2]", "$[@.a = 1 and true]"),
+        ("$[@.a = 1 and 2 < 1]", "$[@.a = 1 and false]"),
+        ('$[false and @.a = 1 or contains(@, "b")]', '$[false or contains(@, "b")]'),
+        ('$[a or contains("abc", "b")]', "$[a or true]"),
+        ("$[a and not(1 = 1)]", "$[a and false]"),
+        ("$[not(not(a))]", "$[a]"),
+        ("$[not(not(not(a)))]", "$[not(a)]"),
+        ("$[not(not(not(not(a.b))))]", "$[a.b]"),
+        ("$[not(not(a)) and b]", "$[a and b]"),
+        ("$[a and not(not(b)) or c]", "$[a and b or c]"),
+        ("($[@ < 100])[@ >= 50]", "$[@ < 100 and @ >= 50]"),
+        ("($.a[@ < 100])[@ >= 50].b", "$.a[@ < 100 and @ >= 50].b"),
+        ("($[a and b])[c and d]", "$[a and b and c and d]"),
+        ("(($[@ < 100])[@ > 50])[@ < 90]", "$[@ < 100 and @ > 50 and @ < 90]"),
+        ("$[(($[@ < 100])[@ > 50])[0]]", "$[($[@ < 100 and @ > 50])[0]]"),
+    ],
+)
+def test_rewritten_expression(expression, expect):
+    expr = parse(expression, cached=False)
+    optimized = optimize_expr(expr)
+    assert optimized.get_expression() == expect
+    assert_equivalent(expr, optimized)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        # the comparison finds its target in the item of the predicate
+        "(1 < 2)[0]",
+        # "$[true]" is parsed as "$[1]"
+        "$[1 < 2]",
+        "$[not(0)]",
+        # "not(a)" results in the boolean value instead of the value of "a"
+        "$[b = not(not(a))]",
+        "not(not(a))",
+        "$[not(not(a)).b]",
+        # the key of the item found by the brace is its index
+        "($[@ < 100])[key() = 0]",
+        # "a or b and c" is parsed as "a or (b and c)"
+        "($[a or b])[c]",
+        "($[a])[b or c]",
+        # the slice finds its fields in the parent
+        "($[@ < 100])[@ > 1][$.a:]",
+        "$..[0]",
+        "$.a.*.b",
+    ],
+)
+def test_not_rewritten_expression(expression):
+    expr = parse(expression, cached=False)
+    optimized = optimize_expr(expr)
+    assert dump(optimized) == dump(expr)
+    assert_equivalent(expr, optimized)
+
+
+def test_collapse_names():
+    expr = parse("$.a.b.c[@.d.e > 1].f.g[$.x.y:]", cached=False)
+    optimized = optimize_expr(expr)
+    assert optimized.get_expression() == expr.get_expression()
+    assert [type(node).__name__ for node in _get_chain(optimized)] == [
+        "Root",
+        "NamePath",
+        "Predicate",
+        "Name",
+        "Name",
+        "Array",
+    ]
+    predicate = _get_chain(optimized)[2]
+    assert [type(node).__name__ for node in _get_chain(predicate.expr)] == [
+        "Self",
+        "NamePath",
+        "GreaterThan",
+    ]
+    assert_equivalent(expr, optimized)
+
+    data = {"a": {"b": {"c": [{"d": {"e": 2}, "f": {"g": [0, 1, 2]}}]}}, "x": {"y": 1}}
+    assert optimized.find(data) == [1, 2]
+
+
+def _get_chain(expr):
+    nodes = []
+    node = expr.get_begin()
+    while node is not None:
+        nodes.append(node)
+        node = node.get_next()
+
+    return nodes
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        Root().Name("a").Name("b").Predicate(Not(Not(Self()))),
+        Root().Search(Name("a"), max_depth=1).Name("b").Name("c"),
+        Brace(Root().Predicate(Self() < 100)).Predicate(Self() >= 50),
+        Root().Predicate(Contains(Name("boo").Name("bar"), 1)),
+        Root().Predicate(Contains(Value("abc"), Value("b")).And(Name("a"))),
+        Root().Predicate(Value(1).LessThan(2).And(Name("a"))),
+        Value(1).LessThan(Value(2)),
+        Value(1).LessThan(2),
+    ],
+)
+def test_optimize_expr(expr):
+    assert_equivalent(expr, optimize_expr(expr))
+
+
+def test_optimize_user_defined_expr():
+    class Double(Expr):
+        def _get_partial_expression(self):
+            return "double()"
+
+        @legacy_find
+        def find(self, element):
+            return [element * 2]
+
+    expr = Root().Name("a").Name("b").Double()
+    assert optimize_expr(expr) is expr
+    expr = Root().Predicate(Double() > 1)
+    assert optimize_expr(expr) is expr
+
+
+def test_optimize_expr_method():
+    expr = Root().Name("a").Name("b")
+    optimized = expr.optimize()
+    assert isinstance(optimized, NamePath)
+    assert optimized.find({"a": {"b": 1}}) == [1]
+    assert dump(expr) == dump(Root().Name("a").Name("b"))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_optimize_fuzz(seed):
+    generator = ExpressionGenerator(seed)
+    for _ in range(100):
+        expression = generator.generate()
+        try:
+            expr = parse(expression, cached=False)
+        except Exception:
+            # the Lark backend raises its own exceptions for some invalid expressions
+            continue
+
+        assert_equivalent(expr, optimize_expr(expr))
+
+
+def test_parse_optimize(monkeypatch):
+    # First Party Library
+    import jsonpath.parser
+
+    monkeypatch.setattr(jsonpath.parser, "cache", ExprCache())
+    expr = parse("($[@ < 100])[@ >= 50]")
+    optimized = parse("($[@ < 100])[@ >= 50]", optimize=True)
+    assert isinstance(expr, Predicate) and isinstance(expr.left, Brace)
+    assert optimized.get_expression() == "$[@ < 100 and @ >= 50]"
+    assert parse("($[@<100])[@>=50]", optimize=True) is optimized
+    assert parse("($[@ < 100])[@ >= 50]") is expr
+    assert jsonpath.parser.cache.info().currsize == 2
+
+    native = parse("($[@ < 100])[@ >= 50]", backend="native", optimize=True)
+    assert dump(native) == dump(optimized)
+    assert parse("$.a.b", cached=False, optimize=True).find({"a": {"b": 1}}) == [1]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["$.a.b.c", "$.a.b[@.c.d > 1].e.f", "$..a.b", "$[$.a.b:].c.d", "a.b"],
+)
+def test_compile_name_path(expression):
+    expr = parse(expression, cached=False, optimize=True)
+    assert "_legacy" not in expr.compile().source
+    for data in DOCUMENTS + [{"a": {"b": {"c": [{"d": {"e": 2}}]}}}]:
+        assert _outcome(expr.compile().find, data) == _outcome(expr.find, data)
+
+
+def test_pickle_name_path():
+    expr = parse("$.a.b.c[@.d.e > 1]", optimize=True)
+    loaded = pickle.loads(pickle.dumps(expr))
+    assert dump(loaded) == dump(expr)
+    assert loaded.find({"a": {"b": {"c": [{"d": {"e": 2}}]}}}) == [{"d": {"e": 2}}]
+
+
+def test_name_path():
+    expr = Root().NamePath("a", "*", "@")
+    assert expr.get_expression() == "$.a.'*'.'@'"
+    assert expr.find({"a": {"*": {"@": 1}}}) == [1]
+    assert expr.find({"a": {"*": 1}}) == []
+    assert expr.compile().find({"a": {"*": {"@": 1}}}) == [1]
+    with pytest.raises(TypeError):
+        NamePath()
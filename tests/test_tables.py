@@ -0,0 +1,143 @@
+# Standard Library
+import pickle
+import zlib
+
+# Third Party Library
+import pytest
+
+# First Party Library
+from jsonpath.lark import Lark, lark_version
+from jsonpath.tables import GRAMMAR_PATH, dump_lark_tables, load_lark_tables
+
+# Local Folder
+from .test_lark import parser_parse_not_raises_exception_testcases
+
+pytest.importorskip("lark", reason="dumping the tables needs the Lark package")
+
+
+@pytest.fixture
+def grammar_path(tmp_path):
+    path = tmp_path / "grammar.lark"
+    with open(GRAMMAR_PATH, "rb") as f:
+        path.write_bytes(f.read())
+
+    return str(path)
+
+
+@pytest.fixture
+def tables_path(tmp_path, grammar_path):
+    path = str(tmp_path / "grammar.lalr")
+    dump_lark_tables(path, grammar_path)
+    return path
+
+
+def test_load_tables(tables_path, grammar_path):
+    parser = load_lark_tables(Lark, lark_version, tables_path, grammar_path)
+    assert parser is not None
+    expect_parser = Lark.open(GRAMMAR_PATH, parser="lalr", maybe_placeholders=True)
+    for expression in parser_parse_not_raises_exception_testcases:
+        assert parser.parse(expression) == expect_parser.parse(expression)
+
+
+def test_load_missing_tables(tmp_path, grammar_path):
+    tables_path = str(tmp_path / "missing.lalr")
+    assert load_lark_tables(Lark, lark_version, tables_path, grammar_path) is None
+
+
+def test_load_stale_tables(tables_path, grammar_path):
+    with open(grammar_path, "a") as f:
+        f.write("\n// changed\n")
+
+    assert load_lark_tables(Lark, lark_version, tables_path, grammar_path) is None
+
+
+def test_load_tables_of_other_version(tables_path, grammar_path):
+    assert load_lark_tables(Lark, "0.0.0", tables_path, grammar_path) is None
+
+
+def test_load_tables_with_globals(tables_path, grammar_path):
+    with open(tables_path, "wb") as f:
+        f.write(zlib.compress(pickle.dumps({"data": Lark})))
+
+    assert load_lark_tables(Lark, lark_version, tables_path, grammar_path) is None
+
+
+def _truncate(content):
+    return content[: len(content) // 2]
+
+
+def _truncate_pickle(content):
+    return zlib.compress(zlib.decompress(content)[:-10])
+
+
+def _corrupt(content):
+    return content[:100] + bytes(b ^ 0xFF for b in content[100:200]) + content[200:]
+
+
+def _drop_keys(content):
+    return zlib.compress(pickle.dumps({"lark_version": lark_version}))
+
+
+def _drop_data(content):
+    tables = pickle.loads(zlib.decompress(content))
+    tables["data"] = {}
+    return zlib.compress(pickle.dumps(tables))
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda content: b"",
+        _truncate,
+        _truncate_pickle,
+        _corrupt,
+        lambda content: zlib.compress(b"not a pickle"),
+        lambda content: zlib.compress(pickle.dumps([1, 2])),
+        _drop_keys,
+        _drop_data,
+    ],
+)
+def test_load_corrupt_tables(tables_path, grammar_path, damage):
+    with open(tables_path, "rb") as f:
+        content = f.read()
+
+    with open(tables_path, "wb") as f:
+        f.write(damage(content))
+
+    assert load_lark_tables(Lark, lark_version, tables_path, grammar_path) is None
+
+
+def test_lark_parser_from_tables(monkeypatch, tables_path, grammar_path):
+    # First Party Library
+    import jsonpath.parser
+    import jsonpath.tables
+
+    calls = []
+
+    def load(lark_cls, version):
+        rv = load_lark_tables(lark_cls, version, tables_path, grammar_path)
+        calls.append(rv)
+        return rv
+
+    monkeypatch.setattr(jsonpath.parser, "_lark", None)
+    monkeypatch.setattr(jsonpath.tables, "load_lark_tables", load)
+    expr = jsonpath.parser.parse("$.a[@ > 1]", cached=False, backend="lark")
+    assert expr.find({"a": [1, 2]}) == [2]
+    assert len(calls) == 1 and calls[0] is jsonpath.parser.parser
+
+
+def test_lark_parser_from_corrupt_tables(monkeypatch, tables_path, grammar_path):
+    # First Party Library
+    import jsonpath.parser
+    import jsonpath.tables
+
+    with open(tables_path, "wb") as f:
+        f.write(b"corrupt")
+
+    def load(lark_cls, version):
+        return load_lark_tables(lark_cls, version, tables_path, grammar_path)
+
+    monkeypatch.setattr(jsonpath.parser, "_lark", None)
+    monkeypatch.setattr(jsonpath.tables, "load_lark_tables", load)
+    expr = jsonpath.parser.parse("$.a[@ > 1]", cached=False, backend="lark")
+    assert expr.find({"a": [1, 2]}) == [2]
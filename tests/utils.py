@@ -16,3 +16,48 @@ def assert_find(jp: Expr, data: Any, expect: List[Any]):
             jp.find_first(data)
 
     assert expect == jp.find(data)
+
+
+def dump(expr):
+    """
+    Dump the structure of the whole chain, includes the types of the values.
+    """
+    rv = []
+    node = expr.get_begin()
+    while node is not None:
+        rv.append(
+            (type(node).__name__,)
+            + tuple(
+                (name, dump_value(value))
+                for name, value in sorted(get_attrs(node).items())
+                if name not in ("left", "ref_right", "ref_begin", "frozen")
+            )
+        )
+        node = node.get_next()
+
+    return tuple(rv)
+
+
+def get_attrs(node):
+    """
+    Get the attributes of the node, in the __slots__ or the __dict__.
+    """
+    attrs = dict(getattr(node, "__dict__", {}))
+    for cls in type(node).__mro__:
+        for name in cls.__dict__.get("__slots__", ()):
+            if name != "__weakref__" and hasattr(node, name):
+                attrs[name] = getattr(node, name)
+
+    return attrs
+
+
+def dump_value(value):
+    if isinstance(value, Expr):
+        return dump(value)
+    elif isinstance(value, (tuple, list)):
+        return tuple(map(dump_value, value))
+    elif isinstance(value, str):
+        # the Lark tokens are the subclass of str
+        return ("str", str(value))
+    else:
+        return (type(value).__name__, value)